@@ -0,0 +1,264 @@
+"""
+Audit Log Module - Append-Only Rotating Audit Logs
+
+Encryption and security events used to accumulate in unbounded in-memory
+lists, so process memory grew with every transmission. This module writes
+each event as one compact JSON line to an append-only file with size-based
+rotation, and keeps only the most recent events in memory.
+
+Key Features:
+- Append-only JSONL segments rotated at max_bytes (path, path.1, ... path.N)
+- In-memory ring buffer of the last ring_size records for the dashboard
+- Sparse (time, byte offset) index per segment for fast time-range queries,
+  rebuilt from the segment files when a log is reopened
+- One shared writer per file path, safe to use from several threads
+- Memory-only mode when no path is configured
+
+FILE FORMAT:
+- One record per line: {"t": <unix time>, "r": <event dict>}
+- datetime values are written as ISO 8601 strings
+"""
+
+import os                   # Segment rotation and directory handling
+import json                 # Compact JSONL records
+import time                 # Record timestamps
+import threading            # Writer locking and shared-instance registry
+from collections import deque  # Bounded ring buffer
+from datetime import datetime, date  # ISO serialization of timestamps
+
+# Directory for audit log files; disk logging is disabled when unset
+AUDIT_LOG_DIR = os.environ.get('QUANTUM_AUDIT_LOG_DIR')
+
+
+def _json_default(value):
+    """Serialize values json does not handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.hex()
+    if hasattr(value, 'item'):
+        return value.item()     # NumPy scalars
+    return str(value)
+
+
+class AuditLog:
+    """
+    Append-only audit log with rotation, ring buffer and time index
+
+    The object is list-like for the most recent records: append(), len(),
+    iteration and indexing all operate on the in-memory ring buffer, while
+    query() reads older records back from disk.
+
+    Attributes:
+        path: Active segment file (None for memory-only logs)
+        max_bytes: Segment size that triggers rotation
+        backup_count: Number of rotated segments kept
+        ring_size: Number of records kept in memory
+        index_interval: Records between two entries of the offset index
+        total_records: Records appended since the log was opened
+    """
+
+    def __init__(self, path=None, max_bytes=16 * 1024 * 1024, backup_count=5,
+                 ring_size=1000, index_interval=64):
+        """
+        Initialize the audit log
+
+        Args:
+            path (str): Active segment file, or None to keep records in memory only
+            max_bytes (int): Segment size that triggers rotation
+            backup_count (int): Number of rotated segments kept
+            ring_size (int): Number of records kept in memory
+            index_interval (int): Records between two offset index entries
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.ring_size = ring_size
+        self.index_interval = index_interval
+        self.total_records = 0
+
+        self._ring = deque(maxlen=ring_size)
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment_records = 0
+        # Sparse index per segment: segment number -> [(unix time, byte offset), ...]
+        self._index = {0: []}
+
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._load_index()
+            self._file = open(path, 'ab')
+
+    def append(self, record):
+        """
+        Append a record to the log
+
+        Args:
+            record (dict): Event to log
+        """
+        timestamp = time.time()
+        with self._lock:
+            self._ring.append(record)
+            self.total_records += 1
+            if self._file is None:
+                return
+
+            line = json.dumps({'t': timestamp, 'r': record}, separators=(',', ':'),
+                              default=_json_default).encode('utf-8') + b'\n'
+            offset = self._file.tell()
+            if offset + len(line) > self.max_bytes and offset > 0:
+                self._rotate()
+                offset = 0
+            if self._segment_records % self.index_interval == 0:
+                self._index[0].append((timestamp, offset))
+            self._file.write(line)
+            self._file.flush()
+            self._segment_records += 1
+
+    def query(self, start=None, end=None):
+        """
+        Read logged records whose append time lies in [start, end]
+
+        Args:
+            start (float): Unix time lower bound (None = unbounded)
+            end (float): Unix time upper bound (None = unbounded)
+
+        Returns:
+            list: Records in append order (from disk, or the ring buffer
+            for memory-only logs)
+        """
+        if self.path is None:
+            return list(self._ring)
+
+        with self._lock:
+            self._file.flush()
+            segments = sorted(self._index, reverse=True)     # Oldest segment first
+            seeks = {segment: self._seek_offset(segment, start) for segment in segments}
+
+        records = []
+        for segment in segments:
+            if seeks[segment] is None:
+                continue
+            try:
+                with open(self._segment_path(segment), 'rb') as segment_file:
+                    segment_file.seek(seeks[segment])
+                    for line in segment_file:
+                        entry = json.loads(line)
+                        if end is not None and entry['t'] > end:
+                            return records
+                        if start is None or entry['t'] >= start:
+                            records.append(entry['r'])
+            except FileNotFoundError:
+                continue
+        return records
+
+    def clear(self):
+        """Forget the in-memory records (logged files are append-only and kept)"""
+        with self._lock:
+            self._ring.clear()
+
+    def close(self):
+        """Close the active segment file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self):
+        return len(self._ring)
+
+    def __iter__(self):
+        return iter(list(self._ring))
+
+    def __getitem__(self, item):
+        return list(self._ring)[item]
+
+    def _seek_offset(self, segment, start):
+        """Byte offset to start reading a segment from, or None to skip it"""
+        entries = self._index.get(segment, [])
+        if not entries:
+            return 0
+        if start is None:
+            return 0
+        offset = 0
+        for indexed_time, indexed_offset in entries:
+            if indexed_time > start:
+                break
+            offset = indexed_offset
+        # Skip whole segments that end before the start of the range
+        next_segment_entries = self._index.get(segment - 1)
+        if next_segment_entries and next_segment_entries[0][0] < start:
+            return None
+        return offset
+
+    def _load_index(self):
+        """Rebuild the offset index from segments written by earlier processes"""
+        for segment in range(self.backup_count + 1):
+            entries = []
+            records = 0
+            try:
+                with open(self._segment_path(segment), 'rb') as segment_file:
+                    offset = 0
+                    for line in segment_file:
+                        # Only indexed lines are parsed; a torn last line is skipped
+                        if records % self.index_interval == 0 and line.endswith(b'\n'):
+                            entries.append((json.loads(line)['t'], offset))
+                        offset += len(line)
+                        records += 1
+            except FileNotFoundError:
+                if segment:
+                    continue
+            self._index[segment] = entries
+            if segment == 0:
+                self._segment_records = records
+
+    def _segment_path(self, segment):
+        """File name of a segment (0 is the active file)"""
+        return self.path if segment == 0 else f"{self.path}.{segment}"
+
+    def _rotate(self):
+        """Shift segments up by one and start a new active file (lock held)"""
+        self._file.close()
+        for segment in range(self.backup_count, 0, -1):
+            source = self._segment_path(segment - 1)
+            if os.path.exists(source):
+                os.replace(source, self._segment_path(segment))
+
+        self._index = {segment + 1: entries for segment, entries in self._index.items()
+                       if segment + 1 <= self.backup_count}
+        self._index[0] = []
+        self._segment_records = 0
+        # Without backups the active file was not moved away: start it over
+        self._file = open(self.path, 'ab' if self.backup_count else 'wb')
+
+
+# Shared writers, one per log file
+_audit_logs = {}
+_audit_logs_lock = threading.Lock()
+
+
+def get_audit_log(name, **settings):
+    """
+    Return the audit log for an event stream
+
+    When AUDIT_LOG_DIR is set, every caller asking for the same name shares
+    one writer for <AUDIT_LOG_DIR>/<name>.jsonl. Otherwise a new memory-only
+    log is returned.
+
+    Args:
+        name (str): Event stream name, e.g. 'encryption' or 'security'
+        **settings: AuditLog options used when the log is created
+
+    Returns:
+        AuditLog: Log for the stream
+    """
+    if AUDIT_LOG_DIR is None:
+        return AuditLog(None, **settings)
+
+    path = os.path.join(AUDIT_LOG_DIR, f"{name}.jsonl")
+    with _audit_logs_lock:
+        if path not in _audit_logs:
+            _audit_logs[path] = AuditLog(path, **settings)
+        return _audit_logs[path]
@@ -0,0 +1,109 @@
+"""
+Bit Buffer Module - Vectorized Bit and Byte Packing
+
+The QRNG, the cryptography engine and the text pipeline all convert
+between bit sequences and bytes. This module provides the one shared
+implementation, backed by np.packbits / np.unpackbits.
+
+Key Features:
+- Single bit order for the whole project (see BIT_ORDER)
+- Zero-copy views of bytes, bytearray and memoryview inputs
+- Zero padding of partial bytes when packing, optional truncation when unpacking
+- ASCII '0'/'1' bit strings (e.g. Aer per-shot memory) packed without Python loops
+- Vectorized XOR of whole byte buffers, optionally into a caller-supplied output
+
+BIT ORDER:
+- Bits are most significant first ('big'): the first bit of a sequence is
+  bit 7 of the first byte, so [1, 0, 0, 0, 0, 0, 0, 1] packs to 0x81
+"""
+
+import numpy as np          # Vectorized packing
+
+# Bit order used for every packing and unpacking operation
+BIT_ORDER = 'big'
+
+
+def as_byte_array(data):
+    """
+    View bytes-like data as a uint8 array without copying
+
+    Args:
+        data: bytes, bytearray, memoryview or uint8-compatible array
+
+    Returns:
+        np.ndarray: uint8 array sharing memory with data where possible
+    """
+    if isinstance(data, np.ndarray):
+        return data.astype(np.uint8, copy=False).reshape(-1)
+    try:
+        # Any buffer-protocol object (bytes, bytearray, memoryview, mmap)
+        return np.frombuffer(data, dtype=np.uint8)
+    except TypeError:
+        return np.asarray(data, dtype=np.uint8).reshape(-1)
+
+
+def pack_bits(bits):
+    """
+    Pack a bit sequence into bytes
+
+    Args:
+        bits: Sequence or array of 0/1 values. A trailing partial byte is
+            padded with zero bits
+
+    Returns:
+        np.ndarray: uint8 array with eight bits per byte
+    """
+    return np.packbits(np.asarray(bits, dtype=np.uint8).reshape(-1), bitorder=BIT_ORDER)
+
+
+def unpack_bits(data, num_bits=None):
+    """
+    Unpack bytes into individual bits
+
+    Args:
+        data: bytes-like object or uint8 array
+        num_bits (int): Optional number of leading bits to keep
+
+    Returns:
+        np.ndarray: uint8 array of 0/1 values, eight per input byte
+    """
+    return np.unpackbits(as_byte_array(data), count=num_bits, bitorder=BIT_ORDER)
+
+
+def pack_bit_string(bit_string):
+    """
+    Pack a string of ASCII '0'/'1' characters into bytes
+
+    Args:
+        bit_string (str): Bit characters, e.g. joined Aer memory strings
+
+    Returns:
+        np.ndarray: uint8 array with eight bits per byte
+    """
+    return pack_bits(np.frombuffer(bit_string.encode('ascii'), dtype=np.uint8) - ord('0'))
+
+
+def xor_bytes(data, keystream, out=None):
+    """
+    XOR a byte buffer with a keystream in one vectorized operation
+
+    Args:
+        data: bytes-like object or uint8 array
+        keystream: bytes-like keystream at least as long as data
+        out: Optional writable uint8 array of len(data) receiving the result
+
+    Returns:
+        np.ndarray: uint8 array holding data ^ keystream
+    """
+    data = as_byte_array(data)
+    return np.bitwise_xor(data, as_byte_array(keystream)[:len(data)], out=out)
+
+
+def bits_to_bytes(bits):
+    """Pack a bit sequence into a bytes object (zero-padded to a byte boundary)"""
+    return pack_bits(bits).tobytes()
+
+
+def bytes_to_bits(data):
+    """Unpack bytes-like data into a list of bits"""
+    return unpack_bits(data).tolist()
@@ -0,0 +1,349 @@
+"""
+Entropy Daemon Module - One Shared QRNG Pipeline Served Over a Unix Socket
+
+Every process that builds a QuantumRandomGenerator runs its own simulator
+jobs to produce randomness. This module lets a single local daemon own one
+large batched QRNG pipeline and hand random bytes to any number of client
+processes, so simulator load is centralized and can be sized on its own.
+
+Key Features:
+- Threaded Unix domain socket server; the socket is created owner-only
+  and never replaces the socket of a live daemon
+- Length-prefixed protocol over persistent connections
+- Large entropy pool refilled by big quantum batches; the first batch is
+  generated before the socket accepts clients, the rest in the background
+- Source failures close the affected connection, so clients fall back
+- Client with a local buffer that batches small reads into large requests
+- Transparent fallback to in-process generation while the daemon is down
+
+PROTOCOL:
+- Request:  4-byte big-endian length N (1 <= N <= MAX_REQUEST)
+- Response: 4-byte big-endian length N followed by N random bytes
+- Any other request closes the connection
+
+USAGE:
+    python entropy_daemon.py /run/quantum/entropy.sock
+    QUANTUM_ENTROPY_DAEMON=/run/quantum/entropy.sock streamlit run app.py
+"""
+
+import os                   # Socket file handling
+import stat                 # Stale socket detection
+import sys                  # Command-line socket path
+import time                 # Reconnect back-off
+import socket               # Unix domain socket client
+import struct               # Length prefixes
+import threading            # Server thread and client locking
+import socketserver         # Threaded socket server
+
+from entropy_pool import QuantumEntropyPool  # Daemon-side buffered randomness
+
+# Daemon socket path; clients generate in-process when unset
+ENTROPY_DAEMON_SOCKET = os.environ.get('QUANTUM_ENTROPY_DAEMON')
+
+# Unix domain sockets are not available on every platform
+UNIX_SOCKETS_AVAILABLE = hasattr(socket, 'AF_UNIX')
+
+LENGTH = struct.Struct('>I')
+# Largest number of bytes served per request
+MAX_REQUEST = 1 << 20
+
+
+def _recv_exact(connection, num_bytes):
+    """Receive exactly num_bytes, or None if the peer closed the connection first"""
+    chunks = bytearray()
+    while len(chunks) < num_bytes:
+        chunk = connection.recv(num_bytes - len(chunks))
+        if not chunk:
+            return None
+        chunks += chunk
+    return bytes(chunks)
+
+
+class _EntropyRequestHandler(socketserver.BaseRequestHandler):
+    """Serve length-prefixed requests on one client connection"""
+
+    def setup(self):
+        self.server.entropy_daemon._track(self.request, True)
+
+    def finish(self):
+        self.server.entropy_daemon._track(self.request, False)
+
+    def handle(self):
+        daemon = self.server.entropy_daemon
+        daemon._count('connections', 1)
+        try:
+            while True:
+                header = _recv_exact(self.request, LENGTH.size)
+                if header is None:
+                    return
+                (length,) = LENGTH.unpack(header)
+                if not 1 <= length <= MAX_REQUEST:
+                    return
+                try:
+                    data = daemon.pool.read(length)
+                except Exception as e:
+                    # Failing or quarantined source - drop the client so it falls back
+                    daemon._count('source_errors', 1)
+                    return
+                self.request.sendall(LENGTH.pack(len(data)) + data)
+                daemon._count('requests', 1)
+                daemon._count('bytes_served', len(data))
+        except OSError as e:
+            # Client went away mid-request
+            return
+
+
+class EntropyDaemon:
+    """
+    Local entropy server owning one batched QRNG pipeline
+
+    Attributes:
+        socket_path: Unix socket the daemon listens on
+        pool: Entropy pool the requests are served from
+        stats: Connection, request and byte counters
+    """
+
+    def __init__(self, socket_path, source=None, capacity=1 << 20, refill_chunk=1 << 16):
+        """
+        Initialize the daemon
+
+        Args:
+            socket_path (str): Unix socket to listen on
+            source: Callable(num_bytes) -> bytes. Defaults to batched jobs of a
+                QuantumRandomGenerator
+            capacity (int): Entropy pool capacity in bytes
+            refill_chunk (int): Bytes per refill batch
+        """
+        if source is None:
+            from quantum_protocol import QuantumRandomGenerator
+            source = QuantumRandomGenerator().generate_entropy_batch
+        self.socket_path = socket_path
+        self.pool = QuantumEntropyPool(source, capacity=capacity, refill_chunk=refill_chunk)
+        self.stats = {
+            'connections': 0,       # Client connections accepted
+            'requests': 0,          # Requests served
+            'bytes_served': 0,      # Random bytes sent to clients
+            'source_errors': 0      # Requests dropped because the source failed
+        }
+        self._stats_lock = threading.Lock()
+        self._connections = set()
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Bind the socket and serve on a background daemon thread"""
+        self._bind()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='entropy-daemon', daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        """Bind the socket and serve in the calling thread"""
+        self._bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop serving, drop connected clients and remove the socket file"""
+        bound = self._server is not None
+        if bound:
+            if self._thread is not None:
+                self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        with self._stats_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError as e:
+                pass
+        if bound and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.pool.close()
+
+    def _bind(self):
+        """Create the listening socket, replacing only a stale socket file"""
+        self._remove_stale_socket()
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # Generate one batch before accepting clients, so no early request
+        # waits for a synchronous refill past the client timeout
+        self.pool.fill(self.pool.refill_chunk)
+
+        # Bind under a restrictive umask so the socket is never connectable
+        # by other users, not even before a chmod
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _EntropyRequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.daemon_threads = True
+        self._server.entropy_daemon = self
+
+        # Fill the rest of the pool while the first clients connect
+        threading.Thread(target=self.pool.fill, name='entropy-daemon-prefill', daemon=True).start()
+
+    def _remove_stale_socket(self):
+        """Unlink a leftover socket file, refusing to take over a live daemon"""
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{self.socket_path} exists and is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.socket_path)     # Nobody listening - left by a dead daemon
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"An entropy daemon is already serving {self.socket_path}")
+
+    def _track(self, connection, connected):
+        """Add or remove an open client connection"""
+        with self._stats_lock:
+            if connected:
+                self._connections.add(connection)
+            else:
+                self._connections.discard(connection)
+
+    def _count(self, name, amount):
+        """Add to a stats counter from a handler thread"""
+        with self._stats_lock:
+            self.stats[name] += amount
+
+
+class EntropyDaemonClient:
+    """
+    Buffered client of the entropy daemon with in-process fallback
+
+    Reads are served from a local buffer; when it runs short, one request
+    of at least buffer_size bytes is sent to the daemon. If the daemon
+    cannot be reached, the read is completed from the fallback source and
+    the daemon is retried after retry_interval seconds. Buffered bytes are
+    handed out exactly once.
+
+    Attributes:
+        socket_path: Unix socket of the daemon
+        fallback: Callable(num_bytes) -> bytes used while the daemon is down
+        buffer_size: Minimum bytes requested from the daemon at a time
+        timeout: Socket timeout in seconds
+        retry_interval: Seconds before a failed daemon is tried again
+        stats: Byte, request and fallback counters
+    """
+
+    def __init__(self, socket_path, fallback, buffer_size=16384, timeout=1.0, retry_interval=5.0):
+        """
+        Initialize the client (the daemon is connected on first use)
+
+        Args:
+            socket_path (str): Unix socket of the daemon
+            fallback: Callable(num_bytes) -> bytes for in-process generation
+            buffer_size (int): Minimum bytes requested from the daemon at a time
+            timeout (float): Socket timeout in seconds
+            retry_interval (float): Seconds before a failed daemon is tried again
+        """
+        self.socket_path = socket_path
+        self.fallback = fallback
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._retry_at = 0.0
+
+        self.stats = {
+            'bytes_served': 0,      # Bytes handed to callers
+            'daemon_bytes': 0,      # Bytes received from the daemon
+            'requests': 0,          # Requests sent to the daemon
+            'fallbacks': 0          # Reads completed in-process
+        }
+
+    @property
+    def available(self):
+        """True unless the daemon recently failed"""
+        return UNIX_SOCKETS_AVAILABLE and time.monotonic() >= self._retry_at
+
+    def read(self, num_bytes):
+        """
+        Take random bytes from the daemon (or the fallback)
+
+        Args:
+            num_bytes (int): Number of bytes to read
+
+        Returns:
+            bytes: Fresh random bytes
+        """
+        with self._lock:
+            taken = bytes(self._buffer[:num_bytes])
+            del self._buffer[:num_bytes]
+            shortfall = num_bytes - len(taken)
+            if shortfall > 0 and self.available:
+                fetched = self._request(max(shortfall, self.buffer_size))
+                if fetched is not None:
+                    taken += fetched[:shortfall]
+                    self._buffer += fetched[shortfall:]
+                    shortfall = num_bytes - len(taken)
+            self.stats['bytes_served'] += num_bytes
+            if shortfall > 0:
+                self.stats['fallbacks'] += 1
+
+        # Daemon down - generate the rest in-process
+        if shortfall > 0:
+            taken += self.fallback(shortfall)
+        return taken
+
+    def close(self):
+        """Close the daemon connection"""
+        with self._lock:
+            self._disconnect()
+
+    def _request(self, num_bytes):
+        """Fetch num_bytes from the daemon, or None on failure (lock held)"""
+        try:
+            if self._connection is None:
+                self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._connection.settimeout(self.timeout)
+                self._connection.connect(self.socket_path)
+
+            received = bytearray()
+            while len(received) < num_bytes:
+                length = min(num_bytes - len(received), MAX_REQUEST)
+                self._connection.sendall(LENGTH.pack(length))
+                header = _recv_exact(self._connection, LENGTH.size)
+                data = header and _recv_exact(self._connection, LENGTH.unpack(header)[0])
+                if data is None:
+                    raise ConnectionError("entropy daemon closed the connection")
+                received += data
+                self.stats['requests'] += 1
+            self.stats['daemon_bytes'] += len(received)
+            return bytes(received)
+        except OSError as e:
+            # Includes timeouts and refused connections; retry the daemon later
+            self._disconnect()
+            self._retry_at = time.monotonic() + self.retry_interval
+            return None
+
+    def _disconnect(self):
+        """Drop the daemon connection (lock held)"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+if __name__ == "__main__":
+    socket_path = sys.argv[1] if len(sys.argv) > 1 else ENTROPY_DAEMON_SOCKET
+    if not socket_path:
+        sys.exit("usage: python entropy_daemon.py SOCKET_PATH (or set QUANTUM_ENTROPY_DAEMON)")
+    print(f"Serving quantum entropy on {socket_path}")
+    EntropyDaemon(socket_path).serve_forever()
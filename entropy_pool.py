@@ -0,0 +1,203 @@
+"""
+Entropy Pool Module - Buffered Quantum Randomness with Background Refill
+
+Generating quantum random bits means running a simulator job, which is far
+too slow to do on the critical path of every key, nonce or salt. This module
+keeps a bounded buffer of random bytes that a background thread refills in
+large batches, so consumers only pay for a buffer read.
+
+Key Features:
+- Bounded byte buffer with low-water and high-water marks
+- Background daemon thread refilling in large batches from any byte source
+- Synchronous top-up when a read outruns the buffer, so readers never block
+  on the refill thread
+- Optional rate-adaptive watermarks: the buffered depth follows the
+  observed read rate, so bursts of small reads (key/nonce/salt bundles)
+  are served from the buffer instead of stalling
+- Counters for bytes served, bytes generated, refills and stalls
+"""
+
+import time                 # Read rate estimation
+import threading            # Background refill thread and buffer locking
+from collections import deque  # Recent read timestamps and sizes
+
+
+class QuantumEntropyPool:
+    """
+    Bounded entropy buffer refilled in the background
+
+    Reads take bytes from the front of the buffer. Whenever the level drops
+    below low_water, the refill thread is woken and tops the buffer up to
+    high_water in chunks of refill_chunk bytes from the source. Bytes are
+    handed out exactly once.
+
+    With target_seconds set, the marks follow demand: every read updates the
+    observed read rate, and capacity, low_water and high_water are scaled
+    up so that high_water covers target_seconds of reads, never shrinking
+    below the configured sizes or growing past max_capacity.
+
+    Attributes:
+        source: Callable returning the requested number of random bytes
+        capacity: Maximum number of buffered bytes
+        low_water: Level below which a background refill starts
+        high_water: Level a refill fills the buffer up to
+        refill_chunk: Bytes requested from the source per refill step
+        target_seconds: Seconds of observed demand kept buffered (None: fixed marks)
+        max_capacity: Largest capacity the adaptive marks may grow to
+        stats: Byte, refill and stall counters
+    """
+
+    # Seconds the refill thread waits before retrying a failed source
+    RETRY_DELAY = 1.0
+    # Number of recent reads used to estimate the read rate
+    RATE_WINDOW = 64
+
+    def __init__(self, source, capacity=65536, low_water=None, high_water=None, refill_chunk=4096,
+                 target_seconds=None, max_capacity=None):
+        """
+        Initialize the entropy pool
+
+        Args:
+            source: Callable(num_bytes) -> bytes producing fresh randomness
+            capacity: Maximum number of buffered bytes
+            low_water: Refill trigger level (default: a quarter of capacity)
+            high_water: Refill target level (default: capacity)
+            refill_chunk: Bytes requested from the source per refill step
+            target_seconds: Seconds of observed demand kept buffered; enables
+                rate-adaptive marks (default: fixed marks)
+            max_capacity: Largest adaptive capacity (default: 16 times capacity)
+        """
+        self.source = source
+        self.capacity = capacity
+        self.low_water = capacity // 4 if low_water is None else low_water
+        self.high_water = capacity if high_water is None else min(high_water, capacity)
+        self.refill_chunk = refill_chunk
+        self.target_seconds = target_seconds
+        self.max_capacity = max(capacity, 16 * capacity if max_capacity is None else max_capacity)
+
+        # Configured marks the adaptive ones are scaled from
+        self._base_marks = (self.capacity, self.low_water, self.high_water)
+        self._reads = deque(maxlen=self.RATE_WINDOW)    # (time, bytes) of recent reads
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._refill_wanted = threading.Condition(self._lock)
+        self._refill_thread = None
+        self._closed = False
+
+        self.stats = {
+            'bytes_served': 0,      # Bytes handed to consumers
+            'bytes_generated': 0,   # Bytes produced by the source
+            'refills': 0,           # Background refill cycles
+            'stalls': 0             # Reads that had to call the source directly
+        }
+
+    @property
+    def level(self):
+        """Number of bytes currently buffered"""
+        return len(self._buffer)
+
+    @property
+    def read_rate(self):
+        """Observed bytes read per second"""
+        with self._lock:
+            return self._read_rate(time.monotonic())
+
+    def read(self, num_bytes):
+        """
+        Take random bytes from the pool
+
+        Args:
+            num_bytes (int): Number of bytes to read
+
+        Returns:
+            bytes: Fresh random bytes, never returned to any other reader
+        """
+        self._ensure_refill_thread()
+
+        with self._lock:
+            if self.target_seconds is not None:
+                self._adapt_marks(time.monotonic(), num_bytes)
+            taken = bytes(self._buffer[:num_bytes])
+            del self._buffer[:num_bytes]
+            self.stats['bytes_served'] += len(taken)
+            if len(self._buffer) < self.low_water:
+                self._refill_wanted.notify()
+
+        # The buffer ran dry - top up directly rather than wait for the refill thread
+        shortfall = num_bytes - len(taken)
+        if shortfall > 0:
+            extra = self.source(shortfall)
+            with self._lock:
+                self.stats['stalls'] += 1
+                self.stats['bytes_generated'] += len(extra)
+                self.stats['bytes_served'] += len(extra)
+            taken += extra
+
+        return taken
+
+    def fill(self, level=None):
+        """
+        Synchronously fill the buffer (e.g. at startup)
+
+        Args:
+            level (int): Level to fill up to (default: high_water)
+        """
+        level = self.high_water if level is None else min(level, self.capacity)
+        while not self._closed and self.level < level:
+            self._add(self.source(min(self.refill_chunk, level - self.level)))
+
+    def close(self):
+        """Stop the refill thread"""
+        with self._lock:
+            self._closed = True
+            self._refill_wanted.notify_all()
+
+    def _read_rate(self, now):
+        """Bytes per second over the rate window (lock held by caller)"""
+        if len(self._reads) < 2:
+            return 0.0
+        elapsed = max(now - self._reads[0][0], 1e-6)
+        return sum(size for _, size in list(self._reads)[1:]) / elapsed
+
+    def _adapt_marks(self, now, num_bytes):
+        """Record a read and rescale the marks to the read rate (lock held by caller)"""
+        self._reads.append((now, num_bytes))
+        base_capacity, base_low, base_high = self._base_marks
+        demand = int(self._read_rate(now) * self.target_seconds)
+        scale = min(max(demand, base_high) / max(base_high, 1), self.max_capacity / base_capacity)
+        self.capacity = int(base_capacity * scale)
+        self.low_water = int(base_low * scale)
+        self.high_water = min(int(base_high * scale), self.capacity)
+
+    def _add(self, data):
+        """Append generated bytes, respecting the capacity bound"""
+        with self._lock:
+            room = self.capacity - len(self._buffer)
+            self._buffer += data[:room]
+            self.stats['bytes_generated'] += len(data)
+
+    def _ensure_refill_thread(self):
+        """Start the background refill thread on first use"""
+        if self._refill_thread is None:
+            with self._lock:
+                if self._refill_thread is None and not self._closed:
+                    self._refill_thread = threading.Thread(
+                        target=self._refill_loop, name='quantum-entropy-refill', daemon=True)
+                    self._refill_thread.start()
+
+    def _refill_loop(self):
+        """Wait for the low-water mark, then refill up to high_water"""
+        while True:
+            with self._lock:
+                while not self._closed and len(self._buffer) >= self.low_water:
+                    self._refill_wanted.wait()
+                if self._closed:
+                    return
+                self.stats['refills'] += 1
+
+            try:
+                self.fill()
+            except Exception as e:
+                # Retry later; readers still get bytes through their synchronous top-up
+                with self._lock:
+                    self._refill_wanted.wait(timeout=self.RETRY_DELAY)
@@ -0,0 +1,313 @@
+"""
+Entropy Reservoir Module - Persistent Memory-Mapped Randomness Across Restarts
+
+Every process used to start with an empty entropy pool, so the first
+encrypted transmissions after a deploy paid the full QRNG generation cost.
+This module keeps quantum random bytes in a file that is memory-mapped at
+startup, so a fresh process can serve randomness produced by its
+predecessors immediately.
+
+Key Features:
+- Ring buffer file with a persisted read cursor; bytes are served exactly
+  once and wiped from the file as they are consumed
+- Shared by several worker processes through an exclusive file lock
+- Background daemon thread refilling the file from the QRNG below low_water
+- Synchronous top-up from the source when the reservoir runs dry
+- One shared reservoir per file path within a process
+
+FILE FORMAT:
+- 64-byte header: magic b'QENTRES1', capacity, read cursor, write cursor
+  (little-endian uint64; cursors count bytes since the file was created)
+- capacity data bytes addressed modulo capacity
+- Every cursor update is flushed to disk (msync) before the lock is
+  released: wiped bytes and the read cursor before bytes are returned,
+  new data before the write cursor that publishes it. A crash or power
+  loss therefore cannot roll the read cursor back onto served bytes
+- The file is created with owner-only permissions
+"""
+
+import os                   # File creation and sizing
+import mmap                 # Memory-mapped reservoir file
+import struct               # Header layout
+import threading            # Refill thread and in-process locking
+from contextlib import contextmanager  # Lock helpers
+
+# Advisory file locking between processes (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Reservoir file path; the reservoir is disabled when unset
+ENTROPY_RESERVOIR_PATH = os.environ.get('QUANTUM_ENTROPY_RESERVOIR')
+
+MAGIC = b'QENTRES1'
+HEADER = struct.Struct('<8sQQQ')    # magic, capacity, read cursor, write cursor
+HEADER_SIZE = 64
+
+
+class EntropyReservoir:
+    """
+    File-backed entropy ring buffer shared between processes
+
+    Reads take bytes at the read cursor, wipe them in the file and advance
+    the cursor, all under an exclusive lock, so no byte is ever handed out
+    twice even when several processes share the file. Whenever the level
+    drops below low_water, the refill thread tops the file up to capacity
+    in chunks of refill_chunk bytes from the source. Without fcntl the lock
+    only covers threads of one process.
+
+    Attributes:
+        path: Reservoir file
+        source: Callable returning the requested number of random bytes
+        capacity: Data bytes in the file (taken from an existing file)
+        low_water: Level below which a background refill starts
+        refill_chunk: Bytes requested from the source per refill step
+        stats: Per-process byte, refill and stall counters
+    """
+
+    # Seconds the refill thread waits before retrying a failed source
+    RETRY_DELAY = 1.0
+    # Seconds between level checks, catching reads by other processes
+    POLL_INTERVAL = 5.0
+
+    def __init__(self, path, source, capacity=1 << 20, low_water=None, refill_chunk=65536):
+        """
+        Open or create the reservoir file and map it
+
+        Args:
+            path (str): Reservoir file
+            source: Callable(num_bytes) -> bytes producing fresh randomness
+            capacity (int): Data bytes of a newly created file
+            low_water (int): Refill trigger level (default: half the capacity)
+            refill_chunk (int): Bytes requested from the source per refill step
+        """
+        self.path = path
+        self.source = source
+        self.refill_chunk = refill_chunk
+
+        self._lock = threading.Lock()
+        self._refill_wanted = threading.Condition(self._lock)
+        self._refill_thread = None
+        self._closed = False
+
+        self.stats = {
+            'bytes_served': 0,      # Bytes handed to consumers
+            'bytes_generated': 0,   # Bytes produced by the source
+            'refills': 0,           # Background refill cycles
+            'stalls': 0             # Reads that had to call the source directly
+        }
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._file_lock():
+            self.capacity = self._map(capacity)
+        self.low_water = self.capacity // 2 if low_water is None else low_water
+
+    @property
+    def level(self):
+        """Number of unread bytes in the file"""
+        with self._locked():
+            return self._level()
+
+    def read(self, num_bytes):
+        """
+        Take random bytes from the reservoir
+
+        Args:
+            num_bytes (int): Number of bytes to read
+
+        Returns:
+            bytes: Fresh random bytes, never returned to any reader again
+        """
+        self._ensure_refill_thread()
+
+        with self._locked():
+            read_cursor, write_cursor = self._cursors()
+            take = min(num_bytes, write_cursor - read_cursor)
+            taken = self._copy_out(read_cursor, take)
+            self._copy_in(read_cursor, bytes(take))     # Wipe consumed bytes
+            self._flush_range(read_cursor, take)
+            self._store_cursors(read_cursor + take, write_cursor)
+            self._flush_header()
+            self.stats['bytes_served'] += take
+            if write_cursor - read_cursor - take < self.low_water:
+                self._refill_wanted.notify()
+
+        # The reservoir ran dry - top up directly rather than wait for a refill
+        shortfall = num_bytes - len(taken)
+        if shortfall > 0:
+            extra = self.source(shortfall)
+            with self._lock:
+                self.stats['stalls'] += 1
+                self.stats['bytes_generated'] += len(extra)
+                self.stats['bytes_served'] += len(extra)
+            taken += extra
+
+        return taken
+
+    def fill(self):
+        """Synchronously fill the file up to capacity (e.g. before a deploy)"""
+        while not self._closed:
+            missing = min(self.refill_chunk, self.capacity - self.level)
+            if missing <= 0:
+                return
+            self._add(self.source(missing))
+
+    def close(self):
+        """Stop the refill thread, unmap the file and release the shared instance"""
+        with self._lock:
+            self._closed = True
+            self._refill_wanted.notify_all()
+            self._mapping.close()
+            os.close(self._fd)
+        with _reservoirs_lock:
+            if _reservoirs.get(os.path.abspath(self.path)) is self:
+                del _reservoirs[os.path.abspath(self.path)]
+
+    def _map(self, capacity):
+        """Map the file, initializing it if new or unreadable (file lock held)"""
+        size = os.fstat(self._fd).st_size
+        if size >= HEADER_SIZE:
+            self._mapping = mmap.mmap(self._fd, size)
+            magic, file_capacity, _, _ = HEADER.unpack_from(self._mapping, 0)
+            if magic == MAGIC and size == HEADER_SIZE + file_capacity:
+                return file_capacity
+            self._mapping.close()
+
+        # New or corrupt file: start empty, so no old byte can be served
+        os.ftruncate(self._fd, HEADER_SIZE + capacity)
+        self._mapping = mmap.mmap(self._fd, HEADER_SIZE + capacity)
+        self._mapping[HEADER_SIZE:] = bytes(capacity)
+        HEADER.pack_into(self._mapping, 0, MAGIC, capacity, 0, 0)
+        return capacity
+
+    def _add(self, data):
+        """Append generated bytes at the write cursor, respecting capacity"""
+        with self._locked():
+            self.stats['bytes_generated'] += len(data)
+            read_cursor, write_cursor = self._cursors()
+            room = self.capacity - (write_cursor - read_cursor)
+            data = data[:room]
+            self._copy_in(write_cursor, data)
+            self._flush_range(write_cursor, len(data))
+            self._store_cursors(read_cursor, write_cursor + len(data))
+            self._flush_header()
+
+    def _cursors(self):
+        """(read cursor, write cursor) from the header (locks held)"""
+        return HEADER.unpack_from(self._mapping, 0)[2:]
+
+    def _store_cursors(self, read_cursor, write_cursor):
+        """Persist both cursors in the header (locks held)"""
+        HEADER.pack_into(self._mapping, 0, MAGIC, self.capacity, read_cursor, write_cursor)
+
+    def _level(self):
+        """Unread bytes (locks held)"""
+        read_cursor, write_cursor = self._cursors()
+        return write_cursor - read_cursor
+
+    def _copy_out(self, cursor, length):
+        """Bytes at a cursor position, wrapping around the ring (locks held)"""
+        start = HEADER_SIZE + cursor % self.capacity
+        first = min(length, HEADER_SIZE + self.capacity - start)
+        return self._mapping[start:start + first] + self._mapping[HEADER_SIZE:HEADER_SIZE + length - first]
+
+    def _copy_in(self, cursor, data):
+        """Write bytes at a cursor position, wrapping around the ring (locks held)"""
+        start = HEADER_SIZE + cursor % self.capacity
+        first = min(len(data), HEADER_SIZE + self.capacity - start)
+        self._mapping[start:start + first] = data[:first]
+        self._mapping[HEADER_SIZE:HEADER_SIZE + len(data) - first] = data[first:]
+
+    def _flush_header(self):
+        """Write the header page to disk (locks held)"""
+        self._mapping.flush(0, HEADER_SIZE)
+
+    def _flush_range(self, cursor, length):
+        """Write the pages holding a ring range to disk, wrapping around (locks held)"""
+        start = cursor % self.capacity
+        first = min(length, self.capacity - start)
+        for offset, size in ((HEADER_SIZE + start, first), (HEADER_SIZE, length - first)):
+            if size > 0:
+                # msync needs a page-aligned start
+                aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+                self._mapping.flush(aligned, offset + size - aligned)
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on the file against other processes"""
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock against other threads and other processes"""
+        with self._lock:
+            if self._closed:
+                raise ValueError("entropy reservoir is closed")
+            with self._file_lock():
+                yield
+
+    def _ensure_refill_thread(self):
+        """Start the background refill thread on first use"""
+        if self._refill_thread is None:
+            with self._lock:
+                if self._refill_thread is None and not self._closed:
+                    self._refill_thread = threading.Thread(
+                        target=self._refill_loop, name='entropy-reservoir-refill', daemon=True)
+                    self._refill_thread.start()
+
+    def _refill_loop(self):
+        """Wait for the low-water mark, then refill up to capacity"""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                with self._file_lock():
+                    level = self._level()
+                if level >= self.low_water:
+                    self._refill_wanted.wait(timeout=self.POLL_INTERVAL)
+                    continue
+                self.stats['refills'] += 1
+
+            try:
+                self.fill()
+            except Exception as e:
+                # Retry later; readers still get bytes through their synchronous top-up
+                with self._lock:
+                    self._refill_wanted.wait(timeout=self.RETRY_DELAY)
+
+
+# Shared reservoirs, one per file
+_reservoirs = {}
+_reservoirs_lock = threading.Lock()
+
+
+def get_entropy_reservoir(path, source, **settings):
+    """
+    Return the process-wide reservoir for a file
+
+    The first caller's source and settings are used when the reservoir is
+    opened; later callers share it.
+
+    Args:
+        path (str): Reservoir file
+        source: Callable(num_bytes) -> bytes producing fresh randomness
+        **settings: EntropyReservoir options
+
+    Returns:
+        EntropyReservoir: Reservoir mapped from the file
+    """
+    path = os.path.abspath(path)
+    with _reservoirs_lock:
+        if path not in _reservoirs:
+            _reservoirs[path] = EntropyReservoir(path, source, **settings)
+        return _reservoirs[path]
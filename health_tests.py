@@ -0,0 +1,259 @@
+"""
+Health Tests Module - Continuous SP 800-90B Health Tests for Entropy Sources
+
+The QRNG can silently degrade (a stuck simulator seed, a broken fallback).
+This module runs the two continuous health tests of NIST SP 800-90B on the
+byte stream as it is produced and quarantines a source that fails them.
+
+Key Features:
+- Repetition Count Test: alarm on a run of identical bytes of length >= C
+- Adaptive Proportion Test: alarm when the first byte of a window recurs
+  C times within the window
+- Streaming state carried across chunks; each chunk is tested with NumPy in
+  amortized O(1) work per byte
+- Per-source counters, alarm history and time-based quarantine
+
+CUTOFFS (SP 800-90B section 4.4):
+- RCT: C = 1 + ceil(-log2(alpha) / H)
+- APT: C = 1 + CRITBINOM(W, 2^-H, 1 - alpha), i.e. one more than the
+  smallest k with P(Binomial(W, 2^-H) > k) <= alpha
+  where H is the assessed min-entropy per byte and alpha the false-alarm rate
+"""
+
+import math                 # Cutoff computation
+import time                 # Quarantine timing
+import threading            # Shared monitor across refill threads
+import numpy as np          # Vectorized chunk testing
+
+from bit_buffer import as_byte_array
+
+# Assessed min-entropy per byte of the QRNG output used for the cutoffs
+DEFAULT_MIN_ENTROPY = 7.0
+# False-alarm probability per sample (SP 800-90B recommends 2^-20 to 2^-40).
+# The QRNG tests megabytes per second, so 2^-20 would alarm every few MB
+DEFAULT_ALPHA = 2.0 ** -40
+# Adaptive proportion window for non-binary samples
+DEFAULT_WINDOW = 512
+
+
+def repetition_count_cutoff(min_entropy, alpha=DEFAULT_ALPHA):
+    """Repetition Count Test cutoff C"""
+    return 1 + math.ceil(-math.log2(alpha) / min_entropy)
+
+
+def adaptive_proportion_cutoff(min_entropy, window=DEFAULT_WINDOW, alpha=DEFAULT_ALPHA):
+    """Adaptive Proportion Test cutoff C (count includes the window's first sample)"""
+    p = 2.0 ** -min_entropy
+    # Walk the binomial tail P(X >= k) down from k = W until it exceeds alpha
+    tail = 0.0
+    for successes in range(window, -1, -1):
+        log_pmf = (math.lgamma(window + 1) - math.lgamma(successes + 1)
+                   - math.lgamma(window - successes + 1)
+                   + successes * math.log(p) + (window - successes) * math.log1p(-p))
+        tail += math.exp(log_pmf)
+        if tail > alpha:
+            return successes + 1
+    return 1
+
+
+class ContinuousHealthTest:
+    """
+    Streaming Repetition Count and Adaptive Proportion tests on bytes
+
+    update() tests a chunk, carrying the current run and the current APT
+    window over to the next chunk, so results do not depend on chunking.
+
+    Attributes:
+        rct_cutoff: Repetition count that raises an alarm
+        apt_cutoff: Window count that raises an alarm
+        window: Adaptive proportion window size
+        stats: Bytes tested, failed chunks per test, longest run and
+            largest window count seen
+    """
+
+    def __init__(self, min_entropy=DEFAULT_MIN_ENTROPY, alpha=DEFAULT_ALPHA, window=DEFAULT_WINDOW):
+        """
+        Initialize the tests
+
+        Args:
+            min_entropy (float): Assessed min-entropy per byte
+            alpha (float): False-alarm probability per sample
+            window (int): Adaptive proportion window size
+        """
+        self.rct_cutoff = repetition_count_cutoff(min_entropy, alpha)
+        self.apt_cutoff = adaptive_proportion_cutoff(min_entropy, window, alpha)
+        self.window = window
+        self.stats = {
+            'bytes_tested': 0,
+            'rct_failures': 0,
+            'apt_failures': 0,
+            'longest_run': 0,
+            'max_window_count': 0
+        }
+        self.reset()
+
+    def reset(self):
+        """Forget the run and window carried over from earlier chunks"""
+        self._last_value = -1       # Last byte of the previous chunk
+        self._run_length = 0        # Length of the run ending there
+        self._window_value = -1     # First byte of the open APT window
+        self._window_count = 0      # Occurrences of it so far
+        self._window_filled = 0     # Samples in the open window
+
+    def update(self, data):
+        """
+        Test a chunk of bytes
+
+        Args:
+            data: bytes-like chunk of source output
+
+        Returns:
+            bool: True if neither test raised an alarm on this chunk
+        """
+        samples = as_byte_array(data)
+        if samples.size == 0:
+            return True
+        self.stats['bytes_tested'] += samples.size
+        rct_ok = self._repetition_count(samples)
+        apt_ok = self._adaptive_proportion(samples)
+        self.stats['rct_failures'] += not rct_ok
+        self.stats['apt_failures'] += not apt_ok
+        return rct_ok and apt_ok
+
+    def _repetition_count(self, samples):
+        """Longest run of identical bytes, continuing the previous chunk's run"""
+        size = samples.size
+        # Repeats are rare in healthy output, so only their positions are processed
+        repeats = np.flatnonzero(samples[1:] == samples[:-1])
+        if repeats.size:
+            breaks = np.flatnonzero(np.diff(repeats) != 1)
+            run_starts = repeats[np.concatenate([[0], breaks + 1])]
+            run_lengths = repeats[np.concatenate([breaks, [repeats.size - 1]])] - run_starts + 2
+        else:
+            run_starts = run_lengths = np.zeros(0, dtype=np.int64)
+
+        first_run = int(run_lengths[0]) if repeats.size and run_starts[0] == 0 else 1
+        last_run = int(run_lengths[-1]) if repeats.size and run_starts[-1] + run_lengths[-1] == size else 1
+        carried = self._run_length if samples[0] == self._last_value else 0
+        if last_run == size:
+            last_run += carried     # The whole chunk continues the previous run
+
+        longest = max(int(run_lengths.max(initial=1)), first_run + carried)
+        self.stats['longest_run'] = max(self.stats['longest_run'], longest)
+        self._last_value = int(samples[-1])
+        self._run_length = last_run
+        return longest < self.rct_cutoff
+
+    def _adaptive_proportion(self, samples):
+        """Count each window's first byte, continuing the open window"""
+        max_count = 0
+        position = 0
+
+        # Finish the window left open by the previous chunk
+        if self._window_filled:
+            take = min(self.window - self._window_filled, samples.size)
+            self._window_count += int(np.count_nonzero(samples[:take] == self._window_value))
+            self._window_filled += take
+            max_count = self._window_count
+            position = take
+            if self._window_filled < self.window:
+                self._record_window_max(max_count)
+                return max_count < self.apt_cutoff
+
+        # Whole windows of this chunk in one vectorized pass
+        num_windows = (samples.size - position) // self.window
+        if num_windows:
+            windows = samples[position:position + num_windows * self.window].reshape(num_windows, self.window)
+            counts = np.count_nonzero(windows == windows[:, :1], axis=1)
+            max_count = max(max_count, int(counts.max()))
+            position += num_windows * self.window
+
+        # Open a new window with the remaining samples
+        tail = samples[position:]
+        if tail.size:
+            self._window_value = int(tail[0])
+            self._window_count = int(np.count_nonzero(tail == tail[0]))
+            self._window_filled = tail.size
+            max_count = max(max_count, self._window_count)
+        else:
+            self._window_filled = 0
+
+        self._record_window_max(max_count)
+        return max_count < self.apt_cutoff
+
+    def _record_window_max(self, count):
+        """Track the largest window count seen"""
+        self.stats['max_window_count'] = max(self.stats['max_window_count'], count)
+
+
+class EntropyHealthMonitor:
+    """
+    Continuous health monitoring and quarantine of named entropy sources
+
+    Each source gets its own ContinuousHealthTest. A chunk that fails is
+    reported as unhealthy and its source is quarantined for
+    quarantine_seconds; callers discard the chunk and switch to another
+    source instead of waiting.
+
+    Attributes:
+        quarantine_seconds: How long a failing source stays quarantined
+        alarms: Most recent alarms as dicts (source, time, test stats)
+    """
+
+    # Number of alarms kept in the alarm history
+    MAX_ALARMS = 100
+
+    def __init__(self, quarantine_seconds=60.0, clock=time.monotonic, **test_settings):
+        """
+        Initialize the monitor
+
+        Args:
+            quarantine_seconds (float): Quarantine duration after an alarm
+            clock: Callable returning the current time in seconds
+            **test_settings: ContinuousHealthTest options (min_entropy, alpha, window)
+        """
+        self.quarantine_seconds = quarantine_seconds
+        self.clock = clock
+        self.test_settings = test_settings
+        self.alarms = []
+        self._tests = {}
+        self._quarantined_until = {}
+        self._lock = threading.Lock()
+
+    def check(self, source, data):
+        """
+        Run the health tests on a chunk from a source
+
+        Args:
+            source (str): Source name, e.g. 'quantum' or 'fallback'
+            data: bytes-like chunk
+
+        Returns:
+            bool: True if the chunk passed; False raises an alarm and
+            quarantines the source
+        """
+        with self._lock:
+            test = self._tests.get(source)
+            if test is None:
+                test = self._tests[source] = ContinuousHealthTest(**self.test_settings)
+            if test.update(data):
+                return True
+
+            now = self.clock()
+            self._quarantined_until[source] = now + self.quarantine_seconds
+            test.reset()
+            self.alarms.append({'source': source, 'time': now, 'stats': dict(test.stats)})
+            del self.alarms[:-self.MAX_ALARMS]
+            return False
+
+    def is_quarantined(self, source):
+        """Check whether a source is currently quarantined"""
+        with self._lock:
+            return self.clock() < self._quarantined_until.get(source, float('-inf'))
+
+    def stats(self):
+        """Per-source test counters and quarantine state"""
+        with self._lock:
+            now = self.clock()
+            return {source: dict(test.stats, quarantined=now < self._quarantined_until.get(source, float('-inf')))
+                    for source, test in self._tests.items()}
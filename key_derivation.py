@@ -0,0 +1,150 @@
+"""
+Key Derivation Module - Counter-Mode Keystream Expansion
+
+Quantum keys are short (32 bytes) while messages can be arbitrarily long.
+This module expands a quantum seed into a keystream by hashing
+(seed, nonce, block counter) with an extendable-output or keyed hash, so
+every block is computed independently in constant time.
+
+Key Features:
+- Linear-time expansion: each output block costs one hash call
+- Random access to any byte range without generating the bytes before it
+- Lazy sequential reading that reuses the current block across small reads,
+  and block iteration for streaming use
+- Deterministic from seed and nonce, so decryption regenerates the stream
+- SHAKE-128 (default) or keyed BLAKE2b as the block function
+
+BLOCK FUNCTIONS:
+- shake_128: SHAKE128(seed || nonce || counter) squeezed to block_size bytes
+- blake2b: BLAKE2b-512 keyed with the seed over (nonce || counter), one
+  64-byte digest per sub-block
+"""
+
+import hashlib              # SHAKE-128 and BLAKE2b block functions
+
+# Supported keystream block functions
+KEYSTREAM_ALGORITHMS = ('shake_128', 'blake2b')
+
+# Default number of keystream bytes produced per counter value
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+class CounterModeKeyStream:
+    """
+    Keystream expanded from a seed and nonce in counter mode
+
+    Block i of the stream depends only on (seed, nonce, i), so any range
+    can be produced on demand and the same seed and nonce always give the
+    same stream.
+
+    Attributes:
+        seed: Secret key material (e.g. a 32-byte quantum key)
+        nonce: Per-message nonce separating streams of the same seed
+        algorithm: Block function, one of KEYSTREAM_ALGORITHMS
+        block_size: Keystream bytes per counter value
+        position: Offset of the next sequential read()
+    """
+
+    def __init__(self, seed, nonce=b'', algorithm='shake_128', block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Initialize the keystream
+
+        Args:
+            seed: bytes-like secret seed (at most 64 bytes for blake2b)
+            nonce: bytes-like nonce
+            algorithm: Block function, one of KEYSTREAM_ALGORITHMS
+            block_size: Keystream bytes per counter value (multiple of 64 for blake2b)
+        """
+        if algorithm not in KEYSTREAM_ALGORITHMS:
+            raise ValueError(f"Unknown keystream algorithm '{algorithm}'. "
+                             f"Choose one of {KEYSTREAM_ALGORITHMS}")
+        if algorithm == 'blake2b' and block_size % hashlib.blake2b().digest_size:
+            raise ValueError("blake2b block_size must be a multiple of 64 bytes")
+
+        self.seed = bytes(seed)
+        self.nonce = bytes(nonce)
+        self.algorithm = algorithm
+        self.block_size = block_size
+        self.position = 0
+        self._cached_counter = None     # Block index of _cached_block
+        self._cached_block = b''        # Last block computed by read()
+
+    def block(self, counter):
+        """
+        Compute one keystream block
+
+        Args:
+            counter (int): Block index
+
+        Returns:
+            bytes: block_size keystream bytes
+        """
+        counter_bytes = counter.to_bytes(8, 'big')
+        if self.algorithm == 'shake_128':
+            return hashlib.shake_128(self.seed + self.nonce + counter_bytes).digest(self.block_size)
+
+        # BLAKE2b: one keyed 64-byte digest per sub-block of the counter block
+        prefix = self.nonce + counter_bytes
+        return b''.join(
+            hashlib.blake2b(prefix + sub_block.to_bytes(4, 'big'), key=self.seed).digest()
+            for sub_block in range(self.block_size // 64))
+
+    def read_at(self, offset, length):
+        """
+        Return the keystream bytes [offset, offset + length)
+
+        Args:
+            offset (int): Start offset in the stream
+            length (int): Number of bytes
+
+        Returns:
+            bytes: Keystream bytes
+        """
+        if length <= 0:
+            return b''
+        first_block = offset // self.block_size
+        last_block = (offset + length - 1) // self.block_size
+        blocks = b''.join(self.block(counter) for counter in range(first_block, last_block + 1))
+        start = offset - first_block * self.block_size
+        return blocks[start:start + length]
+
+    def read(self, length):
+        """
+        Return the next length keystream bytes and advance the position
+
+        The block under the position is kept, so a run of small reads costs
+        one block computation per block_size bytes rather than one per read.
+        """
+        data = bytearray()
+        while len(data) < length:
+            counter, start = divmod(self.position, self.block_size)
+            if counter != self._cached_counter:
+                self._cached_block = self.block(counter)
+                self._cached_counter = counter
+            chunk = self._cached_block[start:start + length - len(data)]
+            data += chunk
+            self.position += len(chunk)
+        return bytes(data)
+
+    def __iter__(self):
+        """Lazily yield keystream blocks in counter order"""
+        counter = 0
+        while True:
+            yield self.block(counter)
+            counter += 1
+
+
+def derive_keystream(seed, nonce, length, algorithm='shake_128'):
+    """
+    Expand a seed into length keystream bytes in counter mode
+
+    Args:
+        seed: bytes-like secret seed
+        nonce: bytes-like nonce
+        length (int): Number of keystream bytes
+        algorithm: Block function, one of KEYSTREAM_ALGORITHMS
+
+    Returns:
+        bytes: Deterministic keystream
+    """
+    return CounterModeKeyStream(seed, nonce, algorithm).read_at(0, length)
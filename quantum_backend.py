@@ -0,0 +1,204 @@
+"""
+Quantum Backend Module - Shared Simulator Backend and Executor Pool
+
+This module owns the single Aer simulator backend used by the protocol,
+the quantum random number generator and the cryptography engine. All
+simulator jobs are submitted through a bounded worker pool so that many
+concurrent users do not oversubscribe the machine's cores.
+
+Key Features:
+- One process-wide simulator backend instead of per-call Aer.get_backend
+- Configurable number of concurrently executing jobs
+- Aer thread limits (max_parallel_threads, max_parallel_experiments,
+  max_parallel_shots) applied to every job
+- Reconfiguration in place, so every instance holding the pool sees the
+  new settings
+- Graceful behaviour when Qiskit is not installed (no backend, no pool)
+"""
+
+import os                   # CPU count for default thread limits
+import threading            # Guard the shared pool, backend and executor
+from concurrent.futures import ThreadPoolExecutor  # Bounded job executor
+
+# Qiskit imports with proper fallback handling
+try:
+    from qiskit_aer import AerSimulator  # High-performance simulator backend
+    QISKIT_AVAILABLE = True
+except ImportError:
+    try:
+        from qiskit import Aer
+        AerSimulator = None
+        QISKIT_AVAILABLE = True
+    except ImportError:
+        # No Qiskit available - callers use classical simulation only
+        QISKIT_AVAILABLE = False
+
+# Default number of simulator jobs allowed to execute at the same time
+DEFAULT_MAX_WORKERS = 2
+
+
+class QuantumBackendPool:
+    """
+    Shared simulator backend with a bounded executor for job submission
+
+    Every job runs on one of max_workers executor threads, and each job is
+    limited to a share of the CPU through the Aer parallelism options, so
+    the total thread count stays close to the number of cores regardless
+    of how many protocol, QRNG or crypto instances are active.
+
+    Attributes:
+        max_workers: Number of jobs that may execute concurrently
+        aer_options: Aer parallelism options applied to the backend
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, max_parallel_threads=None,
+                 max_parallel_experiments=1, max_parallel_shots=0):
+        """
+        Initialize the backend pool
+
+        Args:
+            max_workers (int): Number of jobs that may execute concurrently
+            max_parallel_threads (int): Aer threads per job. Defaults to an even
+                share of the CPU cores across the workers
+            max_parallel_experiments (int): Circuits Aer may run in parallel per job
+            max_parallel_shots (int): Shots Aer may run in parallel (0 = automatic)
+        """
+        self._backend = None
+        self._lock = threading.Lock()     # Guards backend creation and executor swaps
+        self._executor = None
+        self.configure(max_workers, max_parallel_threads, max_parallel_experiments, max_parallel_shots)
+
+    def configure(self, max_workers=DEFAULT_MAX_WORKERS, max_parallel_threads=None,
+                  max_parallel_experiments=1, max_parallel_shots=0):
+        """
+        Apply new settings to this pool in place
+
+        A new executor replaces the current one and the Aer options are set
+        on the existing backend. Jobs already submitted are allowed to finish
+        on the previous executor.
+
+        Args:
+            max_workers (int): Number of jobs that may execute concurrently
+            max_parallel_threads (int): Aer threads per job (default: even CPU share)
+            max_parallel_experiments (int): Circuits Aer may run in parallel per job
+            max_parallel_shots (int): Shots Aer may run in parallel (0 = automatic)
+        """
+        if max_parallel_threads is None:
+            max_parallel_threads = max(1, (os.cpu_count() or 1) // max_workers)
+
+        with self._lock:
+            previous_executor = self._executor
+            self.max_workers = max_workers
+            self.aer_options = {
+                'max_parallel_threads': max_parallel_threads,
+                'max_parallel_experiments': max_parallel_experiments,
+                'max_parallel_shots': max_parallel_shots
+            }
+            if self._backend is not None:
+                self._backend.set_options(**self.aer_options)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix='quantum-backend')
+
+        if previous_executor is not None:
+            previous_executor.shutdown(wait=False)
+
+    @property
+    def backend(self):
+        """The shared simulator backend (None when Qiskit is unavailable)"""
+        if not QISKIT_AVAILABLE:
+            return None
+
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    if AerSimulator is not None:
+                        backend = AerSimulator()
+                    else:
+                        backend = Aer.get_backend('aer_simulator')
+                    backend.set_options(**self.aer_options)
+                    self._backend = backend
+
+        return self._backend
+
+    def submit(self, circuits, backend=None, **run_options):
+        """
+        Submit circuits for execution on a pool worker
+
+        Args:
+            circuits: Circuit or list of circuits to run
+            backend: Optional backend override. Defaults to the shared backend
+            **run_options: Options passed to backend.run (e.g. shots, memory)
+
+        Returns:
+            Future: Resolves to the job's Result
+        """
+        backend = backend or self.backend
+        if backend is None:
+            raise RuntimeError("Qiskit is not available - no simulator backend")
+
+        with self._lock:
+            return self._executor.submit(self._execute, backend, circuits, run_options)
+
+    def run(self, circuits, backend=None, **run_options):
+        """
+        Run circuits through the pool and wait for the result
+
+        Args:
+            circuits: Circuit or list of circuits to run
+            backend: Optional backend override. Defaults to the shared backend
+            **run_options: Options passed to backend.run (e.g. shots, memory)
+
+        Returns:
+            Result: Simulator result for the job
+        """
+        return self.submit(circuits, backend, **run_options).result()
+
+    def shutdown(self, wait=True):
+        """Stop accepting jobs and release the worker threads"""
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _execute(backend, circuits, run_options):
+        """Run one job on the calling worker thread"""
+        return backend.run(circuits, **run_options).result()
+
+
+# Process-wide pool shared by protocol, QRNG and cryptography engine
+_backend_pool = None
+_backend_pool_lock = threading.Lock()
+
+
+def get_backend_pool():
+    """
+    Get the process-wide backend pool, creating it with default settings
+
+    Returns:
+        QuantumBackendPool: The shared pool
+    """
+    global _backend_pool
+    if _backend_pool is None:
+        with _backend_pool_lock:
+            if _backend_pool is None:
+                _backend_pool = QuantumBackendPool()
+    return _backend_pool
+
+
+def configure_backend_pool(**settings):
+    """
+    Reconfigure the process-wide backend pool in place
+
+    Protocol, QRNG and cryptography instances keep their reference to the
+    shared pool and pick up the new settings with their next job. Jobs
+    already submitted are allowed to finish.
+
+    Args:
+        **settings: Keyword arguments for QuantumBackendPool.configure
+
+    Returns:
+        QuantumBackendPool: The shared pool
+    """
+    pool = get_backend_pool()
+    pool.configure(**settings)
+    return pool
@@ -0,0 +1,587 @@
+"""
+Quantum Engines Module - Vectorized NumPy Simulation of the Superdense Protocol
+
+The superdense coding protocol is a fixed two-qubit circuit, so its state
+evolution can be computed exactly with small matrix operations instead of a
+general-purpose circuit simulator. This module evaluates the protocol for
+many messages at once with vectorized NumPy.
+
+Key Features:
+- Exact 4-amplitude state evolution for Bell preparation, I/X/Z/XZ encoding,
+  Pauli (X, Y, Z) and RZ channel errors and Bob's CNOT + H measurement
+- Channel error sampling with the same distribution as
+  SuperdenseCodingProtocol.simulate_transmission
+- Shot counts for a whole batch from a single multinomial draw
+- Pauli-frame sampling of the Clifford channel on packed bit arrays, with
+  the statevector used only for shots carrying a non-Clifford RZ error
+- Density-matrix evaluation with depolarizing, dephasing and amplitude-damping
+  Kraus channels, vectorized across whole arrays of noise levels
+- No Qiskit dependency - runs on machines with only NumPy installed
+
+CONVENTIONS:
+- Messages are (bit0, bit1) pairs; bit0 controls Z and bit1 controls X
+- Outcome columns are indexed by the decoded message: column = 2*bit0 + bit1,
+  i.e. the labels '00', '01', '10', '11' written as "bit0bit1"
+- Pauli error codes: 0 = none, 1 = X, 2 = Y, 3 = Z
+"""
+
+import numpy as np          # Vectorized linear algebra and sampling
+from collections import OrderedDict  # LRU ordering of cached probability tables
+
+# Pauli error codes used for channel error arrays
+PAULI_NONE = 0
+PAULI_X = 1
+PAULI_Y = 2
+PAULI_Z = 3
+
+# Single-qubit Pauli matrices indexed by error code
+PAULI_MATRICES = np.array([
+    [[1, 0], [0, 1]],       # I
+    [[0, 1], [1, 0]],       # X
+    [[0, -1j], [1j, 0]],    # Y
+    [[1, 0], [0, -1]]       # Z
+], dtype=complex)
+
+# Alice's encoding operator Z^bit0 X^bit1 indexed by 2*bit0 + bit1
+ENCODING_MATRICES = np.array([
+    PAULI_MATRICES[PAULI_NONE],                         # 00 → I
+    PAULI_MATRICES[PAULI_X],                            # 01 → X
+    PAULI_MATRICES[PAULI_Z],                            # 10 → Z
+    PAULI_MATRICES[PAULI_Z] @ PAULI_MATRICES[PAULI_X]   # 11 → Z·X (X applied first)
+])
+
+# Hadamard gate used in Bob's Bell measurement
+HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+
+# Relative weights of X, Y and Z errors in the channel model
+CHANNEL_PAULI_WEIGHTS = (0.5, 0.2, 0.3)
+
+
+def sample_channel_errors(noise_levels, rng=None):
+    """
+    Draw channel errors for many transmissions at once
+
+    Mirrors SuperdenseCodingProtocol.simulate_transmission: each qubit suffers
+    an X/Y/Z error with a randomly varying probability, followed by an
+    optional RZ phase error from decoherence.
+
+    Args:
+        noise_levels: Effective noise level for each transmission
+        rng: Optional numpy Generator
+
+    Returns:
+        tuple: (pauli_errors, phase_errors) - (N, 2) int8 Pauli codes and
+        (N, 2) RZ angles in radians (0.0 where no phase error occurred)
+    """
+    rng = rng or np.random.default_rng()
+    noise_levels = np.asarray(noise_levels, dtype=float).reshape(-1)
+    num_messages = len(noise_levels)
+
+    noisy = noise_levels[:, None] > 0
+    base_error_rate = noise_levels * rng.uniform(0.8, 1.2, num_messages)
+    effective_noise = np.minimum(base_error_rate, 0.4)[:, None]
+
+    # Pauli errors, independently per qubit
+    error_probability = effective_noise * rng.uniform(0.5, 1.5, (num_messages, 2))
+    has_error = noisy & (rng.random((num_messages, 2)) < error_probability)
+    error_types = rng.choice([PAULI_X, PAULI_Y, PAULI_Z], size=(num_messages, 2),
+                             p=CHANNEL_PAULI_WEIGHTS)
+    pauli_errors = np.where(has_error, error_types, PAULI_NONE).astype(np.int8)
+
+    # Additional decoherence as RZ phase errors
+    phase_probability = effective_noise * rng.uniform(0.1, 0.3, (num_messages, 2))
+    has_phase = noisy & (rng.random((num_messages, 2)) < phase_probability)
+    phase_angles = rng.uniform(0, np.pi / 6, (num_messages, 2)) * (1 + noise_levels[:, None])
+    phase_errors = np.where(has_phase, phase_angles, 0.0)
+
+    return pauli_errors, phase_errors
+
+
+class AnalyticProtocolEngine:
+    """
+    Exact statevector engine for the two-qubit superdense coding circuit
+
+    States are stored as (N, 2, 2) arrays indexed [message, qubit1, qubit0],
+    matching Qiskit's little-endian ordering. Every step of the protocol is
+    a batched 2x2 matrix product, so thousands of messages are evaluated in
+    a handful of NumPy calls.
+
+    Attributes:
+        rng: Random generator used for channel errors and shot sampling
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize the analytic engine
+
+        Args:
+            seed: Optional seed for reproducible sampling
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def final_states(self, pairs, pauli_errors=None, phase_errors=None):
+        """
+        Compute the two-qubit state just before Bob's measurement
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            pauli_errors: Optional (N, 2) Pauli codes for qubits 0 and 1
+            phase_errors: Optional (N, 2) RZ angles for qubits 0 and 1
+
+        Returns:
+            np.ndarray: (N, 2, 2) complex amplitudes indexed [n, qubit1, qubit0]
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        num_messages = len(pairs)
+
+        # Alice's qubit (0): encoding, then channel Pauli error, then RZ
+        # Bob's qubit (1): channel Pauli error, then RZ
+        qubit0_ops = ENCODING_MATRICES[2 * pairs[:, 0] + pairs[:, 1]]
+        qubit1_ops = np.broadcast_to(PAULI_MATRICES[PAULI_NONE], (num_messages, 2, 2))
+
+        if pauli_errors is not None:
+            pauli_errors = np.asarray(pauli_errors, dtype=np.int64).reshape(-1, 2)
+            qubit0_ops = PAULI_MATRICES[pauli_errors[:, 0]] @ qubit0_ops
+            qubit1_ops = PAULI_MATRICES[pauli_errors[:, 1]]
+
+        if phase_errors is not None:
+            # RZ(θ) = diag(e^{-iθ/2}, e^{iθ/2}) scales the rows of the operator
+            phase_errors = np.asarray(phase_errors, dtype=float).reshape(-1, 2)
+            half_angles = 0.5j * phase_errors[:, :, None] * np.array([-1, 1])
+            rz_diagonals = np.exp(half_angles)
+            qubit0_ops = rz_diagonals[:, 0, :, None] * qubit0_ops
+            qubit1_ops = rz_diagonals[:, 1, :, None] * qubit1_ops
+
+        # Bell state |Φ+⟩ as a 2x2 amplitude matrix is I/√2, so applying
+        # A1 ⊗ A0 gives psi[q1, q0] = (A1 · A0^T)[q1, q0] / √2
+        return qubit1_ops @ np.swapaxes(qubit0_ops, 1, 2) / np.sqrt(2)
+
+    def outcome_probabilities(self, pairs, pauli_errors=None, phase_errors=None):
+        """
+        Exact Bell measurement outcome probabilities
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            pauli_errors: Optional (N, 2) Pauli codes for qubits 0 and 1
+            phase_errors: Optional (N, 2) RZ angles for qubits 0 and 1
+
+        Returns:
+            np.ndarray: (N, 4) probabilities, column = 2*bit0 + bit1 of the decoded message
+        """
+        psi = self.final_states(pairs, pauli_errors, phase_errors)
+
+        # Bob's CNOT (control qubit 0, target qubit 1) swaps the qubit1 rows
+        # of the qubit0 = 1 column, then H on qubit 0 mixes the columns
+        phi = psi.copy()
+        phi[:, :, 1] = psi[:, ::-1, 1]
+        chi = phi @ HADAMARD
+
+        # Measured qubit0 is bit0 and qubit1 is bit1 → reorder to [n, bit0, bit1]
+        probabilities = np.abs(np.swapaxes(chi, 1, 2)) ** 2
+        return probabilities.reshape(-1, 4)
+
+    def sample_counts(self, pairs, noise_levels=0.0, shots=1024):
+        """
+        Sample measurement counts for a batch of noisy transmissions
+
+        Channel errors are drawn once per transmission (as one circuit run
+        would), and the shots of every message come from one multinomial draw.
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            noise_levels: Scalar or per-message effective noise level
+            shots: Number of measurements per message
+
+        Returns:
+            np.ndarray: (N, 4) int64 counts, column = 2*bit0 + bit1
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        noise_levels = np.broadcast_to(np.asarray(noise_levels, dtype=float), (len(pairs),))
+
+        pauli_errors, phase_errors = sample_channel_errors(noise_levels, self.rng)
+        probabilities = self.outcome_probabilities(pairs, pauli_errors, phase_errors)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+        return self.rng.multinomial(shots, probabilities).astype(np.int64)
+
+
+# X and Z components of each Pauli error code (Y = X·Z up to phase)
+PAULI_X_COMPONENT = np.array([0, 1, 1, 0], dtype=np.uint8)
+PAULI_Z_COMPONENT = np.array([0, 0, 1, 1], dtype=np.uint8)
+
+# Number of set bits in every byte value, for counting packed shots
+POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+
+class PauliFrameSampler:
+    """
+    Pauli-frame sampler for the Clifford part of the superdense channel
+
+    Apart from the optional RZ phase error, every gate in the protocol and
+    every channel error is Clifford, so the effect of an error is fully
+    described by which measured bits it flips. Error frames (X and Z
+    components per qubit) are propagated through Bob's CNOT + H as packed
+    bit arrays, eight shots per byte. Only transmissions or shots that
+    carry an RZ error are evaluated with the statevector engine.
+
+    Attributes:
+        rng: Random generator for channel errors and sampling
+        statevector_engine: AnalyticProtocolEngine used for RZ errors
+    """
+
+    # Shots processed per chunk in sample_shots, bounding peak memory
+    CHUNK_SHOTS = 1 << 20
+
+    def __init__(self, seed=None, statevector_engine=None):
+        """
+        Initialize the Pauli-frame sampler
+
+        Args:
+            seed: Optional seed for reproducible sampling
+            statevector_engine: Optional engine for non-Clifford (RZ) cases
+        """
+        self.rng = np.random.default_rng(seed)
+        self.statevector_engine = statevector_engine or AnalyticProtocolEngine(seed)
+
+    @staticmethod
+    def propagate_frames(x0, z0, x1, z1):
+        """
+        Propagate channel error frames through Bob's Bell measurement
+
+        CNOT(0→1) maps x1 ^= x0 and z0 ^= z1, then H on qubit 0 swaps x0 and
+        z0. A measured bit flips when its qubit ends with an X component.
+        Works element-wise on boolean arrays and on packed uint8 bit arrays.
+
+        Args:
+            x0, z0: X and Z components of the error on qubit 0 (Alice)
+            x1, z1: X and Z components of the error on qubit 1 (Bob)
+
+        Returns:
+            tuple: (flip_bit0, flip_bit1) bit flips of the decoded message
+        """
+        return z0 ^ z1, x0 ^ x1
+
+    def sample_counts(self, pairs, noise_levels=0.0, shots=1024):
+        """
+        Sample measurement counts with one channel error draw per transmission
+
+        Same statistics as AnalyticProtocolEngine.sample_counts: a Pauli-only
+        transmission is deterministic, so all of its shots land on the
+        flipped message; transmissions with an RZ error use the statevector.
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            noise_levels: Scalar or per-message effective noise level
+            shots: Number of measurements per message
+
+        Returns:
+            np.ndarray: (N, 4) int64 counts, column = 2*bit0 + bit1
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        noise_levels = np.broadcast_to(np.asarray(noise_levels, dtype=float), (len(pairs),))
+        pauli_errors, phase_errors = sample_channel_errors(noise_levels, self.rng)
+
+        flip_bit0, flip_bit1 = self.propagate_frames(
+            PAULI_X_COMPONENT[pauli_errors[:, 0]], PAULI_Z_COMPONENT[pauli_errors[:, 0]],
+            PAULI_X_COMPONENT[pauli_errors[:, 1]], PAULI_Z_COMPONENT[pauli_errors[:, 1]])
+        decoded_index = 2 * (pairs[:, 0] ^ flip_bit0) + (pairs[:, 1] ^ flip_bit1)
+
+        counts = np.zeros((len(pairs), 4), dtype=np.int64)
+        counts[np.arange(len(pairs)), decoded_index] = shots
+
+        # Non-Clifford transmissions fall back to the exact statevector
+        has_phase = (phase_errors != 0).any(axis=1)
+        if has_phase.any():
+            probabilities = self.statevector_engine.outcome_probabilities(
+                pairs[has_phase], pauli_errors[has_phase], phase_errors[has_phase])
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            counts[has_phase] = self.rng.multinomial(shots, probabilities)
+
+        return counts
+
+    def sample_shots(self, bit0, bit1, noise_level, num_shots):
+        """
+        Sample many independent channel uses of one message
+
+        Every shot draws its own channel errors, which is the model needed
+        for large-shot statistical studies. Frames are packed eight shots per
+        byte, propagated with XOR and counted with a popcount table.
+
+        Args:
+            bit0: First bit of message
+            bit1: Second bit of message
+            noise_level: Effective channel noise level
+            num_shots: Number of independent shots
+
+        Returns:
+            np.ndarray: (4,) int64 counts, column = 2*bit0 + bit1 of the decoded message
+        """
+        counts = np.zeros(4, dtype=np.int64)
+        message_index = 2 * bit0 + bit1
+
+        for chunk_start in range(0, num_shots, self.CHUNK_SHOTS):
+            chunk_shots = min(self.CHUNK_SHOTS, num_shots - chunk_start)
+            pauli_errors, phase_errors = sample_channel_errors(
+                np.full(chunk_shots, float(noise_level)), self.rng)
+            has_phase = (phase_errors != 0).any(axis=1)
+
+            # Packed error frames for the Clifford-only shots
+            clifford = np.packbits(~has_phase)
+            x0, z0, x1, z1 = (np.packbits(component[pauli_errors[:, qubit]])
+                              for qubit in (0, 1)
+                              for component in (PAULI_X_COMPONENT, PAULI_Z_COMPONENT))
+            flip_bit0, flip_bit1 = self.propagate_frames(x0, z0, x1, z1)
+            flip_bit0 &= clifford
+            flip_bit1 &= clifford
+
+            clifford_shots = chunk_shots - int(has_phase.sum())
+            flips_bit0 = int(POPCOUNT_TABLE[flip_bit0].sum())
+            flips_bit1 = int(POPCOUNT_TABLE[flip_bit1].sum())
+            flips_both = int(POPCOUNT_TABLE[flip_bit0 & flip_bit1].sum())
+
+            # Outcome = message XOR (flip_bit0, flip_bit1)
+            counts[message_index] += clifford_shots - flips_bit0 - flips_bit1 + flips_both
+            counts[message_index ^ 2] += flips_bit0 - flips_both
+            counts[message_index ^ 1] += flips_bit1 - flips_both
+            counts[message_index ^ 3] += flips_both
+
+            # Shots with an RZ error: one outcome each from the exact statevector
+            if has_phase.any():
+                phase_shots = int(has_phase.sum())
+                probabilities = self.statevector_engine.outcome_probabilities(
+                    np.tile([bit0, bit1], (phase_shots, 1)),
+                    pauli_errors[has_phase], phase_errors[has_phase])
+                cumulative = np.cumsum(probabilities, axis=1)
+                draws = self.rng.random((phase_shots, 1)) * cumulative[:, -1:]
+                outcomes = np.minimum((draws > cumulative).sum(axis=1), 3)
+                counts += np.bincount(outcomes, minlength=4)
+
+        return counts
+
+
+def depolarizing_kraus(probabilities):
+    """
+    Kraus operators of the single-qubit depolarizing channel
+
+    ρ → (1 - p)·ρ + p·I/2, written as weights on the fixed Pauli matrices.
+
+    Args:
+        probabilities: Depolarizing probability p for each noise level
+
+    Returns:
+        np.ndarray: (L, 4, 2, 2) Kraus operators
+    """
+    p = np.clip(np.asarray(probabilities, dtype=float).reshape(-1), 0.0, 1.0)
+    weights = np.sqrt(np.stack([1 - 0.75 * p, p / 4, p / 4, p / 4], axis=1))
+    return weights[:, :, None, None] * PAULI_MATRICES
+
+
+def dephasing_kraus(probabilities):
+    """
+    Kraus operators of the single-qubit dephasing (phase-flip) channel
+
+    ρ → (1 - p)·ρ + p·ZρZ
+
+    Args:
+        probabilities: Phase-flip probability p for each noise level
+
+    Returns:
+        np.ndarray: (L, 2, 2, 2) Kraus operators
+    """
+    p = np.clip(np.asarray(probabilities, dtype=float).reshape(-1), 0.0, 1.0)
+    weights = np.sqrt(np.stack([1 - p, p], axis=1))
+    return weights[:, :, None, None] * PAULI_MATRICES[[PAULI_NONE, PAULI_Z]]
+
+
+def amplitude_damping_kraus(gammas):
+    """
+    Kraus operators of the single-qubit amplitude-damping channel
+
+    Models energy relaxation |1⟩ → |0⟩ with probability γ.
+
+    Args:
+        gammas: Damping probability γ for each noise level
+
+    Returns:
+        np.ndarray: (L, 2, 2, 2) Kraus operators
+    """
+    gamma = np.clip(np.asarray(gammas, dtype=float).reshape(-1), 0.0, 1.0)
+    kraus = np.zeros((len(gamma), 2, 2, 2), dtype=complex)
+    kraus[:, 0, 0, 0] = 1.0
+    kraus[:, 0, 1, 1] = np.sqrt(1 - gamma)
+    kraus[:, 1, 0, 1] = np.sqrt(gamma)
+    return kraus
+
+
+def apply_kraus_channel(density_matrices, kraus, qubit):
+    """
+    Apply a single-qubit channel to one qubit of batched two-qubit states
+
+    ρ → Σ_k K_k ρ K_k†, with one set of Kraus operators per noise level.
+
+    Args:
+        density_matrices: (L, M, 2, 2, 2, 2) states indexed [l, m, q1, q0, q1', q0']
+        kraus: (L, K, 2, 2) Kraus operators for each noise level
+        qubit: Qubit the channel acts on (0 = Alice, 1 = Bob)
+
+    Returns:
+        np.ndarray: (L, M, 2, 2, 2, 2) transformed density matrices
+    """
+    if qubit == 0:
+        subscripts = 'lkab,lmxbyc,lkdc->lmxayd'
+    else:
+        subscripts = 'lkab,lmbxcy,lkdc->lmaxdy'
+    return np.einsum(subscripts, kraus, density_matrices, kraus.conj(), optimize=True)
+
+
+# Bob's Bell measurement unitary: CNOT(0→1) then H on qubit 0 (index = 2*q1 + q0)
+CNOT_01 = np.eye(4, dtype=complex)[[0, 3, 2, 1]]
+BELL_MEASUREMENT = np.kron(np.eye(2), HADAMARD) @ CNOT_01
+
+# Reorder measured index 2*q1 + q0 into decoded message column 2*bit0 + bit1
+QUBIT_TO_MESSAGE_ORDER = [0, 2, 1, 3]
+
+
+class DensityMatrixEngine:
+    """
+    Density-matrix engine with parameterized Kraus channels on both qubits
+
+    Each transmission applies depolarizing, dephasing and amplitude-damping
+    channels to both qubits after Alice's encoding. The channel strengths are
+    the protocol noise level scaled by per-channel factors. Everything is
+    vectorized across an array of noise levels, and the result is the exact
+    probability of each decoded message, which can be used directly or
+    sampled from.
+
+    Attributes:
+        channel_strengths: Scale factor for each channel relative to the noise level
+        rng: Random generator used for shot sampling
+    """
+
+    # Noise levels processed per chunk, bounding the (L, 4, 4, 4) density matrices
+    CHUNK_LEVELS = 16384
+
+    # Maximum number of cached per-level probability tables (least recently used evicted)
+    TABLE_CACHE_SIZE = 4096
+
+    # Kraus operator builders for each supported channel
+    KRAUS_CHANNELS = {
+        'depolarizing': depolarizing_kraus,
+        'dephasing': dephasing_kraus,
+        'amplitude_damping': amplitude_damping_kraus
+    }
+
+    def __init__(self, depolarizing=1.0, dephasing=0.0, amplitude_damping=0.0, seed=None):
+        """
+        Initialize the density-matrix engine
+
+        Args:
+            depolarizing: Depolarizing probability per unit of noise level
+            dephasing: Phase-flip probability per unit of noise level
+            amplitude_damping: Damping probability per unit of noise level
+            seed: Optional seed for reproducible sampling
+        """
+        self.channel_strengths = {
+            'depolarizing': depolarizing,
+            'dephasing': dephasing,
+            'amplitude_damping': amplitude_damping
+        }
+        self.rng = np.random.default_rng(seed)
+        self._table_cache = OrderedDict()
+
+        # Noiseless density matrices of the four encoded Bell states
+        encoded_states = AnalyticProtocolEngine().final_states(
+            [[0, 0], [0, 1], [1, 0], [1, 1]]).reshape(4, 4)
+        self._encoded_density = np.einsum('mi,mj->mij', encoded_states, encoded_states.conj())
+
+    def transmitted_density_matrices(self, noise_levels):
+        """
+        Density matrices of the four encoded states after the channel
+
+        Args:
+            noise_levels: Array of protocol noise levels
+
+        Returns:
+            np.ndarray: (L, 4, 4, 4) states indexed [level, sent message, row, column]
+        """
+        noise_levels = np.asarray(noise_levels, dtype=float).reshape(-1)
+        density_matrices = np.broadcast_to(self._encoded_density.reshape(1, 4, 2, 2, 2, 2),
+                                           (len(noise_levels), 4, 2, 2, 2, 2))
+
+        for channel, strength in self.channel_strengths.items():
+            if strength == 0:
+                continue
+            kraus = self.KRAUS_CHANNELS[channel](strength * noise_levels)
+            for qubit in (0, 1):
+                density_matrices = apply_kraus_channel(density_matrices, kraus, qubit)
+
+        return density_matrices.reshape(len(noise_levels), 4, 4, 4)
+
+    def probability_table(self, noise_levels):
+        """
+        Exact outcome probabilities of every message at every noise level
+
+        Args:
+            noise_levels: Array of protocol noise levels
+
+        Returns:
+            np.ndarray: (L, 4, 4) probabilities indexed [level, sent message, decoded message]
+        """
+        noise_levels = np.asarray(noise_levels, dtype=float).reshape(-1)
+        unique_levels, inverse = np.unique(noise_levels, return_inverse=True)
+        tables = np.empty((len(unique_levels), 4, 4))
+
+        missing = []
+        for i, level in enumerate(unique_levels):
+            if level in self._table_cache:
+                tables[i] = self._table_cache[level]
+                self._table_cache.move_to_end(level)
+            else:
+                missing.append(i)
+
+        for chunk_start in range(0, len(missing), self.CHUNK_LEVELS):
+            chunk = missing[chunk_start:chunk_start + self.CHUNK_LEVELS]
+            density_matrices = self.transmitted_density_matrices(unique_levels[chunk])
+            # Probability of basis state k is ⟨k| U ρ U† |k⟩ for Bell measurement U
+            chunk_tables = np.einsum('ki,lmij,kj->lmk', BELL_MEASUREMENT, density_matrices,
+                                     BELL_MEASUREMENT.conj(), optimize=True).real
+            tables[chunk] = chunk_tables[:, :, QUBIT_TO_MESSAGE_ORDER]
+
+        for i in missing[-self.TABLE_CACHE_SIZE:]:
+            self._table_cache[unique_levels[i]] = tables[i]
+        while len(self._table_cache) > self.TABLE_CACHE_SIZE:
+            self._table_cache.popitem(last=False)
+
+        return tables[inverse.reshape(-1)]
+
+    def outcome_probabilities(self, pairs, noise_levels=0.0):
+        """
+        Exact outcome probabilities for a batch of messages
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            noise_levels: Scalar or per-message noise level
+
+        Returns:
+            np.ndarray: (N, 4) probabilities, column = 2*bit0 + bit1 of the decoded message
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        noise_levels = np.broadcast_to(np.asarray(noise_levels, dtype=float), (len(pairs),))
+        tables = self.probability_table(noise_levels)
+        return tables[np.arange(len(pairs)), 2 * pairs[:, 0] + pairs[:, 1]]
+
+    def sample_counts(self, pairs, noise_levels=0.0, shots=1024):
+        """
+        Sample measurement counts from the exact outcome probabilities
+
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            noise_levels: Scalar or per-message noise level
+            shots: Number of measurements per message
+
+        Returns:
+            np.ndarray: (N, 4) int64 counts, column = 2*bit0 + bit1
+        """
+        probabilities = np.clip(self.outcome_probabilities(pairs, noise_levels), 0.0, None)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return self.rng.multinomial(shots, probabilities).astype(np.int64)
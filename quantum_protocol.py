@@ -16,27 +16,77 @@ Key Features:
 """
 
 # Import required libraries for quantum computing and classical operations
+import os                   # Worker process identifiers
 import numpy as np          # Numerical computations and array operations
 import time                 # Time-based operations and delays  
 import hashlib              # Cryptographic hashing functions
+import hmac                 # Constant-time authentication tag comparison
+import threading            # Locking for process-wide caches
 from datetime import datetime  # Date and time handling
+from collections import OrderedDict  # LRU ordering of cached noise models
+from concurrent.futures import ProcessPoolExecutor  # Parallel bulk encryption
+from concurrent.futures.process import BrokenProcessPool  # Dead bulk worker detection
+from multiprocessing import shared_memory  # Large payloads without pickling
 
 # Qiskit imports with proper fallback handling
 # This allows the code to work even if Qiskit is not installed
 try:
     from qiskit import QuantumCircuit  # Quantum circuit construction
-    from qiskit_aer import Aer         # Quantum simulator backend
     from qiskit import transpile       # Circuit optimization and compilation
+    from qiskit.circuit import Parameter  # Run-time bound phase error angles
+    from qiskit.circuit.library import IGate, RZGate  # Channel marker and phase error gates
+    from qiskit_aer.noise import NoiseModel, pauli_error, mixed_unitary_error  # Channel noise
     QISKIT_AVAILABLE = True
 except ImportError:
     # Try older Qiskit API as fallback
     try:
-        from qiskit import QuantumCircuit, Aer, execute
+        from qiskit import QuantumCircuit, transpile
+        from qiskit.circuit import Parameter
+        from qiskit.circuit.library import IGate, RZGate
+        from qiskit.providers.aer.noise import NoiseModel, pauli_error, mixed_unitary_error
         QISKIT_AVAILABLE = True
     except ImportError:
         # No Qiskit available - use classical simulation only
         QISKIT_AVAILABLE = False
 
+from quantum_backend import get_backend_pool  # Shared simulator backend and job pool
+from entropy_pool import QuantumEntropyPool   # Buffered randomness with background refill
+from entropy_reservoir import ENTROPY_RESERVOIR_PATH, get_entropy_reservoir  # Persistent randomness
+from entropy_daemon import ENTROPY_DAEMON_SOCKET, EntropyDaemonClient  # Shared QRNG daemon
+from bit_buffer import (as_byte_array, pack_bit_string, unpack_bits,  # Shared bit packing
+                        xor_bytes, bits_to_bytes, bytes_to_bits)
+from key_derivation import CounterModeKeyStream  # Counter-mode keystream expansion
+from session_store import SessionKeyStore       # Bounded session key storage
+from audit_log import get_audit_log             # Append-only rotating audit logs
+from randomness_tests import run_randomness_tests, symbol_entropy  # Vectorized quality checks
+from health_tests import EntropyHealthMonitor   # Continuous SP 800-90B health tests
+from running_stats import MetricHistory         # Constant-time entropy statistics
+from quantum_engines import (AnalyticProtocolEngine, PauliFrameSampler,  # Vectorized NumPy
+                             DensityMatrixEngine)                         # protocol simulation
+
+# Column order of the (N, 4) measurement count matrix returned by batch execution.
+# Each label is a decoded message written as "bit0bit1" (column = 2*bit0 + bit1).
+BATCH_MEASUREMENT_STATES = ('00', '01', '10', '11')
+
+# Label of the identity markers where the channel NoiseModel acts on both qubits
+TRANSMISSION_LABEL = 'transmission'
+
+# Per-qubit RZ phase error angles of the parameterized transmission circuits
+PHASE_ERROR_PARAMETERS = ((Parameter('phase_error_0'), Parameter('phase_error_1'))
+                          if QISKIT_AVAILABLE else ())
+
+# Execution engines selectable per protocol call:
+# - 'aer': Qiskit Aer circuit simulation
+# - 'analytic': exact vectorized NumPy statevector evolution (no Qiskit needed)
+# - 'pauli_frame': Clifford error-frame propagation, statevector only for RZ errors
+# - 'density_matrix': exact probabilities under depolarizing/dephasing/damping Kraus channels
+PROTOCOL_ENGINES = ('aer', 'analytic', 'pauli_frame', 'density_matrix')
+
+# Noise levels are rounded to this many decimals before a NoiseModel is built,
+# and at most NOISE_MODEL_CACHE_SIZE models are kept (least recently used evicted)
+NOISE_MODEL_DECIMALS = 4
+NOISE_MODEL_CACHE_SIZE = 64
+
 class QuantumRandomGenerator:
     """
     Quantum Random Number Generator using quantum superposition and measurement
@@ -48,94 +98,169 @@ class QuantumRandomGenerator:
     
     Attributes:
         backend: Quantum simulator backend for quantum operations
-        entropy_pool: Storage for generated random values
+        backend_pool: Shared pool through which simulator jobs are submitted
+        entropy_pool: Background-refilled buffer of quantum random bytes
+        entropy_reservoir: Optional persistent file feeding the entropy pool
+        entropy_daemon: Optional daemon client feeding the entropy pool
+        health_monitor: Continuous health tests and quarantine of entropy sources
         seed_counter: Counter for tracking entropy generation
     """
     
-    def __init__(self, backend=None):
+    # Qubits measured per experiment of an entropy batch
+    ENTROPY_QUBITS = 16
+    # Default entropy pool sizing in bytes; the pool grows up to
+    # ENTROPY_POOL_MAX_CAPACITY to keep ENTROPY_POOL_TARGET_SECONDS of reads ready
+    ENTROPY_POOL_CAPACITY = 65536
+    ENTROPY_POOL_MAX_CAPACITY = 1 << 19
+    ENTROPY_POOL_TARGET_SECONDS = 1.0
+    ENTROPY_REFILL_CHUNK = 16384
+
+    # Transpiled Hadamard circuits shared by all generators, keyed by
+    # (backend name, number of qubits)
+    _entropy_circuits = {}
+    _entropy_circuits_lock = threading.Lock()
+
+    def __init__(self, backend=None, backend_pool=None, entropy_pool=None, entropy_reservoir=None,
+                 entropy_daemon=None):
         """
         Initialize the quantum random number generator
         
         Args:
-            backend: Optional quantum backend. Defaults to qasm_simulator
+            backend: Optional quantum backend. Defaults to the shared simulator
+            backend_pool: Optional job pool. Defaults to the process-wide pool
+            entropy_pool: Optional QuantumEntropyPool. Defaults to a pool refilled
+                from batched quantum jobs on this generator's backend
+            entropy_reservoir: Optional EntropyReservoir the default pool is
+                refilled from. Defaults to the shared reservoir at
+                ENTROPY_RESERVOIR_PATH when that is set
+            entropy_daemon: Optional EntropyDaemonClient the default pool is
+                refilled from, falling back to in-process generation.
+                Defaults to a client of ENTROPY_DAEMON_SOCKET when that is set
         """
-        # Set up quantum backend with fallback to default simulator
-        self.backend = backend or Aer.get_backend('qasm_simulator')
-        self.entropy_pool = []      # Store generated random bits
+        # Set up quantum backend with fallback to the shared simulator
+        self.backend_pool = backend_pool or get_backend_pool()
+        self.backend = backend or self.backend_pool.backend
+        self.health_monitor = EntropyHealthMonitor()  # Tests every refill batch
+        
+        # Bytes left in the reservoir file by earlier processes are served
+        # first, so a cold start does not wait for quantum jobs
+        if entropy_reservoir is None and ENTROPY_RESERVOIR_PATH:
+            entropy_reservoir = get_entropy_reservoir(ENTROPY_RESERVOIR_PATH, self.generate_entropy_batch)
+        self.entropy_reservoir = entropy_reservoir
+        local_source = entropy_reservoir.read if entropy_reservoir else self.generate_entropy_batch
+        
+        # A local entropy daemon takes over generation; in-process sources
+        # are only used while it is unreachable
+        if entropy_daemon is None and ENTROPY_DAEMON_SOCKET:
+            entropy_daemon = EntropyDaemonClient(ENTROPY_DAEMON_SOCKET, local_source)
+        self.entropy_daemon = entropy_daemon
+        self.entropy_pool = entropy_pool or QuantumEntropyPool(  # Buffered random bytes
+            entropy_daemon.read if entropy_daemon else local_source,
+            capacity=self.ENTROPY_POOL_CAPACITY,
+            refill_chunk=self.ENTROPY_REFILL_CHUNK,
+            target_seconds=self.ENTROPY_POOL_TARGET_SECONDS,
+            max_capacity=self.ENTROPY_POOL_MAX_CAPACITY)
         self.seed_counter = 0       # Track number of generations
         
+    def harvest_quantum_bits(self, num_qubits=None, shots=1024):
+        """
+        Harvest every measured bit of a single quantum job
+        
+        The Hadamard circuit is run once with per-shot memory, so all
+        num_qubits x shots outcomes are kept in the order they were measured
+        instead of being aggregated into counts. The bits are packed
+        directly into a uint8 buffer, most significant bit first.
+        
+        Args:
+            num_qubits (int): Qubits per shot (default ENTROPY_QUBITS)
+            shots (int): Number of shots in the job
+            
+        Returns:
+            np.ndarray: uint8 array holding num_qubits * shots packed bits
+        """
+        num_qubits = num_qubits or self.ENTROPY_QUBITS
+        circuit = self._get_entropy_circuit(num_qubits)
+        result = self.backend_pool.run(circuit, self.backend, shots=shots, memory=True)
+        self.seed_counter += 1
+        
+        # One bit string per shot, packed without a per-bit Python loop
+        return pack_bit_string(''.join(result.get_memory()).replace(' ', ''))
+    
+    def generate_entropy_batch(self, num_bytes):
+        """
+        Generate a batch of random bytes in a single quantum job
+        
+        This is the refill source of the entropy pool. Enough shots are
+        requested from harvest_quantum_bits to cover num_bytes in one job.
+        Every batch goes through the continuous health tests; a failing
+        batch is discarded and the quantum source is quarantined, during
+        which batches come from the classical fallback instead. The fallback
+        is tested the same way; when neither source is healthy no bytes are
+        returned at all.
+        
+        Args:
+            num_bytes (int): Number of random bytes to generate
+            
+        Returns:
+            bytes: Random bytes (cryptographically secure fallback without Qiskit)
+            
+        Raises:
+            RuntimeError: If both sources are quarantined or failing
+        """
+        import secrets
+        if QISKIT_AVAILABLE and self.backend is not None and not self.health_monitor.is_quarantined('quantum'):
+            try:
+                shots = -(-num_bytes * 8 // self.ENTROPY_QUBITS)
+                batch = self.harvest_quantum_bits(self.ENTROPY_QUBITS, shots)[:num_bytes].tobytes()
+                if self.health_monitor.check('quantum', batch):
+                    return batch
+            except Exception as e:
+                # Fallback to classical randomness if quantum generation fails
+                pass
+        
+        if not self.health_monitor.is_quarantined('fallback'):
+            batch = secrets.token_bytes(num_bytes)
+            if self.health_monitor.check('fallback', batch):
+                return batch
+        raise RuntimeError("No healthy entropy source: quantum and fallback output "
+                           "failed the continuous health tests")
+    
     def generate_quantum_random_bits(self, num_bits, shots=1024):
         """
         Generate truly random bits using quantum superposition
         
-        This method creates a quantum circuit with Hadamard gates to put
-        qubits in superposition, then measures them to get random bits.
-        Each measurement has a 50% probability of being 0 or 1.
+        Bits are read from the entropy pool, which is refilled in the
+        background by batched Hadamard-measurement jobs (see
+        generate_entropy_batch), so a call costs a buffer read.
         
         Args:
             num_bits (int): Number of random bits to generate
-            shots (int): Number of quantum measurements to perform
+            shots (int): Kept for compatibility; the pool sizes its own jobs
             
         Returns:
             list: List of random bits (0s and 1s)
         """
-        # Fallback to classical randomness for large requests or no Qiskit
-        if not QISKIT_AVAILABLE or num_bits > 20:  # Limit to prevent coupling map issues
-            # Use cryptographically secure pseudorandom generation
-            import secrets
-            return [secrets.randbelow(2) for _ in range(num_bits)]
+        random_bytes = self.entropy_pool.read(-(-num_bits // 8))
+        return unpack_bits(random_bytes, num_bits).tolist()
+    
+    def generate_quantum_bytes(self, num_bytes):
+        """
+        Read a block of quantum random bytes from the entropy pool
         
-        # For small numbers of bits, use quantum generation
-        try:
-            # Create quantum circuit for random number generation
-            qc = QuantumCircuit(num_bits, num_bits)
-            
-            # Apply Hadamard gates to create superposition
-            # Each qubit becomes |0⟩ + |1⟩ with equal probability
-            for i in range(num_bits):
-                qc.h(i)  # Hadamard gate creates superposition
-            
-            # Add quantum measurement to collapse superposition
-            # This converts quantum superposition to classical random bits
-            qc.measure_all()
-            
-            # Execute circuit on quantum simulator
-            transpiled_qc = transpile(qc, self.backend)  # Optimize for backend
-            job = self.backend.run(transpiled_qc, shots=shots)  # Run simulation
-            result = job.result()  # Get execution results
-            counts = result.get_counts()  # Get measurement statistics
-            
-            # Extract random bits from measurement results
-            # The quantum measurement naturally provides true randomness
-            random_bits = []
-            total_measurements = sum(counts.values())
-            
-            # Process measurement outcomes to extract random bits
-            for bit_string, count in counts.items():
-                probability = count / total_measurements
-                # Use quantum measurement statistics for true randomness
-                for _ in range(count):
-                    if len(random_bits) < num_bits:
-                        # Extract individual bits with quantum bias
-                        for bit in bit_string:
-                            if len(random_bits) < num_bits:
-                                random_bits.append(int(bit))
-            
-            # Return exactly the requested number of random bits
-            return random_bits[:num_bits]
+        Callers that need several random values should request them together
+        and slice the result, so one pool read covers the whole budget.
+        
+        Args:
+            num_bytes (int): Number of random bytes
             
-        except Exception as e:
-            # Fallback to classical randomness if quantum generation fails
-            # This ensures the system remains functional even with quantum errors
-            import secrets
-            return [secrets.randbelow(2) for _ in range(num_bits)]
+        Returns:
+            bytes: Quantum random bytes
+        """
+        return self.entropy_pool.read(num_bytes)
     
     def generate_quantum_key(self, key_length=256):
         """
-        Generate quantum cryptographic key using multiple small quantum generations
-        
-        For large keys, this method uses a hybrid approach to overcome
-        quantum hardware limitations while still incorporating quantum randomness.
+        Generate quantum cryptographic key from the entropy pool
         
         Args:
             key_length (int): Length of key in bits (default 256)
@@ -143,48 +268,16 @@ class QuantumRandomGenerator:
         Returns:
             bytes: Cryptographic key derived from quantum randomness
         """
-        if key_length > 160:  # For larger keys, use hybrid approach
-            # Generate smaller quantum chunks and combine
-            # This avoids qubit limitations while maintaining quantum security
-            quantum_chunks = []
-            chunk_size = 16  # Small quantum generations to stay within limits
-            
-            # Generate quantum chunks up to hardware limits
-            for i in range(0, min(64, key_length), chunk_size):
-                chunk = self.generate_quantum_random_bits(chunk_size)
-                quantum_chunks.extend(chunk)
-            
-            # Fill remainder with secure random if needed
-            # This hybrid approach maintains security while being practical
-            if len(quantum_chunks) < key_length:
-                import secrets
-                remaining = key_length - len(quantum_chunks)
-                quantum_chunks.extend([secrets.randbelow(2) for _ in range(remaining)])
-            
-            key_bits = quantum_chunks[:key_length]
-        else:
-            # Use pure quantum generation for smaller keys
-            key_bits = self.generate_quantum_random_bits(key_length)
-        
-        # Convert bit array to bytes for cryptographic use
-        # Pack 8 bits into each byte following standard conventions
-        key_bytes = bytearray()
-        for i in range(0, len(key_bits), 8):
-            byte_bits = key_bits[i:i+8]
-            if len(byte_bits) == 8:
-                # Convert 8 bits to byte value (big-endian)
-                byte_value = sum(bit * (2 ** (7-j)) for j, bit in enumerate(byte_bits))
-                key_bytes.append(byte_value)
-        
-        return bytes(key_bytes)
+        # Whole bytes only, matching the previous bit-packing behaviour
+        return self.entropy_pool.read(key_length // 8)
     
     def generate_quantum_nonce(self, length=16):
         """
-        Generate quantum nonce for encryption using small quantum chunks
+        Generate quantum nonce for encryption from the entropy pool
         
         A nonce (number used once) is critical for encryption security.
-        This method generates cryptographically secure nonces using
-        quantum randomness in manageable chunks.
+        Pool bytes are handed out exactly once, so nonces never share
+        randomness with keys or other nonces.
         
         Args:
             length (int): Length of nonce in bytes (default 16)
@@ -192,25 +285,24 @@ class QuantumRandomGenerator:
         Returns:
             bytes: Quantum-generated nonce for encryption
         """
-        nonce_bits = []
-        
-        # Generate in small chunks to avoid quantum hardware limitations
-        chunk_size = 8  # Small chunks for reliable quantum generation
-        for i in range(0, length * 8, chunk_size):
-            remaining_bits = min(chunk_size, length * 8 - i)
-            chunk = self.generate_quantum_random_bits(remaining_bits)
-            nonce_bits.extend(chunk)
-        
-        # Convert bits to bytes for cryptographic use
-        nonce = bytearray()
-        for i in range(0, len(nonce_bits), 8):
-            byte_bits = nonce_bits[i:i+8]
-            if len(byte_bits) == 8:
-                # Pack bits into byte (big-endian format)
-                byte_value = sum(bit * (2 ** (7-j)) for j, bit in enumerate(byte_bits))
-                nonce.append(byte_value)
-        
-        return bytes(nonce)
+        return self.entropy_pool.read(length)
+    
+    def _get_entropy_circuit(self, num_qubits):
+        """Return the cached transpiled Hadamard-measurement circuit"""
+        backend_name = self.backend.name() if callable(self.backend.name) else self.backend.name
+        key = (backend_name, num_qubits)
+        circuit = self._entropy_circuits.get(key)
+        if circuit is None:
+            with self._entropy_circuits_lock:
+                circuit = self._entropy_circuits.get(key)
+                if circuit is None:
+                    # Each qubit becomes (|0⟩ + |1⟩)/√2 and collapses to a fair bit
+                    qc = QuantumCircuit(num_qubits)
+                    qc.h(range(num_qubits))
+                    qc.measure_all()
+                    circuit = transpile(qc, self.backend)
+                    self._entropy_circuits[key] = circuit
+        return circuit
     
     def quantum_entropy_analysis(self, bits):
         """
@@ -225,22 +317,25 @@ class QuantumRandomGenerator:
         Returns:
             float: Shannon entropy value (0 to 1 for binary)
         """
-        if not bits:
-            return 0.0
-        
-        # Calculate Shannon entropy to measure randomness quality
-        from collections import Counter
-        counts = Counter(bits)  # Count occurrences of 0s and 1s
-        entropy = 0.0
-        n = len(bits)
+        # Shannon entropy formula: H = -Σ p(x) * log2(p(x)), vectorized
+        return symbol_entropy(bits)  # Maximum entropy for binary is 1.0
+    
+    def assess_randomness(self, num_bytes=131072):
+        """
+        Health-check a sample of QRNG output with the randomness test battery
         
-        # Shannon entropy formula: H = -Σ p(x) * log2(p(x))
-        for count in counts.values():
-            p = count / n  # Probability of this bit value
-            if p > 0:
-                entropy -= p * np.log2(p)  # Add entropy contribution
+        Runs monobit, runs, block frequency, serial and approximate entropy
+        tests plus byte-level Shannon and min-entropy (see randomness_tests)
+        on num_bytes freshly drawn from the entropy pool. The sample is not
+        used for anything else.
         
-        return entropy  # Maximum entropy for binary is 1.0
+        Args:
+            num_bytes (int): Sample size in bytes (default 1 Mbit)
+            
+        Returns:
+            dict: Test p-values, pass flags and entropy estimates
+        """
+        return run_randomness_tests(self.entropy_pool.read(num_bytes))
 
 class QuantumCryptographyEngine:
     """
@@ -258,22 +353,44 @@ class QuantumCryptographyEngine:
     
     Attributes:
         qrng: Quantum random number generator instance
-        shared_keys: Dictionary storing user cryptographic keys
-        encryption_log: List of encryption operations for audit
+        shared_keys: Bounded store of user cryptographic keys (TTL, LRU)
+        encryption_log: Append-only audit log of encryption operations
     """
     
-    def __init__(self):
-        """Initialize the quantum cryptography engine"""
-        self.qrng = QuantumRandomGenerator()  # Quantum randomness source
-        self.shared_keys = {}                 # User key storage
-        self.encryption_log = []              # Security audit log
+    # Per-message randomness budget in bytes, fetched in a single QRNG request
+    KEY_BYTES = 32      # 256-bit encryption key
+    NONCE_BYTES = 8     # 64-bit nonce
+    SALT_BYTES = 8      # 64-bit authentication tag salt
+    
+    # Streaming encryption: bytes read per chunk and bytes per keystream block
+    STREAM_CHUNK_SIZE = 1 << 20
+    KEYSTREAM_BLOCK_SIZE = 1 << 16
+    # Block function of the counter-mode keystream (see key_derivation)
+    KEYSTREAM_ALGORITHM = 'shake_128'
+    # Bulk payloads at least this large go through shared memory
+    SHARED_MEMORY_THRESHOLD = 1 << 16
+    
+    def __init__(self, qrng=None):
+        """
+        Initialize the quantum cryptography engine
+        
+        Args:
+            qrng: Optional shared QuantumRandomGenerator. A new one is created if omitted
+        """
+        self.qrng = qrng or QuantumRandomGenerator()  # Quantum randomness source
+        self.shared_keys = SessionKeyStore()  # User key storage
+        self.encryption_log = get_audit_log('encryption')  # Security audit log
+        self._bulk_pool = None          # Worker processes of encrypt_many/decrypt_many
+        self._bulk_pool_workers = 0
+        self._bulk_pool_lock = threading.Lock()
         
     def quantum_encrypt_message(self, message_bits, user_id="alice"):
         """
         Encrypt message using quantum-generated keys and protocols
         
         This method implements quantum-enhanced encryption by:
-        1. Generating quantum random keys and nonces
+        1. Reading one key/nonce/salt bundle from the entropy pool and
+           slicing it up
         2. Applying secure encryption algorithms
         3. Logging operations for security audit
         
@@ -285,23 +402,14 @@ class QuantumCryptographyEngine:
             dict: Encrypted message with metadata
         """
         
-        # Generate quantum random key for this session (optimized size for demo)
-        quantum_key = self.qrng.generate_quantum_key(32)  # 256-bit key (32 bytes)
-        quantum_nonce = self.qrng.generate_quantum_nonce(8)  # 64-bit nonce (8 bytes)
-        
         # Convert message bits to bytes for encryption
         message_bytes = self._bits_to_bytes(message_bits)
         
-        # Quantum XOR encryption with key stretching
-        stretched_key = self._quantum_key_stretch(quantum_key, len(message_bytes))
-        encrypted_bytes = bytearray()
-        
-        for i, byte in enumerate(message_bytes):
-            encrypted_byte = byte ^ stretched_key[i % len(stretched_key)]
-            encrypted_bytes.append(encrypted_byte)
-        
-        # Generate quantum authentication tag
-        auth_tag = self._generate_quantum_auth_tag(encrypted_bytes, quantum_key)
+        # One bundle holds key | nonce | salt, taken from the background-refilled
+        # entropy pool (key stretching is derived from key and nonce)
+        encrypted_bytes, quantum_key, quantum_nonce, auth_tag = self._seal(
+            message_bytes, self._key_bundle())
+        encrypted_bytes = encrypted_bytes.tobytes()
         
         # Store encryption metadata
         encryption_metadata = {
@@ -316,7 +424,7 @@ class QuantumCryptographyEngine:
         self.encryption_log.append(encryption_metadata)
         
         return {
-            'encrypted_data': bytes(encrypted_bytes),
+            'encrypted_data': encrypted_bytes,
             'quantum_key': quantum_key,
             'nonce': quantum_nonce,
             'auth_tag': auth_tag,
@@ -335,74 +443,364 @@ class QuantumCryptographyEngine:
             raise ValueError("Quantum authentication failed - possible tampering detected!")
         
         # Decrypt using quantum key
-        stretched_key = self._quantum_key_stretch(quantum_key, len(encrypted_data))
-        decrypted_bytes = bytearray()
-        
-        for i, byte in enumerate(encrypted_data):
-            decrypted_byte = byte ^ stretched_key[i % len(stretched_key)]
-            decrypted_bytes.append(decrypted_byte)
+        decrypted_bytes = self._unseal(encrypted_data, quantum_key, encrypted_package['nonce'])
         
         # Convert back to bits
-        decrypted_bits = self._bytes_to_bits(bytes(decrypted_bytes))
+        decrypted_bits = self._bytes_to_bits(decrypted_bytes)
         
         return decrypted_bits
     
-    def _bits_to_bytes(self, bits):
-        """Convert bit list to bytes"""
-        # Pad to byte boundary
-        padded_bits = bits + [0] * ((8 - len(bits) % 8) % 8)
+    def encrypt_many(self, messages, user_id="alice", max_workers=None):
+        """
+        Encrypt many independent messages in parallel worker processes
         
-        bytes_array = bytearray()
-        for i in range(0, len(padded_bits), 8):
-            byte_bits = padded_bits[i:i+8]
-            byte_value = sum(bit * (2 ** (7-j)) for j, bit in enumerate(byte_bits))
-            bytes_array.append(byte_value)
+        Each worker expands its own keystream of key/nonce/salt randomness
+        from a quantum seed and its process id, so workers never share
+        randomness. Payloads of at least SHARED_MEMORY_THRESHOLD bytes are
+        passed through shared memory and encrypted in place instead of
+        being pickled.
         
-        return bytes(bytes_array)
+        Args:
+            messages (list): Bit lists (as for quantum_encrypt_message) or
+                bytes-like payloads
+            user_id (str): Identifier for the user/session
+            max_workers (int): Worker processes (default: CPU count)
+            
+        Returns:
+            list: Encrypted packages in the order of messages
+        """
+        payloads = [message if isinstance(message, (bytes, bytearray, memoryview))
+                    else self._bits_to_bytes(message) for message in messages]
+        results = self._run_bulk(_bulk_encrypt_task, payloads, [()] * len(payloads), max_workers)
+        
+        packages = []
+        for message, (encrypted_bytes, quantum_key, quantum_nonce, auth_tag) in zip(messages, results):
+            is_bytes = isinstance(message, (bytes, bytearray, memoryview))
+            encryption_metadata = {
+                'timestamp': datetime.now().isoformat(),
+                'user_id': user_id,
+                'key_entropy': self.qrng.quantum_entropy_analysis(list(quantum_key)),
+                'nonce': quantum_nonce.hex(),
+                'auth_tag': auth_tag.hex(),
+                'message_length': len(encrypted_bytes) * 8 if is_bytes else len(message)
+            }
+            self.encryption_log.append(encryption_metadata)
+            packages.append({
+                'encrypted_data': encrypted_bytes,
+                'quantum_key': quantum_key,
+                'nonce': quantum_nonce,
+                'auth_tag': auth_tag,
+                'metadata': encryption_metadata
+            })
+        return packages
     
-    def _bytes_to_bits(self, data):
-        """Convert bytes to bit list"""
-        bits = []
-        for byte in data:
-            for i in range(8):
-                bit = (byte >> (7-i)) & 1
-                bits.append(bit)
-        return bits
-    
-    def _quantum_key_stretch(self, key, target_length):
-        """Stretch quantum key using quantum-inspired derivation"""
-        if len(key) >= target_length:
-            return key[:target_length]
+    def decrypt_many(self, encrypted_packages, as_bytes=False, max_workers=None):
+        """
+        Decrypt many packages in parallel worker processes
         
-        # Use quantum-generated randomness for key derivation
-        stretched = bytearray(key)
-        quantum_bits = self.qrng.generate_quantum_random_bits(target_length * 8)
+        Args:
+            encrypted_packages (list): Packages from encrypt_many or
+                quantum_encrypt_message
+            as_bytes (bool): Return bytes instead of bit lists
+            max_workers (int): Worker processes (default: CPU count)
+            
+        Returns:
+            list: Decrypted messages in the order of encrypted_packages
+        """
+        for package in encrypted_packages:
+            if not self._verify_quantum_auth_tag(package['encrypted_data'], package['quantum_key'],
+                                                 package['auth_tag']):
+                raise ValueError("Quantum authentication failed - possible tampering detected!")
+        
+        results = self._run_bulk(_bulk_decrypt_task,
+                                 [package['encrypted_data'] for package in encrypted_packages],
+                                 [(package['quantum_key'], package['nonce'])
+                                  for package in encrypted_packages],
+                                 max_workers)
+        return results if as_bytes else [self._bytes_to_bits(data) for data in results]
+    
+    def _run_bulk(self, task, payloads, task_arguments, max_workers):
+        """
+        Map a bulk task over a process pool, keeping results in input order
         
-        while len(stretched) < target_length:
-            # Quantum-inspired key expansion
-            hash_input = bytes(stretched) + bytes([len(stretched) % 256])
-            hash_output = hashlib.sha256(hash_input).digest()
+        Large payloads are copied once into shared memory blocks, which the
+        task transforms in place; their results are read back from there.
+        """
+        shared_blocks = {}
+        jobs = []
+        try:
+            for index, (payload, arguments) in enumerate(zip(payloads, task_arguments)):
+                if len(payload) >= self.SHARED_MEMORY_THRESHOLD:
+                    block = shared_memory.SharedMemory(create=True, size=len(payload))
+                    block.buf[:len(payload)] = payload
+                    shared_blocks[index] = block
+                    payload = (block.name, len(payload))
+                else:
+                    payload = bytes(payload)
+                jobs.append((payload,) + tuple(arguments))
             
-            # Mix with quantum randomness
-            for i, hash_byte in enumerate(hash_output):
-                if len(stretched) < target_length:
-                    quantum_byte_bits = quantum_bits[(len(stretched)*8):((len(stretched)+1)*8)]
-                    quantum_byte = sum(bit * (2**j) for j, bit in enumerate(quantum_byte_bits[:8]))
-                    mixed_byte = hash_byte ^ quantum_byte
-                    stretched.append(mixed_byte)
+            workers = max_workers or os.cpu_count() or 1
+            pool = self._get_bulk_pool(workers)
+            try:
+                results = list(pool.map(task, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+            except BrokenProcessPool:
+                # A worker died - start a fresh pool on the next call
+                self.close_bulk_pool()
+                raise
+            
+            # Shared-memory results were written in place
+            for index, block in shared_blocks.items():
+                data = bytes(block.buf[:len(payloads[index])])
+                result = results[index]
+                results[index] = data if result is None else (data,) + result[1:]
+            return results
+        finally:
+            for block in shared_blocks.values():
+                block.close()
+                block.unlink()
+    
+    def _get_bulk_pool(self, workers):
+        """
+        The engine's bulk worker pool, created on first use
         
-        return bytes(stretched[:target_length])
+        Workers are seeded once from the QRNG and keep their keystream
+        across calls. The pool is replaced when a different worker count
+        is requested; work queued on the old pool still completes.
+        """
+        with self._bulk_pool_lock:
+            if self._bulk_pool is not None and self._bulk_pool_workers != workers:
+                self._bulk_pool.shutdown(wait=False)
+                self._bulk_pool = None
+            if self._bulk_pool is None:
+                seed = self.qrng.generate_quantum_bytes(self.KEY_BYTES)
+                self._bulk_pool = ProcessPoolExecutor(
+                    workers, initializer=_init_bulk_worker, initargs=(seed,))
+                self._bulk_pool_workers = workers
+            return self._bulk_pool
+    
+    def close_bulk_pool(self):
+        """Shut down the worker processes of encrypt_many/decrypt_many"""
+        with self._bulk_pool_lock:
+            pool, self._bulk_pool = self._bulk_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
     
-    def _generate_quantum_auth_tag(self, data, key):
+    def quantum_encrypt_stream(self, source, output, user_id="alice", chunk_size=None):
+        """
+        Encrypt a message of arbitrary size chunk by chunk
+        
+        The source is read in fixed-size chunks; each chunk is XORed with
+        the keystream for its byte range in one vectorized operation and
+        written straight to the output, so memory use does not grow with
+        the message. The keystream depends only on key, nonce and byte
+        offset, so decryption may use a different chunking.
+        
+        Args:
+            source: File-like object with read(), bytes-like object, or
+                iterable of byte chunks
+            output: File-like object with write(), or a writable buffer such
+                as the memory-mapped file returned by open_memmap_output
+            user_id (str): Identifier for the user/session
+            chunk_size (int): Bytes per chunk (default STREAM_CHUNK_SIZE)
+            
+        Returns:
+            dict: Key, nonce, salt, auth tag, length and metadata (no ciphertext)
+        """
+        randomness = self._key_bundle()
+        quantum_key = randomness[:self.KEY_BYTES]
+        quantum_nonce = randomness[self.KEY_BYTES:self.KEY_BYTES + self.NONCE_BYTES]
+        quantum_salt = randomness[self.KEY_BYTES + self.NONCE_BYTES:]
+        
+        # Same tag construction as _generate_quantum_auth_tag, computed incrementally
+        tag_hash = hashlib.sha256()
+        length = 0
+        for _, encrypted_chunk in self._xor_stream(source, output, quantum_key, quantum_nonce, chunk_size):
+            tag_hash.update(encrypted_chunk)
+            length += len(encrypted_chunk)
+        tag_hash.update(quantum_key + quantum_salt)
+        auth_tag = tag_hash.digest()[:16]
+        
+        encryption_metadata = {
+            'timestamp': datetime.now().isoformat(),
+            'user_id': user_id,
+            'key_entropy': self.qrng.quantum_entropy_analysis(list(quantum_key)),
+            'nonce': quantum_nonce.hex(),
+            'auth_tag': auth_tag.hex(),
+            'message_length': length * 8
+        }
+        self.encryption_log.append(encryption_metadata)
+        
+        return {
+            'quantum_key': quantum_key,
+            'nonce': quantum_nonce,
+            'salt': quantum_salt,
+            'auth_tag': auth_tag,
+            'length': length,
+            'metadata': encryption_metadata
+        }
+    
+    def quantum_decrypt_stream(self, source, output, encrypted_package, chunk_size=None):
+        """
+        Decrypt a stream produced by quantum_encrypt_stream
+        
+        The authentication tag is recomputed over the ciphertext while it is
+        decrypted and checked at the end; on mismatch the written output
+        must be discarded.
+        
+        Args:
+            source: Ciphertext as a file-like object, bytes-like object or
+                iterable of byte chunks
+            output: File-like object with write(), or a writable buffer
+            encrypted_package (dict): Result of quantum_encrypt_stream
+            chunk_size (int): Bytes per chunk (default STREAM_CHUNK_SIZE)
+            
+        Returns:
+            int: Number of decrypted bytes written
+        """
+        quantum_key = encrypted_package['quantum_key']
+        
+        tag_hash = hashlib.sha256()
+        length = 0
+        for encrypted_chunk, _ in self._xor_stream(source, output, quantum_key,
+                                                   encrypted_package['nonce'], chunk_size):
+            tag_hash.update(encrypted_chunk)
+            length += len(encrypted_chunk)
+        tag_hash.update(quantum_key + encrypted_package['salt'])
+        
+        if not hmac.compare_digest(tag_hash.digest()[:16], encrypted_package['auth_tag']):
+            raise ValueError("Quantum authentication failed - possible tampering detected!")
+        
+        return length
+    
+    @staticmethod
+    def open_memmap_output(path, length):
+        """
+        Create a memory-mapped output file for streaming encryption
+        
+        Args:
+            path (str): File to create (overwritten if it exists)
+            length (int): Size of the output in bytes
+            
+        Returns:
+            np.memmap: Writable uint8 map of the file
+        """
+        if length == 0:
+            open(path, 'wb').close()
+            return np.zeros(0, dtype=np.uint8)
+        return np.memmap(path, dtype=np.uint8, mode='w+', shape=(length,))
+    
+    def _xor_stream(self, source, output, key, nonce, chunk_size=None):
+        """XOR source chunks with the keystream, write them, yield (input, output) pairs"""
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        output_buffer = None if hasattr(output, 'write') else as_byte_array(output)
+        stream = self._keystream(key, nonce)
+        offset = 0
+        
+        for chunk in self._iter_stream_chunks(source, chunk_size):
+            chunk = as_byte_array(chunk)
+            keystream = stream.read_at(offset, len(chunk))
+            if output_buffer is None:
+                result = xor_bytes(chunk, keystream)
+                output.write(result)
+            else:
+                # Write straight into the (memory-mapped) output buffer
+                result = xor_bytes(chunk, keystream, out=output_buffer[offset:offset + len(chunk)])
+            offset += len(chunk)
+            yield chunk, result
+    
+    def _key_bundle(self):
+        """One key | nonce | salt bundle from the QRNG's entropy pool, whose depth follows the request rate"""
+        return self.qrng.entropy_pool.read(self.KEY_BYTES + self.NONCE_BYTES + self.SALT_BYTES)
+    
+    @classmethod
+    def _keystream(cls, key, nonce):
+        """Counter-mode keystream for a key and nonce"""
+        return CounterModeKeyStream(key, nonce, cls.KEYSTREAM_ALGORITHM, cls.KEYSTREAM_BLOCK_SIZE)
+    
+    @classmethod
+    def _seal(cls, message_bytes, randomness, out=None):
+        """
+        Encrypt bytes with one key | nonce | salt randomness bundle
+        
+        Returns:
+            tuple: (encrypted uint8 array, key, nonce, auth tag)
+        """
+        nonce_start = cls.KEY_BYTES
+        salt_start = nonce_start + cls.NONCE_BYTES
+        quantum_key = bytes(randomness[:nonce_start])              # 256-bit key (32 bytes)
+        quantum_nonce = bytes(randomness[nonce_start:salt_start])  # 64-bit nonce (8 bytes)
+        quantum_salt = bytes(randomness[salt_start:salt_start + cls.SALT_BYTES])
+        
+        # Quantum XOR encryption with key stretching
+        stretched_key = cls._quantum_key_stretch(quantum_key, len(message_bytes), quantum_nonce)
+        encrypted = xor_bytes(message_bytes, stretched_key, out=out)
+        
+        # Generate quantum authentication tag
+        auth_tag = cls._auth_tag(encrypted, quantum_key, quantum_salt)
+        return encrypted, quantum_key, quantum_nonce, auth_tag
+    
+    @classmethod
+    def _unseal(cls, encrypted_data, key, nonce, out=None):
+        """Decrypt bytes sealed with key and nonce, returning a uint8 array"""
+        stretched_key = cls._quantum_key_stretch(key, len(encrypted_data), nonce)
+        return xor_bytes(encrypted_data, stretched_key, out=out)
+    
+    @staticmethod
+    def _iter_stream_chunks(source, chunk_size):
+        """Yield byte chunks from a file-like object, bytes-like object or iterable"""
+        if hasattr(source, 'read'):
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        elif isinstance(source, (bytes, bytearray, memoryview, np.ndarray)):
+            view = as_byte_array(source)
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+        else:
+            for chunk in source:
+                if len(chunk):
+                    yield chunk
+    
+    def _bits_to_bytes(self, bits):
+        """Convert bit list to bytes (MSB first, zero-padded to a byte boundary)"""
+        return bits_to_bytes(bits)
+    
+    def _bytes_to_bits(self, data):
+        """Convert bytes to bit list (MSB first)"""
+        return bytes_to_bits(data)
+    
+    @classmethod
+    def _quantum_key_stretch(cls, key, target_length, nonce=b''):
+        """
+        Stretch a quantum key to target_length bytes
+        
+        The key itself is followed by a counter-mode keystream derived from
+        (key, nonce), so the result is produced in linear time and the same
+        key and nonce always regenerate it for decryption.
+        """
+        if len(key) >= target_length:
+            return key[:target_length]
+        
+        return key + cls._keystream(key, nonce).read_at(0, target_length - len(key))
+    
+    def _generate_quantum_auth_tag(self, data, key, quantum_salt=None):
         """Generate quantum authentication tag"""
         # Combine data with quantum-generated salt
-        quantum_salt = self.qrng.generate_quantum_nonce(8)
+        if quantum_salt is None:
+            quantum_salt = self.qrng.generate_quantum_nonce(self.SALT_BYTES)
         
+        return self._auth_tag(data, key, quantum_salt)
+    
+    @staticmethod
+    def _auth_tag(data, key, quantum_salt):
+        """128-bit tag over data, key and salt"""
         # Create authentication tag using quantum entropy
-        auth_input = data + key + quantum_salt
-        auth_hash = hashlib.sha256(auth_input).digest()
+        auth_hash = hashlib.sha256(data)
+        auth_hash.update(key + quantum_salt)
         
-        return auth_hash[:16]  # 128-bit auth tag
+        return auth_hash.digest()[:16]  # 128-bit auth tag
     
     def _verify_quantum_auth_tag(self, data, key, expected_tag):
         """Verify quantum authentication tag"""
@@ -414,6 +812,46 @@ class QuantumCryptographyEngine:
         except:
             return False
 
+# Per-process randomness of encrypt_many workers (see _init_bulk_worker)
+_bulk_worker_randomness = None
+
+def _init_bulk_worker(seed):
+    """Give each pool worker its own keystream of key/nonce/salt randomness"""
+    global _bulk_worker_randomness
+    _bulk_worker_randomness = CounterModeKeyStream(seed, os.getpid().to_bytes(8, 'big'))
+
+def _bulk_payload_view(payload):
+    """Return (uint8 view, shared memory block or None) for a bulk payload"""
+    if isinstance(payload, tuple):
+        name, length = payload
+        block = shared_memory.SharedMemory(name=name)
+        return np.ndarray((length,), dtype=np.uint8, buffer=block.buf), block
+    return payload, None
+
+def _bulk_encrypt_task(job):
+    """Encrypt one bulk payload; shared-memory payloads are encrypted in place"""
+    data, block = _bulk_payload_view(job[0])
+    bundle_size = (QuantumCryptographyEngine.KEY_BYTES + QuantumCryptographyEngine.NONCE_BYTES
+                   + QuantumCryptographyEngine.SALT_BYTES)
+    encrypted, quantum_key, quantum_nonce, auth_tag = QuantumCryptographyEngine._seal(
+        data, _bulk_worker_randomness.read(bundle_size), out=data if block is not None else None)
+    if block is not None:
+        del data, encrypted
+        block.close()
+        return None, quantum_key, quantum_nonce, auth_tag
+    return encrypted.tobytes(), quantum_key, quantum_nonce, auth_tag
+
+def _bulk_decrypt_task(job):
+    """Decrypt one bulk payload; shared-memory payloads are decrypted in place"""
+    payload, quantum_key, quantum_nonce = job
+    data, block = _bulk_payload_view(payload)
+    if block is not None:
+        QuantumCryptographyEngine._unseal(data, quantum_key, quantum_nonce, out=data)
+        del data
+        block.close()
+        return None
+    return QuantumCryptographyEngine._unseal(data, quantum_key, quantum_nonce).tobytes()
+
 class SuperdenseCodingProtocol:
     """
     Enhanced Superdense Coding Protocol with Quantum Cryptography
@@ -449,28 +887,45 @@ class SuperdenseCodingProtocol:
     - 11 → XZ gates (bit + phase)    → |Ψ-⟩ = (|01⟩ - |10⟩)/√2
     
     Attributes:
+        backend_pool: Shared simulator backend and job pool
         results_history: Store all protocol execution results
-        security_log: Log security-related events and metrics
+        security_log: Append-only audit log of security events and metrics
         noise_level: Current quantum channel noise level
         channel_quality_history: Track channel quality over time
         real_time_metrics: Live performance and reliability metrics
         enable_quantum_crypto: Enable/disable quantum cryptography features
         qrng: Quantum random number generator instance
         crypto_engine: Quantum cryptography engine
-        quantum_session_keys: User session key management
-        entropy_analysis: Quality analysis of quantum randomness
+        quantum_session_keys: Bounded session key store (TTL, LRU, per-user lookup)
+        entropy_analysis: Running entropy statistics plus a bounded sample of records
     """
     
-    def __init__(self, enable_quantum_crypto=True):
+    # Process-wide cache of transpiled noiseless circuits shared by every
+    # protocol instance, keyed by (backend name, bit0, bit1)
+    _circuit_templates = {}
+    _circuit_templates_lock = threading.Lock()
+    
+    # Process-wide LRU cache of channel noise models keyed by rounded noise level
+    _noise_models = OrderedDict()
+    _noise_models_lock = threading.Lock()
+    
+    def __init__(self, enable_quantum_crypto=True, backend_pool=None):
         """
         Initialize the superdense coding protocol
         
         Args:
             enable_quantum_crypto (bool): Enable quantum cryptography features
+            backend_pool: Optional job pool. Defaults to the process-wide pool
         """
+        # Shared simulator backend used for every protocol job
+        self.backend_pool = backend_pool or get_backend_pool()
+        self.analytic_engine = AnalyticProtocolEngine()  # NumPy execution engine
+        self.pauli_frame_sampler = PauliFrameSampler(statevector_engine=self.analytic_engine)
+        self.density_matrix_engine = DensityMatrixEngine()  # Kraus channel noise model
+        
         # Core protocol state tracking
         self.results_history = []           # Store execution results
-        self.security_log = []              # Security event logging
+        self.security_log = get_audit_log('security')  # Security event logging
         self.noise_level = 0.0              # Quantum channel noise
         self.channel_quality_history = []   # Channel quality metrics
         
@@ -486,10 +941,18 @@ class SuperdenseCodingProtocol:
         self.enable_quantum_crypto = enable_quantum_crypto
         if enable_quantum_crypto:
             # Initialize quantum cryptographic components
-            self.qrng = QuantumRandomGenerator()      # True quantum randomness
-            self.crypto_engine = QuantumCryptographyEngine()  # Encryption engine
-            self.quantum_session_keys = {}           # Session key management
-            self.entropy_analysis = []               # Randomness quality tracking
+            self.qrng = QuantumRandomGenerator(backend_pool=self.backend_pool)  # True quantum randomness
+            self.crypto_engine = QuantumCryptographyEngine(qrng=self.qrng)  # Encryption engine (shares QRNG)
+            self.quantum_session_keys = SessionKeyStore()  # Session key management
+            self.entropy_analysis = MetricHistory(('key_entropy', 'message_entropy'))  # Randomness quality tracking
+        
+        # Precompile the four message circuits once per process
+        if QISKIT_AVAILABLE:
+            try:
+                self.warm_circuit_templates()
+            except Exception as e:
+                # Templates are built lazily on first use instead
+                pass
         
     def run_protocol_with_quantum_crypto(self, bit0, bit1, noise_level=0.0, user_id="alice"):
         """
@@ -527,8 +990,8 @@ class SuperdenseCodingProtocol:
             else:
                 transmission_bit0, transmission_bit1 = bit0, bit1
             
-            # Log quantum entropy
-            key_entropy = self.qrng.quantum_entropy_analysis(list(quantum_crypto_data['quantum_key']))
+            # Log quantum entropy (computed once during encryption)
+            key_entropy = quantum_crypto_data['metadata']['key_entropy']
             self.entropy_analysis.append({
                 'timestamp': datetime.now().isoformat(),
                 'key_entropy': key_entropy,
@@ -585,7 +1048,7 @@ class SuperdenseCodingProtocol:
     
     def _calculate_quantum_security_level(self, crypto_data):
         """Calculate quantum security level based on cryptographic parameters"""
-        key_entropy = self.qrng.quantum_entropy_analysis(list(crypto_data['quantum_key']))
+        key_entropy = crypto_data['metadata']['key_entropy']
         
         if key_entropy > 7.8:  # Near-maximum entropy
             return 'MAXIMUM'
@@ -596,36 +1059,45 @@ class SuperdenseCodingProtocol:
         else:
             return 'LOW'
     
-    def generate_quantum_session_key(self, session_id="default"):
-        """Generate quantum session key for communication"""
+    def generate_quantum_session_key(self, session_id="default", user_id=None):
+        """
+        Get the quantum session key for communication
+        
+        A live key of the session is reused; a new key is generated only
+        when the session has none or its key expired or was evicted.
+        """
         if not self.enable_quantum_crypto:
             return None
         
-        session_key = self.qrng.generate_quantum_key(128)  # 1024-bit key
-        self.quantum_session_keys[session_id] = {
-            'key': session_key,
-            'created': datetime.now().isoformat(),
-            'entropy': self.qrng.quantum_entropy_analysis(list(session_key))
-        }
+        def new_session_key():
+            return self.qrng.generate_quantum_key(128)
+        
+        entry = self.quantum_session_keys.get_or_create(
+            session_id, new_session_key, user_id,
+            created=datetime.now().isoformat())
+        if 'entropy' not in entry:
+            entry['entropy'] = self.qrng.quantum_entropy_analysis(list(entry['key']))
         
-        return session_key
+        return entry['key']
     
     def get_quantum_entropy_stats(self):
-        """Get quantum entropy statistics"""
+        """Get quantum entropy statistics (constant time, from running accumulators)"""
         if not self.entropy_analysis:
             return None
         
-        key_entropies = [entry['key_entropy'] for entry in self.entropy_analysis]
-        message_entropies = [entry['message_entropy'] for entry in self.entropy_analysis]
+        key_stats = self.entropy_analysis.stats['key_entropy']
+        message_stats = self.entropy_analysis.stats['message_entropy']
+        avg_key_entropy = key_stats.mean
         
         return {
-            'avg_key_entropy': np.mean(key_entropies),
-            'max_key_entropy': np.max(key_entropies),
-            'min_key_entropy': np.min(key_entropies),
-            'avg_message_entropy': np.mean(message_entropies),
-            'total_sessions': len(self.entropy_analysis),
-            'quantum_quality': 'EXCELLENT' if np.mean(key_entropies) > 7.5 else 
-                             'GOOD' if np.mean(key_entropies) > 6.5 else 'FAIR'
+            'avg_key_entropy': avg_key_entropy,
+            'max_key_entropy': key_stats.max,
+            'min_key_entropy': key_stats.min,
+            'std_key_entropy': key_stats.std,
+            'avg_message_entropy': message_stats.mean,
+            'total_sessions': self.entropy_analysis.total_records,
+            'quantum_quality': 'EXCELLENT' if avg_key_entropy > 7.5 else 
+                             'GOOD' if avg_key_entropy > 6.5 else 'FAIR'
         }
         
     def create_bell_state(self):
@@ -711,6 +1183,237 @@ class SuperdenseCodingProtocol:
         
         return qc
     
+    def warm_circuit_templates(self, backend=None):
+        """
+        Build and transpile the four noiseless message circuits for a backend
+        
+        Only four noiseless circuits (00, 01, 10, 11) can ever exist, so they
+        are compiled once per process and reused by every protocol instance.
+        
+        Args:
+            backend: Backend to compile for. Defaults to the shared simulator
+        """
+        backend = backend or self.backend_pool.backend
+        for bit0, bit1 in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+            self.get_circuit_template(bit0, bit1, backend)
+    
+    def get_circuit_template(self, bit0, bit1, backend):
+        """
+        Get the cached transpiled circuits for a message on a backend
+        
+        Args:
+            bit0: First bit of message
+            bit1: Second bit of message
+            backend: Backend the circuits are compiled for
+            
+        Returns:
+            dict: 'encoded' - transpiled Bell state plus Alice's encoding,
+                  'final' - transpiled noiseless circuit including Bell measurement,
+                  'channel' - 'final' with TRANSMISSION_LABEL identity markers on
+                  both qubits where a channel NoiseModel applies its errors,
+                  'phase' - 'final' with RZ(PHASE_ERROR_PARAMETERS) phase errors
+                  on both qubits, bound at execution time
+        """
+        backend_name = backend.name() if callable(backend.name) else backend.name
+        key = (backend_name, int(bit0), int(bit1))
+        
+        template = self._circuit_templates.get(key)
+        if template is not None:
+            return template
+        
+        with self._circuit_templates_lock:
+            template = self._circuit_templates.get(key)
+            if template is None:
+                encoded_circuit = self.encode_message(self.create_bell_state(), bit0, bit1)
+                final_circuit = self.apply_error_mitigation(self.decode_message(encoded_circuit))
+                transpiled_encoded = transpile(encoded_circuit, backend)
+                
+                # Identity markers are appended after transpiling so they are never optimized away
+                channel_circuit = transpiled_encoded.copy()
+                phase_circuit = transpiled_encoded.copy()
+                for qubit in [0, 1]:
+                    channel_circuit.append(IGate(label=TRANSMISSION_LABEL), [qubit])
+                    phase_circuit.rz(PHASE_ERROR_PARAMETERS[qubit], qubit)
+                
+                template = {
+                    'encoded': transpiled_encoded,
+                    'final': transpile(final_circuit, backend),
+                    'channel': self.apply_error_mitigation(self.decode_message(channel_circuit)),
+                    'phase': self.apply_error_mitigation(self.decode_message(phase_circuit))
+                }
+                self._circuit_templates[key] = template
+        
+        return template
+    
+    def build_transmission_circuit(self, bit0, bit1, noise_level, backend):
+        """
+        Build the executable protocol circuit for one message
+        
+        Channel noise is inserted on top of the cached transpiled template.
+        The noise gates (X, Y, Z, RZ) and Bob's CNOT + H measurement are native
+        simulator instructions, so the result does not need retranspiling.
+        
+        Args:
+            bit0: First bit of message
+            bit1: Second bit of message
+            noise_level: Effective channel noise level
+            backend: Backend to execute on
+            
+        Returns:
+            QuantumCircuit: Circuit ready for backend.run
+        """
+        template = self.get_circuit_template(bit0, bit1, backend)
+        transmitted_circuit = self.simulate_transmission(template['encoded'], noise_level)
+        
+        # No error drawn on this run - reuse the noiseless compiled circuit
+        if len(transmitted_circuit.data) == len(template['encoded'].data):
+            return template['final']
+        
+        final_circuit = self.decode_message(transmitted_circuit)
+        return self.apply_error_mitigation(final_circuit)
+    
+    def build_noise_model(self, noise_level):
+        """
+        Express the transmission channel as a cached Aer NoiseModel
+        
+        The model is the expected-value version of simulate_transmission:
+        each qubit gets an X/Y/Z error (weights 0.5/0.2/0.3) with probability
+        min(noise_level, 0.4), followed with probability 0.2 times that by an
+        RZ phase error at the mean decoherence angle. Errors act on the
+        TRANSMISSION_LABEL markers of the 'channel' circuit templates.
+        
+        The level is rounded to NOISE_MODEL_DECIMALS, so drifting float
+        levels share a model, and the cache holds the NOISE_MODEL_CACHE_SIZE
+        most recently used models.
+        
+        Args:
+            noise_level: Channel noise level (0.0 to 1.0)
+            
+        Returns:
+            NoiseModel: Noise model shared by every run at this noise level
+        """
+        noise_level = round(float(noise_level), NOISE_MODEL_DECIMALS)
+        with self._noise_models_lock:
+            noise_model = self._noise_models.get(noise_level)
+            if noise_model is not None:
+                self._noise_models.move_to_end(noise_level)
+            else:
+                error_probability = min(max(noise_level, 0.0), 0.4)
+                phase_probability = 0.2 * error_probability
+                phase_angle = (np.pi / 12) * (1 + noise_level)
+                
+                channel_error = pauli_error([
+                    ('X', 0.5 * error_probability),
+                    ('Y', 0.2 * error_probability),
+                    ('Z', 0.3 * error_probability),
+                    ('I', 1 - error_probability)
+                ]).compose(mixed_unitary_error([
+                    (RZGate(phase_angle).to_matrix(), phase_probability),
+                    (np.eye(2), 1 - phase_probability)
+                ]))
+                
+                noise_model = NoiseModel()
+                noise_model.add_all_qubit_quantum_error(channel_error, TRANSMISSION_LABEL)
+                self._noise_models[noise_level] = noise_model
+                while len(self._noise_models) > NOISE_MODEL_CACHE_SIZE:
+                    self._noise_models.popitem(last=False)
+        
+        return noise_model
+    
+    def run_noise_sweep(self, noise_levels, shots=1024):
+        """
+        Run all four messages across a sweep of channel noise levels
+        
+        Every level reuses the same four compiled 'channel' template circuits
+        and its cached NoiseModel; the levels are submitted to the backend
+        pool together, one job per level.
+        
+        Args:
+            noise_levels: Sequence of channel noise levels
+            shots: Number of measurements per message and level
+            
+        Returns:
+            dict: Columnar sweep results; 'measurement_counts' is an (L, 4, 4)
+            array indexed [level, sent message, decoded message] following
+            BATCH_MEASUREMENT_STATES
+        """
+        if not QISKIT_AVAILABLE:
+            raise RuntimeError("Noise sweeps require Qiskit Aer")
+        
+        start_time = time.time()
+        noise_levels = np.asarray(noise_levels, dtype=float).reshape(-1)
+        backend = self.backend_pool.backend
+        circuits = [self.get_circuit_template(bit0, bit1, backend)['channel']
+                    for bit0, bit1 in [(0, 0), (0, 1), (1, 0), (1, 1)]]
+        
+        jobs = [self.backend_pool.submit(circuits, backend, shots=shots,
+                                         noise_model=self.build_noise_model(level))
+                for level in noise_levels]
+        
+        counts = np.zeros((len(noise_levels), 4, 4), dtype=np.int64)
+        for level_counts, job in zip(counts, jobs):
+            for row, circuit_counts in zip(level_counts, job.result().get_counts()):
+                for state, count in circuit_counts.items():
+                    clean_state = state.replace(' ', '')[:2]  # Qiskit order "bit1bit0"
+                    row[2 * int(clean_state[1]) + int(clean_state[0])] += count
+        
+        success_probability = np.diagonal(counts, axis1=1, axis2=2) / shots
+        
+        return {
+            'noise_levels': noise_levels,
+            'measurement_counts': counts,
+            'measurement_states': BATCH_MEASUREMENT_STATES,
+            'success_probability': success_probability,
+            'fidelity': success_probability.mean(axis=1),
+            'shots': shots,
+            'execution_time': time.time() - start_time,
+            'timestamp': datetime.now()
+        }
+    
+    def run_phase_error_batch(self, bit0, bit1, phase_errors, shots=1024):
+        """
+        Run one message under many RZ phase errors in a single job
+        
+        The parameterized 'phase' template is compiled once; each row of
+        phase angles is bound at execution time, so Monte Carlo loops over
+        decoherence angles need no circuit rebuilding or retranspiling.
+        
+        Args:
+            bit0: First bit of message
+            bit1: Second bit of message
+            phase_errors: (R, 2) RZ angles for qubits 0 and 1 (0.0 = no error),
+                or (R,) angles applied to Alice's qubit only
+            shots: Number of measurements per binding
+            
+        Returns:
+            np.ndarray: (R, 4) counts ordered as BATCH_MEASUREMENT_STATES
+        """
+        if not QISKIT_AVAILABLE:
+            raise RuntimeError("Parameterized phase circuits require Qiskit Aer")
+        
+        phase_errors = np.asarray(phase_errors, dtype=float)
+        if phase_errors.ndim == 1:
+            phase_errors = np.stack([phase_errors, np.zeros_like(phase_errors)], axis=1)
+        
+        backend = self.backend_pool.backend
+        circuit = self.get_circuit_template(bit0, bit1, backend)['phase']
+        parameter_binds = [{
+            PHASE_ERROR_PARAMETERS[qubit]: phase_errors[:, qubit].tolist() for qubit in [0, 1]
+        }]
+        
+        raw_counts = self.backend_pool.run(circuit, backend, shots=shots,
+                                           parameter_binds=parameter_binds).get_counts()
+        if isinstance(raw_counts, dict):
+            raw_counts = [raw_counts]
+        
+        counts = np.zeros((len(phase_errors), 4), dtype=np.int64)
+        for row, binding_counts in zip(counts, raw_counts):
+            for state, count in binding_counts.items():
+                clean_state = state.replace(' ', '')[:2]  # Qiskit order "bit1bit0"
+                row[2 * int(clean_state[1]) + int(clean_state[0])] += count
+        
+        return counts
+    
     def simulate_transmission(self, encoded_circuit, noise_level=0.0):
         """
         Simulate quantum channel transmission with realistic balanced noise
@@ -795,21 +1498,7 @@ class SuperdenseCodingProtocol:
         effective_noise = noise_level * channel_fluctuation * atmospheric_factor
         
         # Dynamic correction based on recent performance
-        if len(self.results_history) > 3:
-            recent_fidelities = [r['fidelity'] for r in self.results_history[-3:]]
-            avg_recent_fidelity = sum(recent_fidelities) / len(recent_fidelities)
-            
-            if avg_recent_fidelity < 0.6:
-                # Channel performing poorly - apply more aggressive correction
-                correction_factor = 0.7
-            elif avg_recent_fidelity > 0.9:
-                # Channel performing well - less correction needed
-                correction_factor = 1.1
-            else:
-                # Normal performance
-                correction_factor = 0.9
-                
-            effective_noise *= correction_factor
+        effective_noise *= self._recent_performance_correction()
         
         # Add time-dependent fluctuations (simulate real-world conditions)
         time_factor = 1 + 0.1 * np.sin(time.time())  # Periodic fluctuations
@@ -817,6 +1506,47 @@ class SuperdenseCodingProtocol:
         
         return max(0.0, min(effective_noise, 0.6))  # Clamp between 0 and 60%
     
+    def adaptive_noise_correction_batch(self, noise_level, num_messages):
+        """
+        Vectorized adaptive noise correction for a batch of messages
+        
+        Draws the same channel fluctuation and atmospheric factors as
+        adaptive_noise_correction, but as arrays with one entry per message.
+        
+        Args:
+            noise_level: Current noise level
+            num_messages: Number of messages in the batch
+            
+        Returns:
+            np.ndarray: Effective noise level for each message
+        """
+        channel_fluctuation = np.random.uniform(0.8, 1.3, num_messages)
+        atmospheric_factor = np.random.uniform(0.9, 1.1, num_messages)
+        
+        effective_noise = noise_level * channel_fluctuation * atmospheric_factor
+        effective_noise *= self._recent_performance_correction()
+        effective_noise *= 1 + 0.1 * np.sin(time.time())
+        
+        return np.clip(effective_noise, 0.0, 0.6)
+    
+    def _recent_performance_correction(self):
+        """Noise correction factor derived from the last few protocol results"""
+        if len(self.results_history) <= 3:
+            return 1.0
+        
+        recent_fidelities = [r['fidelity'] for r in self.results_history[-3:]]
+        avg_recent_fidelity = sum(recent_fidelities) / len(recent_fidelities)
+        
+        if avg_recent_fidelity < 0.6:
+            # Channel performing poorly - apply more aggressive correction
+            return 0.7
+        elif avg_recent_fidelity > 0.9:
+            # Channel performing well - less correction needed
+            return 1.1
+        else:
+            # Normal performance
+            return 0.9
+    
     def ensure_transmission_success(self, result_data):
         """
         Ensure transmission shows success for demonstration purposes
@@ -846,7 +1576,7 @@ class SuperdenseCodingProtocol:
         
         return result_data
     
-    def run_protocol(self, bit0, bit1, noise_level=0.0):
+    def run_protocol(self, bit0, bit1, noise_level=0.0, engine='aer'):
         """
         Execute the complete superdense coding protocol
         
@@ -861,12 +1591,14 @@ class SuperdenseCodingProtocol:
             bit0: First bit to transmit
             bit1: Second bit to transmit  
             noise_level: Channel noise level (0.0 to 1.0)
+            engine: Execution engine, one of PROTOCOL_ENGINES (default 'aer')
             
         Returns:
             dict: Complete execution results including fidelity and success metrics
         """
+        self._check_engine(engine)
         
-        if not QISKIT_AVAILABLE:
+        if engine == 'aer' and not QISKIT_AVAILABLE:
             return self._simulate_protocol_results(bit0, bit1, noise_level)
         
         protocol_steps = []
@@ -875,34 +1607,34 @@ class SuperdenseCodingProtocol:
         # Apply adaptive noise correction
         effective_noise = self.adaptive_noise_correction(noise_level)
         
-        # Step 1: Create Bell state
-        bell_circuit = self.create_bell_state()
-        protocol_steps.append("✅ Created entangled Bell state |Φ+⟩")
+        # Steps 1-5: Bell state, encoding, channel noise, Bell measurement and
+        # error mitigation, built on the cached transpiled template for this message
+        if engine == 'aer':
+            try:
+                backend = self.backend_pool.backend
+                final_circuit = self.build_transmission_circuit(bit0, bit1, effective_noise, backend)
+            except Exception as e:
+                # If Qiskit fails, use fallback simulation
+                return self._simulate_protocol_results(bit0, bit1, noise_level)
         
-        # Step 2: Encode message
-        encoded_circuit = self.encode_message(bell_circuit, bit0, bit1)
+        protocol_steps.append("✅ Created entangled Bell state |Φ+⟩")
         protocol_steps.append(f"✅ Alice encoded message [{bit0}{bit1}] using quantum gates")
-        
-        # Step 3: Simulate transmission
-        transmitted_circuit = self.simulate_transmission(encoded_circuit, effective_noise)
         protocol_steps.append("✅ Transmitted Alice's qubit through quantum channel")
-        
-        # Step 4: Decode message
-        final_circuit = self.decode_message(transmitted_circuit)
-        
-        # Step 5: Apply error mitigation
-        final_circuit = self.apply_error_mitigation(final_circuit)
         protocol_steps.append("✅ Applied error mitigation techniques")
-        
         protocol_steps.append("✅ Bob performed Bell measurement to decode message")
         
         # Step 6: Execute quantum simulation
         try:
-            backend = Aer.get_backend('aer_simulator')
-            transpiled_circuit = transpile(final_circuit, backend)
-            job = backend.run(transpiled_circuit, shots=1024)
-            result = job.result()
-            counts = result.get_counts()
+            if engine == 'aer':
+                result = self.backend_pool.run(final_circuit, backend, shots=1024)
+                counts = result.get_counts()
+            else:
+                counts_row = self._engine_counts(engine, [[bit0, bit1]], [effective_noise], 1024)[0]
+                # Report in Qiskit bit order "bit1bit0" like the simulator does
+                counts = {
+                    f"{state[1]}{state[0]}": int(count)
+                    for state, count in zip(BATCH_MEASUREMENT_STATES, counts_row) if count > 0
+                }
             
             # FIXED: Real-time quantum simulation with realistic measurement distribution
             if counts and len(counts) > 0:
@@ -1006,6 +1738,270 @@ class SuperdenseCodingProtocol:
         self.update_real_time_metrics(result_data)
         return result_data
     
+    def run_protocol_batch(self, pairs, noise_level=0.0, shots=1024, engine='aer'):
+        """
+        Execute the superdense coding protocol for many messages in one job
+        
+        Every message's circuit is built on the cached, already transpiled
+        template for that message (no transpilation per call), and all of
+        them are submitted to the simulator as a single job. The measurement
+        post-processing (channel errors, fidelity and success checks) is done
+        with array operations over the whole batch instead of once per message.
+        
+        Args:
+            pairs: Sequence of (bit0, bit1) messages or an (N, 2) array
+            noise_level: Channel noise level (0.0 to 1.0)
+            shots: Number of measurements per message
+            engine: Execution engine, one of PROTOCOL_ENGINES (default 'aer')
+            
+        Returns:
+            dict: Columnar results for the whole batch. Per-message columns are
+            NumPy arrays with one row per message; 'measurement_counts' is an
+            (N, 4) array whose columns follow BATCH_MEASUREMENT_STATES.
+        """
+        self._check_engine(engine)
+        pairs = np.asarray(pairs, dtype=np.int8).reshape(-1, 2)
+        
+        if (engine == 'aer' and not QISKIT_AVAILABLE) or len(pairs) == 0:
+            return self._simulate_protocol_batch(pairs, noise_level, shots)
+        
+        start_time = time.time()
+        effective_noise = self.adaptive_noise_correction_batch(noise_level, len(pairs))
+        
+        if engine != 'aer':
+            counts = self._engine_counts(engine, pairs, effective_noise, shots)
+            result_data = self._postprocess_batch_counts(pairs, counts, effective_noise)
+            result_data.update({
+                'noise_level': noise_level,
+                'shots': shots,
+                'execution_time': time.time() - start_time,
+                'timestamp': datetime.now()
+            })
+            return result_data
+        
+        # Run the whole batch as a single simulator job, with one circuit per
+        # message built on the cached transpiled templates
+        try:
+            backend = self.backend_pool.backend
+            circuits = [
+                self.build_transmission_circuit(bit0, bit1, message_noise, backend)
+                for (bit0, bit1), message_noise in zip(pairs.tolist(), effective_noise)
+            ]
+            raw_counts = self.backend_pool.run(circuits, backend, shots=shots).get_counts()
+        except Exception as e:
+            # If Qiskit fails, use fallback simulation
+            return self._simulate_protocol_batch(pairs, noise_level, shots)
+        
+        if isinstance(raw_counts, dict):
+            raw_counts = [raw_counts]
+        
+        # Collect counts into an (N, 4) matrix indexed by decoded message 2*bit0 + bit1
+        # Qiskit bit order: state = "bit1bit0" (plus any extra register after a space)
+        counts = np.zeros((len(pairs), 4), dtype=np.int64)
+        for row, circuit_counts in zip(counts, raw_counts):
+            for state, count in circuit_counts.items():
+                clean_state = state.replace(' ', '')[:2]
+                row[2 * int(clean_state[1]) + int(clean_state[0])] += count
+        
+        result_data = self._postprocess_batch_counts(pairs, counts, effective_noise)
+        result_data.update({
+            'noise_level': noise_level,
+            'shots': shots,
+            'execution_time': time.time() - start_time,
+            'timestamp': datetime.now()
+        })
+        return result_data
+    
+    def _check_engine(self, engine):
+        """Validate an execution engine name"""
+        if engine not in PROTOCOL_ENGINES:
+            raise ValueError(f"Unknown protocol engine '{engine}'. "
+                             f"Choose one of: {', '.join(PROTOCOL_ENGINES)}")
+    
+    def _engine_counts(self, engine, pairs, effective_noise, shots):
+        """
+        Sample measurement counts with a non-Aer execution engine
+        
+        Args:
+            engine: Engine name from PROTOCOL_ENGINES (other than 'aer')
+            pairs: (N, 2) array of messages
+            effective_noise: Effective channel noise for each message
+            shots: Number of measurements per message
+            
+        Returns:
+            np.ndarray: (N, 4) counts ordered as BATCH_MEASUREMENT_STATES
+        """
+        if engine == 'pauli_frame':
+            return self.pauli_frame_sampler.sample_counts(pairs, effective_noise, shots)
+        if engine == 'density_matrix':
+            return self.density_matrix_engine.sample_counts(pairs, effective_noise, shots)
+        return self.analytic_engine.sample_counts(pairs, effective_noise, shots)
+    
+    def _postprocess_batch_counts(self, pairs, counts, effective_noise):
+        """
+        Vectorized counterpart of the count post-processing in run_protocol
+        
+        Applies the same measurement error redistribution, fidelity jitter,
+        success threshold and decoherence failures as run_protocol, with
+        array draws over the whole batch.
+        
+        Args:
+            pairs: (N, 2) array of original messages
+            counts: (N, 4) array of raw measurement counts (modified in place)
+            effective_noise: Effective channel noise for each message
+            
+        Returns:
+            dict: Per-message result columns
+        """
+        num_messages = len(pairs)
+        rows = np.arange(num_messages)
+        target_index = 2 * pairs[:, 0].astype(np.int64) + pairs[:, 1]
+        total_shots = counts.sum(axis=1)
+        
+        # Simulate realistic measurement errors for noisy channels
+        noisy = effective_noise > 0.05
+        error_shots = (total_shots * effective_noise *
+                       np.random.uniform(0.5, 1.5, num_messages)).astype(np.int64)
+        original_correct = counts[rows, target_index]
+        noisy &= original_correct > 0
+        error_shots = np.where(noisy, np.minimum(error_shots, (original_correct * 0.4).astype(np.int64)), 0)
+        counts[rows, target_index] = np.where(noisy, np.maximum(1, original_correct - error_shots),
+                                              original_correct)
+        
+        # Spread the error shots over the three other states in the same
+        # proportions as run_protocol: E//3, then (E - E//3)//3, then the rest
+        first_portion = error_shots // 3
+        second_portion = (error_shots - first_portion) // 3
+        third_portion = error_shots - first_portion - second_portion
+        error_columns = (target_index[:, None] + np.arange(1, 4)) % 4
+        # run_protocol visits the error states in Qiskit "bit1bit0" string order
+        qiskit_order = (error_columns & 1) * 2 + (error_columns >> 1)
+        error_columns = np.take_along_axis(error_columns, np.argsort(qiskit_order, axis=1), axis=1)
+        for column, portion in zip(error_columns.T, (first_portion, second_portion, third_portion)):
+            counts[rows, column] += portion
+        
+        # Fidelity with measurement uncertainty and environmental drift
+        total_shots = counts.sum(axis=1)
+        base_fidelity = np.divide(counts[rows, target_index], total_shots,
+                                  out=np.zeros(num_messages), where=total_shots > 0)
+        fidelity = np.clip(base_fidelity
+                           + np.random.normal(0, 0.02, num_messages)
+                           + np.random.uniform(-0.05, 0.05, num_messages), 0.0, 1.0)
+        
+        # Decoded message is the most frequent outcome
+        decoded_index = counts.argmax(axis=1)
+        decoded_bits = np.stack([decoded_index >> 1, decoded_index & 1], axis=1).astype(np.int8)
+        
+        noise_threshold = 0.5 - (effective_noise * 0.4)
+        success = (fidelity > noise_threshold) & (decoded_index == target_index)
+        
+        # Realistic failure modes for high noise
+        decoherence_failure = (effective_noise > 0.3) & (np.random.random(num_messages) < effective_noise)
+        fidelity = np.where(decoherence_failure,
+                            fidelity * np.random.uniform(0.3, 0.7, num_messages), fidelity)
+        success &= ~decoherence_failure
+        
+        return {
+            'original_bits': pairs,
+            'decoded_bits': decoded_bits,
+            'fidelity': fidelity,
+            'success': success,
+            'error_rate': 1 - fidelity,
+            'effective_noise': effective_noise,
+            'measurement_counts': counts,
+            'measurement_states': BATCH_MEASUREMENT_STATES,
+            'num_messages': num_messages,
+            'success_rate': float(success.mean()) if num_messages else 0.0,
+            'quantum_advantage': 2.0
+        }
+    
+    def _simulate_protocol_batch(self, pairs, noise_level, shots=1024):
+        """
+        Vectorized fallback simulation when Qiskit is not available
+        
+        Reproduces the statistics of _simulate_protocol_results for N trials
+        at once: channel quality, error type, fidelity and shot counts are
+        all drawn as arrays. Results use the columnar layout of
+        run_protocol_batch and, like the other batch paths, are not appended
+        to results_history.
+        
+        Args:
+            pairs: (N, 2) array of (bit0, bit1) messages
+            noise_level: Channel noise level (0.0 to 1.0)
+            shots: Number of simulated measurements per message
+            
+        Returns:
+            dict: Columnar results for the whole batch
+        """
+        start_time = time.time()
+        pairs = np.asarray(pairs, dtype=np.int8).reshape(-1, 2)
+        num_messages = len(pairs)
+        rows = np.arange(num_messages)
+        
+        # Real-time channel quality assessment
+        channel_quality = np.random.uniform(0.7, 1.2, num_messages)
+        atmospheric_interference = np.random.uniform(0.9, 1.1, num_messages)
+        noise_impact = noise_level * channel_quality * atmospheric_interference
+        success_probability = np.maximum(0.2, 0.88 - noise_impact)
+        
+        # Error types: 0 = single bit flip, 1 = both bits flip, 2 = phase error
+        failed = np.random.random(num_messages) > success_probability
+        error_type = np.random.choice(3, size=num_messages, p=[0.5, 0.3, 0.2])
+        flip_first = np.random.random(num_messages) < 0.5
+        
+        flip_bit0 = failed & (((error_type == 0) & flip_first) | (error_type == 1))
+        flip_bit1 = failed & (((error_type == 0) & ~flip_first) | (error_type == 1))
+        decoded_bits = pairs ^ np.stack([flip_bit0, flip_bit1], axis=1).astype(np.int8)
+        success = ~(flip_bit0 | flip_bit1)
+        
+        # Fidelity: environmental variation when the bits arrive intact
+        environmental_factor = 1 - (noise_level * 0.3) - (np.abs(channel_quality - 1.0) * 0.1)
+        intact_fidelity = (np.random.uniform(0.75, 0.95, num_messages)
+                           * np.maximum(0.4, environmental_factor))
+        corrupted_fidelity = np.random.uniform(0.1, 0.5, num_messages) * max(0.5, 1 - noise_level)
+        fidelity = np.where(success, intact_fidelity, corrupted_fidelity)
+        
+        # Measurement distribution with shot noise around the fidelity
+        base_correct_shots = (fidelity * shots).astype(np.int64)
+        shot_noise = np.random.normal(0, np.sqrt(base_correct_shots * 0.1))
+        correct_shots = np.clip(np.trunc(base_correct_shots + shot_noise), 0, shots).astype(np.int64)
+        error_shots = shots - correct_shots
+        
+        counts = np.zeros((num_messages, 4), dtype=np.int64)
+        correct_index = 2 * decoded_bits[:, 0].astype(np.int64) + decoded_bits[:, 1]
+        counts[rows, correct_index] = correct_shots
+        
+        # First and second error states in label order, skipping the decoded state
+        first_error = (correct_index == 0).astype(np.int64)
+        second_error = np.where(correct_index >= 2, 1, 2)
+        if noise_level < 0.1:
+            # Low noise - errors mostly in one adjacent state
+            counts[rows, first_error] += error_shots
+        else:
+            # Higher noise - split between two states, remainder to the first
+            first_portion = error_shots // 2
+            second_portion = (error_shots - first_portion) // 2
+            counts[rows, first_error] += error_shots - second_portion
+            counts[rows, second_error] += second_portion
+        
+        return {
+            'original_bits': pairs,
+            'decoded_bits': decoded_bits,
+            'fidelity': fidelity,
+            'success': success,
+            'error_rate': 1 - fidelity,
+            'effective_noise': np.full(num_messages, float(noise_level)),
+            'measurement_counts': counts,
+            'measurement_states': BATCH_MEASUREMENT_STATES,
+            'num_messages': num_messages,
+            'success_rate': float(success.mean()) if num_messages else 0.0,
+            'quantum_advantage': 2.0,
+            'noise_level': noise_level,
+            'shots': shots,
+            'execution_time': time.time() - start_time,
+            'timestamp': datetime.now()
+        }
+    
     def _simulate_protocol_results(self, bit0, bit1, noise_level):
         """
         Fallback classical simulation when Qiskit is not available
@@ -1293,4 +2289,4 @@ class SuperdenseCodingProtocol:
     def reset_results(self):
         """Reset all stored results and logs"""
         self.results_history = []
-        self.security_log = []
\ No newline at end of file
+        self.security_log.clear()
\ No newline at end of file
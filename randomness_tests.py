@@ -0,0 +1,266 @@
+"""
+Randomness Tests Module - Vectorized Quality Checks for QRNG Output
+
+This module implements NIST SP 800-22 style statistical tests and
+entropy estimates over packed random buffers. All counting is done with
+NumPy on whole arrays, so megabits of QRNG output can be checked in
+milliseconds.
+
+Key Features:
+- Frequency (monobit), runs and block frequency tests
+- Serial and approximate entropy tests over overlapping m-bit patterns
+- Byte-level Shannon entropy and min-entropy
+- Shannon entropy of arbitrary symbol sequences (bits, bytes, labels)
+- One-call battery returning p-values and pass/fail per test
+
+INPUT FORMAT:
+- bytes-like objects (bytes, bytearray, memoryview) are packed bits,
+  most significant bit first (see bit_buffer)
+- lists and NumPy arrays are sequences of unpacked 0/1 bits
+"""
+
+import math                 # Complementary error function and log-gamma
+import numpy as np          # Vectorized counting
+
+from bit_buffer import as_byte_array, pack_bits, unpack_bits
+
+# Default significance level of the test battery (NIST SP 800-22 uses 0.01)
+DEFAULT_SIGNIFICANCE = 0.01
+
+
+def as_bit_array(data):
+    """
+    Convert packed bytes or a bit sequence to a uint8 array of 0/1 values
+
+    Args:
+        data: bytes-like object (packed) or 0/1 sequence
+
+    Returns:
+        np.ndarray: Unpacked bits
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return unpack_bits(data)
+    return np.asarray(data, dtype=np.uint8).reshape(-1)
+
+
+def igamc(a, x):
+    """
+    Regularized upper incomplete gamma function Q(a, x)
+
+    Series expansion for x < a + 1, continued fraction otherwise.
+    """
+    if x <= 0:
+        return 1.0
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(1000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+
+    # Lentz's continued fraction
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefactor) * h)
+
+
+def monobit_test(data):
+    """Frequency (monobit) test: are ones and zeros equally common?"""
+    bits = as_bit_array(data)
+    n = len(bits)
+    s_obs = abs(2 * int(np.count_nonzero(bits)) - n) / math.sqrt(n)
+    return math.erfc(s_obs / math.sqrt(2))
+
+
+def runs_test(data):
+    """Runs test: is the number of uninterrupted runs as expected?"""
+    bits = as_bit_array(data)
+    n = len(bits)
+    pi = np.count_nonzero(bits) / n
+    if abs(pi - 0.5) >= 2 / math.sqrt(n):
+        return 0.0      # Frequency prerequisite failed
+    runs = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+    expected = 2 * n * pi * (1 - pi)
+    return math.erfc(abs(runs - expected) / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+
+
+def block_frequency_test(data, block_size=128):
+    """Block frequency test: is each block_size-bit block balanced?"""
+    bits = as_bit_array(data)
+    num_blocks = len(bits) // block_size
+    if num_blocks == 0:
+        return monobit_test(bits)
+    proportions = bits[:num_blocks * block_size].reshape(num_blocks, block_size).mean(axis=1)
+    chi_squared = 4 * block_size * float(np.sum((proportions - 0.5) ** 2))
+    return igamc(num_blocks / 2, chi_squared / 2)
+
+
+# Longest pattern the packed-window counter supports (a window spans two bytes)
+MAX_PATTERN_LENGTH = 9
+
+
+def _pattern_counts(bits, m):
+    """
+    Counts of all overlapping m-bit patterns, wrapping around the end
+
+    Works on packed bytes: every 16-bit word of two consecutive bytes holds
+    the m-bit windows starting at each of the first byte's 8 bit positions,
+    so the counting takes 8 passes over n/8 words instead of m passes over n bits.
+    """
+    if m == 0:
+        return np.array([len(bits)])
+    n = len(bits)
+    extended = pack_bits(np.concatenate([bits, bits[:m - 1]]))
+    extended = np.concatenate([extended, np.zeros(1, dtype=np.uint8)]).astype(np.uint16)
+    words = (extended[:-1] << 8) | extended[1:]
+    mask = (1 << m) - 1
+
+    counts = np.zeros(1 << m, dtype=np.int64)
+    for bit_position in range(8):
+        num_windows = (n - bit_position + 7) // 8
+        windows = (words[:num_windows] >> (16 - m - bit_position)) & mask
+        counts += np.bincount(windows, minlength=1 << m)
+    return counts
+
+
+def _fold_pattern_counts(counts):
+    """Counts of (m-1)-bit patterns from wrapped m-bit pattern counts"""
+    return counts[0::2] + counts[1::2]
+
+
+def serial_test(data, m=5):
+    """
+    Serial test: are all overlapping m-bit patterns equally common?
+
+    Returns:
+        tuple: (p_value_1, p_value_2) from the first and second differences
+    """
+    bits = as_bit_array(data)
+    n = len(bits)
+    m = max(3, min(m, int(math.log2(n)) - 2, MAX_PATTERN_LENGTH))
+
+    def psi_squared(counts):
+        return len(counts) / n * float(np.sum(counts.astype(np.float64) ** 2)) - n
+
+    counts_m = _pattern_counts(bits, m)
+    counts_m1 = _fold_pattern_counts(counts_m)
+    psi_m, psi_m1 = psi_squared(counts_m), psi_squared(counts_m1)
+    psi_m2 = psi_squared(_fold_pattern_counts(counts_m1))
+    delta_1 = psi_m - psi_m1
+    delta_2 = psi_m - 2 * psi_m1 + psi_m2
+    return igamc(2 ** (m - 2), delta_1 / 2), igamc(2 ** (m - 3), delta_2 / 2)
+
+
+def approximate_entropy_test(data, m=None):
+    """
+    Approximate entropy test: compare m- and (m+1)-bit pattern frequencies
+
+    Args:
+        data: Packed bytes or bit sequence
+        m: Pattern length (default: 5, shortened for short sequences as
+            NIST recommends, m < log2(n) - 5)
+
+    Returns:
+        float: p-value
+    """
+    bits = as_bit_array(data)
+    n = len(bits)
+    if m is None:
+        m = max(1, min(5, int(math.log2(n)) - 6, MAX_PATTERN_LENGTH - 1))
+    elif not 1 <= m < MAX_PATTERN_LENGTH:
+        raise ValueError(f"Pattern length m must be between 1 and {MAX_PATTERN_LENGTH - 1}")
+
+    def phi(counts):
+        frequencies = counts[counts > 0] / n
+        return float(np.sum(frequencies * np.log(frequencies)))
+
+    counts_m1 = _pattern_counts(bits, m + 1)
+    approximate_entropy = phi(_fold_pattern_counts(counts_m1)) - phi(counts_m1)
+    chi_squared = 2 * n * (math.log(2) - approximate_entropy)
+    return igamc(2 ** (m - 1), chi_squared / 2)
+
+
+def shannon_entropy(data):
+    """Byte-level Shannon entropy in bits per byte (maximum 8.0)"""
+    counts = np.bincount(as_byte_array(data), minlength=256)
+    probabilities = counts[counts > 0] / counts.sum()
+    return float(-np.sum(probabilities * np.log2(probabilities)))
+
+
+def min_entropy(data):
+    """Byte-level min-entropy in bits per byte (maximum 8.0)"""
+    counts = np.bincount(as_byte_array(data), minlength=256)
+    return float(-math.log2(counts.max() / counts.sum()))
+
+
+def symbol_entropy(symbols):
+    """
+    Shannon entropy of a sequence of symbols
+
+    Args:
+        symbols: Sequence of hashable numeric symbols (bits, byte values, ...)
+
+    Returns:
+        float: Entropy in bits per symbol (0.0 for an empty sequence)
+    """
+    symbols = np.asarray(symbols).reshape(-1)
+    if symbols.size == 0:
+        return 0.0
+    _, counts = np.unique(symbols, return_counts=True)
+    probabilities = counts / symbols.size
+    return float(-np.sum(probabilities * np.log2(probabilities)))
+
+
+def run_randomness_tests(data, significance=DEFAULT_SIGNIFICANCE):
+    """
+    Run the full randomness battery on QRNG output
+
+    Args:
+        data: Packed bytes or bit sequence
+        significance: p-value threshold below which a test fails
+
+    Returns:
+        dict: Per-test p-values and pass flags, byte-level Shannon and
+        min-entropy, and an overall 'passed' flag
+    """
+    bits = as_bit_array(data)
+    packed = pack_bits(bits)
+
+    serial_1, serial_2 = serial_test(bits)
+    p_values = {
+        'monobit': monobit_test(bits),
+        'runs': runs_test(bits),
+        'block_frequency': block_frequency_test(bits),
+        'serial': min(serial_1, serial_2),
+        'approximate_entropy': approximate_entropy_test(bits)
+    }
+    tests = {name: {'p_value': p_value, 'passed': p_value >= significance}
+             for name, p_value in p_values.items()}
+
+    return {
+        'num_bits': len(bits),
+        'tests': tests,
+        'shannon_entropy': shannon_entropy(packed),
+        'min_entropy': min_entropy(packed),
+        'passed': all(test['passed'] for test in tests.values())
+    }
@@ -0,0 +1,129 @@
+"""
+Running Statistics Module - Constant-Time Summaries of Long Histories
+
+Dashboards summarize metrics recorded once per transmission. Rebuilding
+arrays from the full history on every render gets slower the longer a
+session lives. This module keeps running accumulators that are updated per
+record, so a summary costs the same after ten records or ten million.
+
+Key Features:
+- Welford's online mean and variance with count, min and max
+- History of numeric fields backed by one accumulator per field
+- Optional bounded reservoir holding a uniform sample of past records
+"""
+
+import math                 # Standard deviation
+import random               # Reservoir sampling positions
+
+
+class RunningStats:
+    """
+    Online count, mean, variance, min and max of a stream of numbers
+
+    Attributes:
+        count: Number of values seen
+        mean: Mean of the values seen
+        min: Smallest value seen (None before the first value)
+        max: Largest value seen (None before the first value)
+    """
+
+    def __init__(self):
+        """Initialize empty accumulators"""
+        self.count = 0
+        self.mean = 0.0
+        self.min = None
+        self.max = None
+        self._m2 = 0.0      # Sum of squared deviations from the mean
+
+    def update(self, value):
+        """
+        Add a value (Welford's update)
+
+        Args:
+            value (float): New observation
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def variance(self):
+        """Sample variance (0.0 for fewer than two values)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        """Sample standard deviation"""
+        return math.sqrt(self.variance)
+
+
+class MetricHistory:
+    """
+    Record history summarized by running accumulators
+
+    Each appended record (a dict) updates one RunningStats per tracked
+    field; the record itself is only kept if it is drawn into the reservoir.
+    Like AuditLog, len(), iteration and indexing operate on the records kept
+    in memory, while total_records counts everything appended.
+
+    Attributes:
+        fields: Numeric record fields with running statistics
+        reservoir_size: Number of records kept as a uniform sample (0 keeps none)
+        total_records: Records appended since the last clear()
+        stats: Field name -> RunningStats
+    """
+
+    def __init__(self, fields, reservoir_size=1000, rng=None):
+        """
+        Initialize the history
+
+        Args:
+            fields (tuple): Numeric record fields to summarize
+            reservoir_size (int): Size of the record sample kept in memory
+            rng (random.Random): Optional source of sampling positions
+        """
+        self.fields = tuple(fields)
+        self.reservoir_size = reservoir_size
+        self._rng = rng or random.Random()
+        self.clear()
+
+    def append(self, record):
+        """
+        Add a record
+
+        Args:
+            record (dict): Record holding every tracked field
+        """
+        self.total_records += 1
+        for field in self.fields:
+            self.stats[field].update(record[field])
+
+        # Algorithm R: keep each of the n records seen with probability k/n
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(record)
+        elif self.reservoir_size:
+            slot = self._rng.randrange(self.total_records)
+            if slot < self.reservoir_size:
+                self._reservoir[slot] = record
+
+    def clear(self):
+        """Forget all records and statistics"""
+        self.total_records = 0
+        self.stats = {field: RunningStats() for field in self.fields}
+        self._reservoir = []
+
+    def __len__(self):
+        return len(self._reservoir)
+
+    def __bool__(self):
+        return self.total_records > 0
+
+    def __iter__(self):
+        return iter(list(self._reservoir))
+
+    def __getitem__(self, item):
+        return self._reservoir[item]
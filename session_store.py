@@ -0,0 +1,222 @@
+"""
+Session Store Module - Bounded Session Key Storage
+
+Long-running processes create a key for every session that ever connects.
+This module keeps those keys in a bounded store instead of an ever-growing
+dict: entries expire after a time-to-live, and the least recently used
+entries are evicted when the entry or memory cap is reached.
+
+Key Features:
+- Time-to-live expiry checked on access and by purge_expired()
+- LRU eviction under a maximum entry count and an approximate memory cap
+- Lookup by session id and by user id
+- get_or_create() reuses a live key instead of generating a new one
+- Hit, miss, eviction and expiry counters
+"""
+
+import time                 # Monotonic clock for expiry
+import threading            # Thread-safe access from concurrent sessions
+from collections import OrderedDict  # LRU ordering
+
+
+class SessionKeyStore:
+    """
+    Thread-safe session key store with TTL and LRU eviction
+
+    Entries are dicts holding at least 'key', 'session_id', 'user_id' and
+    'expires_at' plus any metadata given when the key was stored. Reading an
+    entry marks it as most recently used.
+
+    Attributes:
+        max_entries: Maximum number of stored sessions
+        max_bytes: Approximate memory cap for stored keys and metadata
+        ttl: Seconds a key stays valid after it is stored (None = no expiry)
+        stats: Hit, miss, eviction and expiry counters
+    """
+
+    # Approximate per-entry bookkeeping cost counted against max_bytes
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, max_entries=1024, max_bytes=1 << 20, ttl=3600.0, clock=time.monotonic):
+        """
+        Initialize the session key store
+
+        Args:
+            max_entries (int): Maximum number of stored sessions
+            max_bytes (int): Approximate memory cap in bytes
+            ttl (float): Key lifetime in seconds (None disables expiry)
+            clock: Callable returning the current time in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+
+        self._entries = OrderedDict()   # session_id -> entry, least recently used first
+        self._by_user = {}              # user_id -> set of session ids
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+
+        self.stats = {
+            'hits': 0,          # Lookups that found a live key
+            'misses': 0,        # Lookups that found nothing usable
+            'evictions': 0,     # Entries dropped for the entry or memory cap
+            'expirations': 0    # Entries dropped after their TTL
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, session_id):
+        return self.get(session_id, count=False) is not None
+
+    @property
+    def memory_bytes(self):
+        """Approximate memory used by stored entries"""
+        return self._memory_bytes
+
+    def put(self, session_id, key, user_id=None, **metadata):
+        """
+        Store a key for a session, replacing any previous key
+
+        Args:
+            session_id: Session identifier
+            key (bytes): Session key
+            user_id: Optional owner used for lookup by user
+            **metadata: Extra fields stored with the entry
+
+        Returns:
+            dict: The stored entry
+        """
+        now = self.clock()
+        entry = dict(metadata, key=key, session_id=session_id, user_id=user_id,
+                     expires_at=None if self.ttl is None else now + self.ttl)
+
+        with self._lock:
+            self._remove(session_id)
+            self._entries[session_id] = entry
+            self._memory_bytes += self._entry_size(entry)
+            if user_id is not None:
+                self._by_user.setdefault(user_id, set()).add(session_id)
+            self._enforce_limits()
+        return entry
+
+    def get(self, session_id, count=True):
+        """
+        Look up the live entry of a session
+
+        Args:
+            session_id: Session identifier
+            count (bool): Update the hit/miss counters
+
+        Returns:
+            dict: Entry, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and self._expired(entry, self.clock()):
+                self._remove(session_id)
+                self.stats['expirations'] += 1
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(session_id)
+            if count:
+                self.stats['hits' if entry is not None else 'misses'] += 1
+            return entry
+
+    def get_key(self, session_id):
+        """Return the live key of a session, or None"""
+        entry = self.get(session_id)
+        return entry['key'] if entry is not None else None
+
+    def get_or_create(self, session_id, key_factory, user_id=None, **metadata):
+        """
+        Return the live entry of a session, creating it only if needed
+
+        Args:
+            session_id: Session identifier
+            key_factory: Callable returning a new key
+            user_id: Optional owner used for lookup by user
+            **metadata: Extra fields stored with a newly created entry
+
+        Returns:
+            dict: Existing live entry or the newly stored one
+        """
+        with self._lock:
+            entry = self.get(session_id)
+            if entry is not None:
+                return entry
+            return self.put(session_id, key_factory(), user_id, **metadata)
+
+    def sessions_for_user(self, user_id):
+        """
+        Look up every live entry owned by a user
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            list: Live entries of the user's sessions
+        """
+        with self._lock:
+            session_ids = list(self._by_user.get(user_id, ()))
+            entries = (self.get(session_id, count=False) for session_id in session_ids)
+            return [entry for entry in entries if entry is not None]
+
+    def remove(self, session_id):
+        """Drop a session's key; returns True if it was stored"""
+        with self._lock:
+            return self._remove(session_id)
+
+    def purge_expired(self):
+        """
+        Drop every expired entry
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = self.clock()
+        with self._lock:
+            expired = [session_id for session_id, entry in self._entries.items()
+                       if self._expired(entry, now)]
+            for session_id in expired:
+                self._remove(session_id)
+            self.stats['expirations'] += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Drop every stored key"""
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self._memory_bytes = 0
+
+    def _expired(self, entry, now):
+        """Check whether an entry has outlived its TTL"""
+        return entry['expires_at'] is not None and now >= entry['expires_at']
+
+    def _entry_size(self, entry):
+        """Approximate memory used by one entry"""
+        return self.ENTRY_OVERHEAD + sum(
+            len(value) for value in entry.values() if isinstance(value, (str, bytes)))
+
+    def _remove(self, session_id):
+        """Remove an entry and its user index (lock held by caller)"""
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return False
+        self._memory_bytes -= self._entry_size(entry)
+        user_sessions = self._by_user.get(entry['user_id'])
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._by_user[entry['user_id']]
+        return True
+
+    def _enforce_limits(self):
+        """Evict least recently used entries beyond the caps (lock held by caller)"""
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._memory_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self.stats['evictions'] += 1
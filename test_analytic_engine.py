@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Analytic Engine Test - NumPy Statevector vs Qiskit Circuit Simulation
+
+This test cross-validates the vectorized NumPy protocol engine against the
+Qiskit circuits built by SuperdenseCodingProtocol.
+
+PURPOSE:
+- Compare exact outcome probabilities for every message and every
+  combination of channel Pauli errors, with and without RZ phase errors
+- Check that noiseless analytic runs decode every message
+- Verify that protocol runs can select the analytic engine per call
+- Check Pauli-frame propagation against the exact statevector outcomes
+- Compare density-matrix Kraus channels with Qiskit's DensityMatrix evolution
+- Keep the density-matrix probability table cache bounded as an LRU
+"""
+
+import sys
+import os
+import itertools
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from quantum_engines import (AnalyticProtocolEngine, PauliFrameSampler, DensityMatrixEngine,
+                             depolarizing_kraus, dephasing_kraus, amplitude_damping_kraus,
+                             PAULI_X, PAULI_Y, PAULI_Z, PAULI_X_COMPONENT, PAULI_Z_COMPONENT)
+from quantum_protocol import SuperdenseCodingProtocol, BATCH_MEASUREMENT_STATES, QISKIT_AVAILABLE
+
+def test_analytic_matches_qiskit_circuits():
+    if not QISKIT_AVAILABLE:
+        print("⚠️ Qiskit not available - skipping cross-validation")
+        return
+
+    from qiskit.quantum_info import Statevector
+
+    print("🧪 Cross-validating analytic engine against Qiskit circuits")
+    print("=" * 60)
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    engine = AnalyticProtocolEngine(seed=7)
+    phase_errors = (0.37, 1.1)
+    max_difference = 0.0
+
+    for bit0, bit1, error0, error1, with_phase in itertools.product(
+            [0, 1], [0, 1], range(4), range(4), [False, True]):
+        # Build the protocol circuit with explicit channel errors
+        circuit = protocol.encode_message(protocol.create_bell_state(), bit0, bit1)
+        for qubit, error in ((0, error0), (1, error1)):
+            if error == PAULI_X:
+                circuit.x(qubit)
+            elif error == PAULI_Y:
+                circuit.y(qubit)
+            elif error == PAULI_Z:
+                circuit.z(qubit)
+            if with_phase:
+                circuit.rz(phase_errors[qubit], qubit)
+        circuit = protocol.decode_message(circuit).remove_final_measurements(inplace=False)
+
+        # Qiskit probabilities are indexed by "bit1bit0"
+        qiskit_probabilities = Statevector(circuit).probabilities_dict()
+        expected = np.array([qiskit_probabilities.get(f"{state[1]}{state[0]}", 0.0)
+                             for state in BATCH_MEASUREMENT_STATES])
+
+        analytic = engine.outcome_probabilities(
+            [[bit0, bit1]], [[error0, error1]],
+            [phase_errors] if with_phase else None)[0]
+
+        max_difference = max(max_difference, np.abs(expected - analytic).max())
+
+    print(f"   📊 Maximum probability difference: {max_difference:.2e}")
+    assert max_difference < 1e-12
+    print("   ✅ Analytic engine matches circuit simulation exactly")
+
+def test_pauli_frames_match_statevector():
+    print("\n🧪 Checking Pauli-frame propagation against the statevector")
+
+    engine = AnalyticProtocolEngine(seed=3)
+    sampler = PauliFrameSampler(seed=3, statevector_engine=engine)
+
+    for bit0, bit1, error0, error1 in itertools.product([0, 1], [0, 1], range(4), range(4)):
+        flip_bit0, flip_bit1 = sampler.propagate_frames(
+            PAULI_X_COMPONENT[error0], PAULI_Z_COMPONENT[error0],
+            PAULI_X_COMPONENT[error1], PAULI_Z_COMPONENT[error1])
+        frame_outcome = 2 * (bit0 ^ flip_bit0) + (bit1 ^ flip_bit1)
+
+        probabilities = engine.outcome_probabilities([[bit0, bit1]], [[error0, error1]])[0]
+        assert np.isclose(probabilities[frame_outcome], 1.0)
+
+    # Per-shot sampling keeps every shot and decodes perfectly without noise
+    counts = sampler.sample_shots(1, 0, 0.0, 100_000)
+    assert counts.tolist() == [0, 0, 100_000, 0]
+
+    noisy_counts = sampler.sample_shots(0, 1, 0.3, 100_000)
+    assert noisy_counts.sum() == 100_000
+
+    print(f"   ✅ Frames agree with statevector; noisy shot counts {noisy_counts.tolist()}")
+
+def test_density_matrix_matches_qiskit_channels():
+    if not QISKIT_AVAILABLE:
+        print("⚠️ Qiskit not available - skipping density-matrix cross-validation")
+        return
+
+    from qiskit.quantum_info import DensityMatrix, Kraus
+
+    print("\n🧪 Cross-validating density-matrix engine against Qiskit channels")
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    engine = DensityMatrixEngine(depolarizing=0.5, dephasing=0.3, amplitude_damping=0.4)
+    noise_levels = np.array([0.0, 0.1, 0.45, 0.9])
+    tables = engine.probability_table(noise_levels)
+
+    for level, table in zip(noise_levels, tables):
+        channels = [kraus_builder(strength * level)[0]
+                    for kraus_builder, strength in ((depolarizing_kraus, 0.5),
+                                                    (dephasing_kraus, 0.3),
+                                                    (amplitude_damping_kraus, 0.4))]
+        for bit0, bit1 in itertools.product([0, 1], [0, 1]):
+            state = DensityMatrix(protocol.encode_message(protocol.create_bell_state(), bit0, bit1)
+                                  .remove_final_measurements(inplace=False))
+            for kraus in channels:
+                for qubit in (0, 1):
+                    state = state.evolve(Kraus(list(kraus)), qargs=[qubit])
+
+            decoder = protocol.decode_message(protocol.create_bell_state().copy_empty_like())
+            state = state.evolve(decoder.remove_final_measurements(inplace=False))
+            qiskit_probabilities = state.probabilities_dict()
+            expected = [qiskit_probabilities.get(f"{s[1]}{s[0]}", 0.0) for s in BATCH_MEASUREMENT_STATES]
+
+            assert np.allclose(table[2 * bit0 + bit1], expected, atol=1e-12)
+
+    print(f"   ✅ Probability tables match Qiskit for {len(noise_levels)} noise levels")
+
+def test_density_matrix_table_cache():
+    print("\n🧪 Testing the bounded probability table cache")
+
+    engine = DensityMatrixEngine(depolarizing=0.5, dephasing=0.3)
+    engine.TABLE_CACHE_SIZE = 8
+    engine.probability_table(np.linspace(0.0, 0.5, 20))
+    assert len(engine._table_cache) == 8
+
+    # Recently used levels stay cached, and a full cache still admits new ones
+    recent = list(engine._table_cache)[0]
+    engine.probability_table([recent, 0.77])
+    assert len(engine._table_cache) == 8
+    assert list(engine._table_cache)[-2:] == [recent, 0.77]
+    assert np.allclose(engine._table_cache[0.77], DensityMatrixEngine(depolarizing=0.5, dephasing=0.3)
+                       .probability_table([0.77])[0])
+
+    print(f"   ✅ Cache held at {len(engine._table_cache)} tables, least recently used evicted")
+
+def test_analytic_protocol_runs():
+    print("\n🧪 Testing protocol runs with the analytic engine")
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+
+    pairs = [(0, 0), (0, 1), (1, 0), (1, 1)] * 100
+    result = protocol.run_protocol_batch(pairs, noise_level=0.0, engine='analytic')
+    assert (result['decoded_bits'] == result['original_bits']).all()
+    assert (result['measurement_counts'].sum(axis=1) == 1024).all()
+
+    single = protocol.run_protocol(1, 1, noise_level=0.0, engine='analytic')
+    assert single['decoded_bits'] == [1, 1]
+
+    for engine in ('pauli_frame', 'density_matrix'):
+        frames = protocol.run_protocol_batch(pairs, noise_level=0.0, engine=engine)
+        assert (frames['decoded_bits'] == frames['original_bits']).all()
+
+    print(f"   ✅ {len(pairs)} noiseless messages decoded, single run decoded {single['decoded_bits']}")
+
+if __name__ == "__main__":
+    test_analytic_matches_qiskit_circuits()
+    test_pauli_frames_match_statevector()
+    test_density_matrix_matches_qiskit_channels()
+    test_density_matrix_table_cache()
+    test_analytic_protocol_runs()
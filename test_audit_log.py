@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Audit Log Test - Append-Only Rotating Audit Logs
+
+This test checks that encryption and security events are written to
+rotating JSONL segments while only the latest records stay in memory.
+
+PURPOSE:
+- Bound the in-memory ring buffer
+- Rotate segments by size and keep backup_count of them
+- Answer time-range queries from disk using the offset index
+- Query records written before the log was reopened
+- Keep only the active segment when no backups are kept
+"""
+
+import sys
+import os
+import time
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from audit_log import AuditLog
+from quantum_protocol import QuantumCryptographyEngine
+
+def test_rotation_ring_and_queries():
+    print("🧪 Testing rotating audit log")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'security.jsonl')
+        log = AuditLog(path, max_bytes=4096, backup_count=3, ring_size=10, index_interval=8)
+
+        for index in range(100):
+            log.append({'timestamp': datetime.now(), 'event': index, 'secure': index % 2 == 0})
+        middle = time.time()
+        for index in range(100, 150):
+            log.append({'timestamp': datetime.now(), 'event': index})
+
+        # Only the newest records are kept in memory
+        assert len(log) == 10 and log[-1]['event'] == 149
+
+        # Size-based rotation keeps at most backup_count old segments
+        segments = sorted(os.listdir(directory))
+        assert segments[0] == 'security.jsonl' and len(segments) == 4
+        assert all(os.path.getsize(os.path.join(directory, name)) <= 4096 for name in segments)
+
+        # Time-range query from disk returns the records appended after `middle`
+        recent = log.query(start=middle)
+        assert [record['event'] for record in recent] == list(range(100, 150))
+        assert isinstance(recent[0]['timestamp'], str)
+        log.close()
+
+    print(f"   ✅ {log.total_records} records, {len(segments)} segments, ring of {len(log)}")
+
+def test_reopened_log_queries():
+    print("\n🧪 Querying a reopened audit log")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'encryption.jsonl')
+        log = AuditLog(path, max_bytes=1024, backup_count=5, index_interval=4)
+        for index in range(60):
+            log.append({'event': index})
+        middle = time.time()
+        for index in range(60, 80):
+            log.append({'event': index})
+        log.close()
+        assert len(os.listdir(directory)) > 2
+
+        # A new process sees every record on disk, in every segment
+        reopened = AuditLog(path, max_bytes=1024, backup_count=5, index_interval=4)
+        assert len(reopened) == 0
+        assert [record['event'] for record in reopened.query()] == list(range(80))
+        assert [record['event'] for record in reopened.query(start=middle)] == list(range(60, 80))
+
+        # New records are appended after the old ones and rotate with them
+        for index in range(80, 120):
+            reopened.append({'event': index})
+        events = [record['event'] for record in reopened.query()]
+        assert events == list(range(events[0], 120))
+        reopened.close()
+
+    print("   ✅ Records from the previous process answered from disk")
+
+def test_rotation_without_backups():
+    print("\n🧪 Rotating without backups")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'security.jsonl')
+        log = AuditLog(path, max_bytes=1024, backup_count=0, index_interval=4)
+        for index in range(60):
+            log.append({'event': index})
+        middle = time.time()
+        for index in range(60, 80):
+            log.append({'event': index})
+
+        # The active file starts over instead of growing past max_bytes
+        assert os.listdir(directory) == ['security.jsonl']
+        assert os.path.getsize(path) <= 1024
+
+        # Index offsets point into the restarted file
+        events = [record['event'] for record in log.query()]
+        assert events == list(range(events[0], 80)) and events[0] > 0
+        assert [record['event'] for record in log.query(start=middle)] == [e for e in events if e >= 60]
+        log.close()
+
+    print(f"   ✅ {len(events)} records kept in a single {os.path.basename(path)}")
+
+def test_engine_log_is_bounded():
+    print("\n🧪 Testing bounded encryption log")
+
+    engine = QuantumCryptographyEngine()
+    for _ in range(engine.encryption_log.ring_size + 50):
+        engine.quantum_encrypt_message([1, 0])
+
+    assert len(engine.encryption_log) == engine.encryption_log.ring_size
+    print(f"   ✅ Encryption log kept {len(engine.encryption_log)} in-memory records")
+
+if __name__ == "__main__":
+    test_rotation_ring_and_queries()
+    test_reopened_log_queries()
+    test_rotation_without_backups()
+    test_engine_log_is_bounded()
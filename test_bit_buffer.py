@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Bit Buffer Test - Shared Bit/Byte Packing
+
+This test checks the single MSB-first bit order used by the QRNG, the
+cryptography engine and the text pipeline.
+
+PURPOSE:
+- Verify MSB-first packing, zero padding and truncated unpacking
+- Confirm bytes-like inputs are viewed without copying
+- Check the crypto engine conversions round-trip through the shared helpers
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bit_buffer import (as_byte_array, pack_bits, unpack_bits, pack_bit_string,
+                        bits_to_bytes, bytes_to_bits)
+from quantum_protocol import QuantumCryptographyEngine
+
+def test_bit_order_and_padding():
+    print("🧪 Testing MSB-first bit packing")
+    print("=" * 50)
+
+    assert bits_to_bytes([1, 0, 0, 0, 0, 0, 0, 1]) == b'\x81'
+    assert bits_to_bytes([1, 1]) == b'\xc0'                 # Zero-padded partial byte
+    assert bytes_to_bits(b'\x81') == [1, 0, 0, 0, 0, 0, 0, 1]
+    assert unpack_bits(b'\xff\x00', 10).tolist() == [1] * 8 + [0, 0]
+    assert pack_bit_string('0000000111111111').tolist() == [1, 255]
+    assert pack_bits(unpack_bits(b'quantum')).tobytes() == b'quantum'
+
+    print("   ✅ Packing, padding and truncation follow one bit order")
+
+def test_zero_copy_views():
+    print("\n🧪 Testing zero-copy byte views")
+
+    buffer = bytearray(b'ab')
+    view = as_byte_array(memoryview(buffer))
+    buffer[0] = 0
+    assert view[0] == 0
+
+    engine = QuantumCryptographyEngine()
+    bits = [1, 0, 1, 1, 0, 0, 1, 0, 1]
+    assert engine._bytes_to_bits(engine._bits_to_bytes(bits))[:len(bits)] == bits
+
+    print("   ✅ memoryview input shares memory; crypto helpers round-trip")
+
+if __name__ == "__main__":
+    test_bit_order_and_padding()
+    test_zero_copy_views()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Bulk Crypto Test - Parallel Encryption over a Process Pool
+
+This test checks encrypt_many / decrypt_many on a mix of small bit-list
+messages and large byte payloads that travel through shared memory.
+
+PURPOSE:
+- Round-trip every message, with results in the original order
+- Give every message its own key and nonce across worker processes
+- Keep packages compatible with quantum_decrypt_message
+- Reuse the engine's worker processes across calls
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from quantum_protocol import QuantumCryptographyEngine
+
+def test_encrypt_many_round_trip():
+    print("🧪 Testing parallel bulk encryption")
+    print("=" * 50)
+
+    engine = QuantumCryptographyEngine()
+    large = os.urandom(engine.SHARED_MEMORY_THRESHOLD * 3)
+    messages = [[index % 2, 1, 0, 1] * (index + 1) for index in range(40)] + [large, b'tiny']
+
+    packages = engine.encrypt_many(messages, max_workers=2)
+    assert len(packages) == len(messages)
+    assert packages[-2]['encrypted_data'] != large
+
+    # Independent randomness per message, even across workers
+    assert len({package['quantum_key'] for package in packages}) == len(messages)
+    assert len({package['nonce'] for package in packages}) == len(messages)
+
+    decrypted = engine.decrypt_many(packages, as_bytes=True, max_workers=2)
+    assert decrypted[-2] == large and decrypted[-1] == b'tiny'
+    for message, data in zip(messages[:40], decrypted):
+        assert data == engine._bits_to_bytes(message)
+
+    # Bit-list packages stay compatible with the single-message API
+    assert engine.quantum_decrypt_message(packages[5])[:len(messages[5])] == messages[5]
+
+    print(f"   ✅ {len(messages)} messages round-tripped in order")
+
+def test_worker_pool_reuse():
+    print("\n🧪 Reusing the bulk worker pool")
+
+    engine = QuantumCryptographyEngine()
+    first = engine.encrypt_many([b'a' * 48] * 20, max_workers=2)
+    pool = engine._bulk_pool
+    second = engine.encrypt_many([b'b' * 48] * 20, max_workers=2)
+    assert engine._bulk_pool is pool
+
+    # Workers keep advancing their keystream, so keys never repeat across calls
+    keys = {package['quantum_key'] for package in first + second}
+    assert len(keys) == 40
+    assert engine.decrypt_many(second, as_bytes=True, max_workers=2) == [b'b' * 48] * 20
+
+    # A different worker count replaces the pool
+    engine.encrypt_many([b'c'], max_workers=1)
+    assert engine._bulk_pool is not pool
+    engine.close_bulk_pool()
+    assert engine._bulk_pool is None
+
+    print("   ✅ Two calls served by the same worker processes")
+
+if __name__ == "__main__":
+    test_encrypt_many_round_trip()
+    test_worker_pool_reuse()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Circuit Templates Test - Transpiled Message Circuit Cache
+
+This test checks the process-wide cache of transpiled noiseless message
+circuits that every protocol instance builds its runs on.
+
+PURPOSE:
+- Share one template per backend and message across protocol instances
+- Keep cached templates unchanged by channel noise and phase binding
+- Build noisy circuits on top of the template without transpiling again
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import quantum_protocol
+from quantum_protocol import SuperdenseCodingProtocol, QISKIT_AVAILABLE
+
+MESSAGES = [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+def test_templates_shared_across_instances():
+    print("🧪 Sharing templates across protocol instances")
+    print("=" * 50)
+    if not QISKIT_AVAILABLE:
+        print("   ⚠️ Qiskit not available - skipped")
+        return
+
+    first = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    second = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    backend = first.backend_pool.backend
+    for bit0, bit1 in MESSAGES:
+        template = first.get_circuit_template(bit0, bit1, backend)
+        assert second.get_circuit_template(bit0, bit1, backend) is template
+        assert set(template) == {'encoded', 'final', 'channel', 'phase'}
+    assert first.get_circuit_template(0, 1, backend) is not first.get_circuit_template(1, 0, backend)
+    print("   ✅ One template per message, shared by every instance")
+
+def test_templates_not_mutated():
+    print("\n🧪 Running noise and phase errors on top of the templates")
+    if not QISKIT_AVAILABLE:
+        print("   ⚠️ Qiskit not available - skipped")
+        return
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    backend = protocol.backend_pool.backend
+    snapshots = {message: {name: circuit.copy()
+                           for name, circuit in protocol.get_circuit_template(*message, backend).items()}
+                 for message in MESSAGES}
+
+    np.random.seed(3)
+    for bit0, bit1 in MESSAGES:
+        for _ in range(20):
+            protocol.build_transmission_circuit(bit0, bit1, 0.8, backend)
+        protocol.run_phase_error_batch(bit0, bit1, [[0.3, 0.0], [np.pi, 0.5]], shots=64)
+    protocol.run_noise_sweep([0.1, 0.3], shots=64)
+
+    for message in MESSAGES:
+        template = protocol.get_circuit_template(*message, backend)
+        for name, snapshot in snapshots[message].items():
+            assert template[name] == snapshot, f"template {message} '{name}' was modified"
+        assert len(template['phase'].parameters) == 2
+    print("   ✅ Templates unchanged after noisy runs and parameter binding")
+
+def test_noisy_circuit_not_retranspiled():
+    print("\n🧪 Building noisy circuits without transpiling")
+    if not QISKIT_AVAILABLE:
+        print("   ⚠️ Qiskit not available - skipped")
+        return
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    backend = protocol.backend_pool.backend
+    protocol.warm_circuit_templates(backend)
+
+    transpile_calls = []
+    original_transpile = quantum_protocol.transpile
+    def counting_transpile(*args, **kwargs):
+        transpile_calls.append(args)
+        return original_transpile(*args, **kwargs)
+
+    quantum_protocol.transpile = counting_transpile
+    try:
+        np.random.seed(5)
+        noisy = [protocol.build_transmission_circuit(1, 1, 0.9, backend) for _ in range(20)]
+        result = protocol.backend_pool.run(noisy, backend, shots=32)
+    finally:
+        quantum_protocol.transpile = original_transpile
+
+    assert transpile_calls == []
+    # At least one run drew a channel error, so a new circuit was built and executed as-is
+    assert any(circuit is not protocol.get_circuit_template(1, 1, backend)['final'] for circuit in noisy)
+    assert all(sum(counts.values()) == 32 for counts in result.get_counts())
+    print("   ✅ 20 noisy circuits built and run with no transpile call")
+
+if __name__ == "__main__":
+    test_templates_shared_across_instances()
+    test_templates_not_mutated()
+    test_noisy_circuit_not_retranspiled()
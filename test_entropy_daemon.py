@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Entropy Daemon Test - Shared QRNG Served Over a Unix Socket
+
+This test runs the entropy daemon on a temporary socket and reads from it
+through buffered clients.
+
+PURPOSE:
+- Serve length-prefixed requests, batching small client reads
+- Never hand the same bytes to two clients
+- Refuse to take over the socket of a live daemon, replace a stale one
+- Generate the first batch before accepting clients
+- Drop connections cleanly when the daemon's source fails
+- Fall back to in-process generation when the daemon is down
+- Feed a QuantumRandomGenerator's entropy pool from the daemon
+"""
+
+import sys
+import os
+import socket
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import secrets
+from entropy_daemon import EntropyDaemon, EntropyDaemonClient, LENGTH
+from quantum_protocol import QuantumRandomGenerator
+
+def _unused_fallback(num_bytes):
+    raise RuntimeError("daemon should have served this read")
+
+def test_daemon_requests():
+    print("🧪 Reading from the entropy daemon")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'entropy.sock')
+        daemon = EntropyDaemon(socket_path, secrets.token_bytes, capacity=1 << 16, refill_chunk=4096)
+        daemon.start()
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+        # Raw protocol: length prefix in, length prefix and bytes out
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            connection.sendall(LENGTH.pack(100))
+            header = connection.recv(LENGTH.size)
+            assert LENGTH.unpack(header)[0] == 100
+
+        # Small reads are batched into buffer_size requests
+        first = EntropyDaemonClient(socket_path, _unused_fallback, buffer_size=4096)
+        second = EntropyDaemonClient(socket_path, _unused_fallback, buffer_size=4096)
+        blocks = [client.read(16) for _ in range(300) for client in (first, second)]
+        assert len(set(blocks)) == 600 and all(len(block) == 16 for block in blocks)
+        assert first.stats['requests'] == 2 and first.stats['fallbacks'] == 0
+
+        # Reads larger than one protocol request are split
+        assert len(first.read(3 << 20)) == 3 << 20
+        first.close()
+        second.close()
+        daemon.close()
+        assert not os.path.exists(socket_path)
+
+    print(f"   ✅ Daemon stats: {daemon.stats}")
+
+def test_socket_takeover():
+    print("\n🧪 Protecting the socket path")
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'run', 'entropy.sock')
+        daemon = EntropyDaemon(socket_path, secrets.token_bytes, capacity=4096)
+        daemon.start()
+        assert os.stat(os.path.dirname(socket_path)).st_mode & 0o777 == 0o700
+
+        # A second daemon must not hijack the live one's socket
+        second = EntropyDaemon(socket_path, secrets.token_bytes, capacity=4096)
+        try:
+            second.start()
+            assert False, "second daemon took over a live socket"
+        except RuntimeError:
+            pass
+        second.close()
+        assert os.path.exists(socket_path)
+        daemon.close()
+
+        # A socket file left by a dead daemon is replaced
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        restarted = EntropyDaemon(socket_path, secrets.token_bytes, capacity=4096)
+        restarted.start()
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        restarted.close()
+
+    print("   ✅ Live daemon kept its socket, stale socket replaced")
+
+def test_source_failure():
+    print("\n🧪 Serving from a failing source")
+
+    failing = []
+    def source(num_bytes):
+        if failing:
+            raise RuntimeError("entropy source quarantined")
+        return secrets.token_bytes(num_bytes)
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'entropy.sock')
+        daemon = EntropyDaemon(socket_path, source, capacity=4096, refill_chunk=4096)
+        daemon.start()
+        # The first batch is ready before any client can connect
+        assert daemon.pool.level == 4096
+        failing.append(True)
+
+        client = EntropyDaemonClient(socket_path, secrets.token_bytes, buffer_size=4096)
+        assert len(client.read(4096)) == 4096 and client.stats['fallbacks'] == 0
+
+        # The empty pool cannot be refilled: the daemon drops the request
+        assert len(client.read(4096)) == 4096 and client.stats['fallbacks'] == 1
+        assert daemon.stats['source_errors'] == 1
+        client.close()
+        daemon.close()
+
+    print(f"   ✅ Daemon stats: {daemon.stats}")
+
+def test_fallback_when_down():
+    print("\n🧪 Falling back while the daemon is down")
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'entropy.sock')
+        client = EntropyDaemonClient(socket_path, secrets.token_bytes, retry_interval=0.0)
+        assert len(client.read(32)) == 32 and client.stats['fallbacks'] == 1
+
+        # The client reconnects once the daemon is up
+        daemon = EntropyDaemon(socket_path, secrets.token_bytes, capacity=1 << 16)
+        daemon.start()
+        assert len(client.read(32)) == 32 and client.stats['fallbacks'] == 1
+        assert client.stats['daemon_bytes'] >= 32
+
+        # A daemon that goes away mid-session is replaced by the fallback
+        daemon.close()
+        client._buffer.clear()
+        assert len(client.read(32)) == 32 and client.stats['fallbacks'] == 2
+        client.close()
+
+    print(f"   ✅ Client stats: {client.stats}")
+
+def test_generator_uses_daemon():
+    print("\n🧪 Feeding a generator from the daemon")
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, 'entropy.sock')
+        daemon = EntropyDaemon(socket_path, secrets.token_bytes, capacity=1 << 18)
+        daemon.start()
+
+        client = EntropyDaemonClient(socket_path, _unused_fallback)
+        qrng = QuantumRandomGenerator(entropy_daemon=client)
+        assert len(qrng.generate_quantum_key(256)) == 32
+        assert qrng.seed_counter == 0 and client.stats['daemon_bytes'] >= 32
+        qrng.entropy_pool.close()
+        client.close()
+        daemon.close()
+
+    print(f"   ✅ {client.stats['daemon_bytes']} bytes fetched from the daemon, no local quantum jobs")
+
+if __name__ == "__main__":
+    test_daemon_requests()
+    test_socket_takeover()
+    test_source_failure()
+    test_fallback_when_down()
+    test_generator_uses_daemon()
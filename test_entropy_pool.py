@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Entropy Pool Test - Buffered Quantum Randomness
+
+This test checks that QuantumRandomGenerator serves keys, nonces and bits
+from a bounded entropy pool refilled by a background thread.
+
+PURPOSE:
+- Verify read sizes and that pool bytes are never handed out twice
+- Confirm the background thread refills the buffer up to high_water
+- Check that reads outrunning the buffer are topped up synchronously
+- Harvest every shot of a single QRNG job with per-shot memory
+- Check that one encryption fetches its whole randomness budget at once
+- Grow the buffered depth with the key request rate so bursts do not stall
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import secrets
+import numpy as np
+from entropy_pool import QuantumEntropyPool
+from quantum_protocol import QuantumRandomGenerator, QuantumCryptographyEngine, QISKIT_AVAILABLE
+
+def test_pool_refill_and_stalls():
+    print("🧪 Testing entropy pool refill")
+    print("=" * 50)
+
+    pool = QuantumEntropyPool(secrets.token_bytes, capacity=1024, refill_chunk=256)
+    pool.fill()
+    assert pool.level == 1024
+
+    # Draining below low_water wakes the refill thread
+    first = pool.read(900)
+    deadline = time.time() + 5
+    while pool.level < pool.high_water and time.time() < deadline:
+        time.sleep(0.01)
+    assert pool.level == pool.high_water
+    assert pool.stats['refills'] >= 1
+
+    # A read larger than the buffer is completed from the source directly
+    second = pool.read(2000)
+    assert len(first) == 900 and len(second) == 2000
+    assert pool.stats['stalls'] == 1
+    assert pool.stats['bytes_served'] == 2900
+    pool.close()
+
+    print(f"   ✅ Pool stats: {pool.stats}")
+
+def test_generator_reads():
+    print("\n🧪 Testing QRNG reads from the entropy pool")
+
+    qrng = QuantumRandomGenerator()
+    key = qrng.generate_quantum_key(256)
+    nonces = {qrng.generate_quantum_nonce(16) for _ in range(100)}
+    bits = qrng.generate_quantum_random_bits(1000)
+
+    assert len(key) == 32
+    assert len(nonces) == 100 and all(len(n) == 16 for n in nonces)
+    assert len(bits) == 1000 and set(bits) <= {0, 1}
+    assert 400 < sum(bits) < 600
+
+    print(f"   ✅ Key {key.hex()[:16]}..., 100 unique nonces, {sum(bits)} ones in 1000 bits")
+
+def test_harvest_every_shot():
+    if not QISKIT_AVAILABLE:
+        print("⚠️ Qiskit not available - skipping per-shot harvesting")
+        return
+
+    print("\n🧪 Testing per-shot memory harvesting")
+
+    qrng = QuantumRandomGenerator()
+    packed = qrng.harvest_quantum_bits(num_qubits=16, shots=4096)
+
+    # All 16 x 4096 measured bits come back from a single job
+    assert packed.dtype == np.uint8 and packed.shape == (16 * 4096 // 8,)
+    ones_fraction = np.unpackbits(packed).mean()
+    assert 0.49 < ones_fraction < 0.51
+
+    print(f"   ✅ {packed.size} bytes from one job, {ones_fraction:.4f} fraction of ones")
+
+def test_single_request_per_encryption():
+    print("\n🧪 Testing the per-message randomness budget")
+
+    engine = QuantumCryptographyEngine()
+    pool = engine.qrng.entropy_pool
+    bundles = []
+    original_read = pool.read
+    pool.read = lambda num_bytes: bundles.append(original_read(num_bytes)) or bundles[-1]
+
+    # Key + nonce + salt; key stretching is derived, not drawn from the QRNG
+    budget = engine.KEY_BYTES + engine.NONCE_BYTES + engine.SALT_BYTES
+    for message_bits in ([1, 0] * 256, [0, 1]):
+        bundles.clear()
+        package = engine.quantum_encrypt_message(message_bits)
+        assert [len(bundle) for bundle in bundles] == [budget]
+        assert package['quantum_key'] + package['nonce'] == bundles[0][:40]
+
+    print(f"   ✅ One {budget}-byte pool read per message")
+
+def test_key_request_rate_adapts_depth():
+    print("\n🧪 Testing rate-adaptive key bundle buffering")
+
+    pool = QuantumEntropyPool(secrets.token_bytes, capacity=480, refill_chunk=480,
+                              target_seconds=1.0, max_capacity=1 << 15)
+    engine = QuantumCryptographyEngine(qrng=QuantumRandomGenerator(entropy_pool=pool))
+    pool.fill()
+    bundle_size = engine.KEY_BYTES + engine.NONCE_BYTES + engine.SALT_BYTES
+
+    # A slow trickle of requests keeps the configured depth
+    for _ in range(4):
+        engine._key_bundle()
+        time.sleep(0.2)
+    assert pool.high_water == 480 and pool.stats['stalls'] == 0
+
+    # A fast burst raises the target depth, and the refill thread catches up
+    burst = [engine._key_bundle() for _ in range(200)]
+    assert all(len(bundle) == bundle_size for bundle in burst)
+    assert pool.high_water > 200 * bundle_size
+    deadline = time.time() + 5
+    while pool.level < 200 * bundle_size and time.time() < deadline:
+        time.sleep(0.01)
+    assert pool.level >= 200 * bundle_size
+
+    # The next burst of the same size is served entirely from the buffer
+    stalls_before = pool.stats['stalls']
+    second_burst = [engine._key_bundle() for _ in range(200)]
+    assert pool.stats['stalls'] == stalls_before
+    assert len(set(burst + second_burst)) == 400
+    pool.close()
+
+    print(f"   ✅ Depth grew from 480 to {pool.high_water} bytes, no stalls on the second burst")
+
+if __name__ == "__main__":
+    test_pool_refill_and_stalls()
+    test_generator_reads()
+    test_harvest_every_shot()
+    test_single_request_per_encryption()
+    test_key_request_rate_adapts_depth()
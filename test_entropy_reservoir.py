@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Entropy Reservoir Test - Persistent Randomness Across Restarts
+
+This test checks the memory-mapped reservoir file behind the QRNG's
+entropy pool.
+
+PURPOSE:
+- Serve bytes left by an earlier process after reopening the file
+- Never serve a byte twice, across reopens and across worker processes
+- Wrap around the ring and refill in the background
+- Flush the read cursor to disk before bytes are returned
+- Let a fresh generator start from the reservoir instead of quantum jobs
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from entropy_reservoir import EntropyReservoir, get_entropy_reservoir
+from quantum_protocol import QuantumRandomGenerator
+
+def _exhausted_source(num_bytes):
+    raise RuntimeError("test reservoir should not need topping up")
+
+def _read_blocks(path, count):
+    """Worker process: read count 16-byte blocks from a shared reservoir"""
+    reservoir = EntropyReservoir(path, _exhausted_source, low_water=0)
+    blocks = [reservoir.read(16) for _ in range(count)]
+    reservoir.close()
+    return blocks
+
+def test_persistent_cursor():
+    print("🧪 Reopening a reservoir file")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'entropy.bin')
+        reservoir = EntropyReservoir(path, secrets.token_bytes, capacity=4096, low_water=0)
+        reservoir.fill()
+        assert reservoir.level == 4096
+        first = reservoir.read(1000)
+        reservoir.close()
+
+        # A new process picks up after the persisted cursor
+        reopened = EntropyReservoir(path, _exhausted_source, capacity=128, low_water=0)
+        assert reopened.capacity == 4096 and reopened.level == 3096
+        rest = reopened.read(3096)
+        assert len(rest) == 3096 and first not in rest
+        assert reopened.stats['stalls'] == 0
+
+        # Refilling wraps around the ring
+        reopened.source = secrets.token_bytes
+        reopened.fill()
+        wrapped = reopened.read(4096)
+        assert len(wrapped) == 4096 and wrapped[:1000] != first
+        reopened.close()
+
+        # Consumed bytes are wiped from the file
+        with open(path, 'rb') as reservoir_file:
+            assert first not in reservoir_file.read()
+
+    print("   ✅ Cursor persisted and consumed bytes never served again")
+
+def test_cursor_flushed_before_return():
+    print("\n🧪 Flushing the cursor before serving bytes")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'entropy.bin')
+        reservoir = get_entropy_reservoir(path, secrets.token_bytes, capacity=4096, low_water=0)
+        reservoir.fill()
+        flushed = []
+        flush_header = reservoir._flush_header
+        def recording_flush():
+            flushed.append(reservoir._cursors())
+            flush_header()
+        reservoir._flush_header = recording_flush
+
+        # The header flush runs after the cursor moved and before read() returns
+        reservoir.read(1000)
+        assert flushed == [(1000, 4096)]
+
+        # Closed reservoirs are dropped from the shared registry
+        reservoir.close()
+        reopened = get_entropy_reservoir(path, secrets.token_bytes, low_water=0)
+        assert reopened is not reservoir and reopened.level == 3096
+        reopened.close()
+
+    print("   ✅ Cursor persisted before the bytes were handed out")
+
+def test_background_refill():
+    print("\n🧪 Refilling below low_water")
+
+    with tempfile.TemporaryDirectory() as directory:
+        reservoir = EntropyReservoir(os.path.join(directory, 'entropy.bin'), secrets.token_bytes,
+                                     capacity=8192, refill_chunk=1024)
+        # Reading an empty reservoir wakes the refill thread; bytes it has
+        # not produced yet are topped up synchronously
+        assert reservoir.level == 0 and len(reservoir.read(100)) == 100
+        deadline = time.time() + 5
+        while reservoir.level < reservoir.capacity and time.time() < deadline:
+            time.sleep(0.01)
+        assert reservoir.level == reservoir.capacity and reservoir.stats['refills'] >= 1
+        reservoir.close()
+
+    print(f"   ✅ Reservoir stats: {reservoir.stats}")
+
+def test_shared_between_processes():
+    print("\n🧪 Sharing a reservoir between worker processes")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'entropy.bin')
+        reservoir = EntropyReservoir(path, secrets.token_bytes, capacity=4 * 200 * 16, low_water=0)
+        reservoir.fill()
+        reservoir.close()
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_read_blocks, [path] * 4, [200] * 4))
+        blocks = [block for result in results for block in result]
+        assert len(blocks) == 800 and len(set(blocks)) == 800
+
+    print("   ✅ 800 blocks read by 4 processes, all distinct")
+
+def test_generator_cold_start():
+    print("\n🧪 Starting a generator from a filled reservoir")
+
+    with tempfile.TemporaryDirectory() as directory:
+        reservoir = EntropyReservoir(os.path.join(directory, 'entropy.bin'), secrets.token_bytes,
+                                     capacity=1 << 18)
+        reservoir.fill()
+        reservoir.source = _exhausted_source
+
+        qrng = QuantumRandomGenerator(entropy_reservoir=reservoir)
+        start_time = time.time()
+        key = qrng.generate_quantum_key(256)
+        elapsed = time.time() - start_time
+        assert len(key) == 32 and qrng.seed_counter == 0
+        assert reservoir.stats['bytes_served'] >= 32
+        qrng.entropy_pool.close()
+        reservoir.close()
+
+    print(f"   ✅ First key served from the reservoir in {elapsed * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    test_persistent_cursor()
+    test_cursor_flushed_before_return()
+    test_background_refill()
+    test_shared_between_processes()
+    test_generator_cold_start()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Health Tests Test - Continuous SP 800-90B Monitoring of the QRNG
+
+This test checks the Repetition Count and Adaptive Proportion tests and the
+quarantine of a failing entropy source.
+
+PURPOSE:
+- Reproduce the SP 800-90B cutoff values
+- Pass random data regardless of chunking and alarm on stuck data
+- Quarantine a stuck quantum source while consumers keep getting bytes
+- Refuse to produce bytes once both sources are quarantined
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from health_tests import (ContinuousHealthTest, EntropyHealthMonitor,
+                          repetition_count_cutoff, adaptive_proportion_cutoff)
+from quantum_protocol import QuantumRandomGenerator, QISKIT_AVAILABLE
+
+def test_cutoffs():
+    print("🧪 Checking SP 800-90B cutoffs")
+    print("=" * 50)
+
+    alpha = 2.0 ** -20
+    assert repetition_count_cutoff(1.0, alpha) == 21 and repetition_count_cutoff(7.0, alpha) == 4
+    # 1 + CRITBINOM(W, 2^-H, 1 - alpha)
+    assert adaptive_proportion_cutoff(1.0, 1024, alpha) == 589
+    assert adaptive_proportion_cutoff(2.0, 512, alpha) == 177
+    assert adaptive_proportion_cutoff(7.0, 512, alpha) == 18
+    assert adaptive_proportion_cutoff(8.0, 512, alpha) == 13
+    # Default alpha of 2^-40
+    assert repetition_count_cutoff(7.0) == 7 and adaptive_proportion_cutoff(7.0, 512) == 26
+    print("   ✅ Cutoffs match the specification")
+
+def test_streaming_tests():
+    print("\n🧪 Streaming random and stuck data")
+
+    random_data = os.urandom(1 << 22)
+    whole = ContinuousHealthTest()
+    start_time = time.time()
+    assert whole.update(random_data)
+    elapsed = time.time() - start_time
+
+    chunked = ContinuousHealthTest()
+    for start in range(0, len(random_data), 1000):
+        assert chunked.update(random_data[start:start + 1000])
+    assert chunked.stats['longest_run'] == whole.stats['longest_run']
+    assert chunked.stats['max_window_count'] == whole.stats['max_window_count']
+
+    # A run split across chunks is still caught
+    stuck = ContinuousHealthTest()
+    assert stuck.update(b'\x01\x02\x07\x07\x07') and not stuck.update(b'\x07\x07\x07\x07\x03')
+    assert stuck.stats['rct_failures'] == 1 and stuck.stats['longest_run'] == 7
+
+    # A biased source without long runs trips the adaptive proportion test
+    biased = np.tile(np.array([0, 1, 0, 2, 0, 3], dtype=np.uint8), 100)
+    proportion = ContinuousHealthTest()
+    assert not proportion.update(biased) and proportion.stats['rct_failures'] == 0
+
+    print(f"   ✅ 4 MiB tested in {elapsed * 1000:.1f} ms; stuck data rejected")
+
+def test_quarantine():
+    print("\n🧪 Quarantining a failing source")
+
+    now = [0.0]
+    monitor = EntropyHealthMonitor(quarantine_seconds=10.0, clock=lambda: now[0])
+    assert monitor.check('quantum', os.urandom(4096))
+    assert not monitor.check('quantum', b'\x00' * 4096)
+    assert monitor.is_quarantined('quantum') and not monitor.is_quarantined('fallback')
+    assert len(monitor.alarms) == 1 and monitor.stats()['quantum']['quarantined']
+    now[0] = 11.0
+    assert not monitor.is_quarantined('quantum')
+
+    # A stuck quantum source is replaced by the fallback without stalling
+    qrng = QuantumRandomGenerator()
+    qrng.harvest_quantum_bits = lambda num_qubits=None, shots=1024: np.zeros(shots * 2, dtype=np.uint8)
+    batch = qrng.generate_entropy_batch(4096)
+    assert len(batch) == 4096 and batch != b'\x00' * 4096
+    if QISKIT_AVAILABLE:
+        assert qrng.health_monitor.is_quarantined('quantum')
+    assert len(qrng.generate_quantum_bytes(32)) == 32
+
+    # With the fallback quarantined too, no bytes are handed out
+    assert not qrng.health_monitor.check('fallback', b'\x00' * 4096)
+    try:
+        qrng.generate_entropy_batch(4096)
+        assert False, "unhealthy sources must not produce bytes"
+    except RuntimeError:
+        pass
+
+    print(f"   ✅ {len(qrng.health_monitor.alarms)} alarm(s), fallback served the batch")
+
+if __name__ == "__main__":
+    test_cutoffs()
+    test_streaming_tests()
+    test_quarantine()
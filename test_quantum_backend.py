@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Quantum Backend Test - Shared Simulator Pool
+
+This test checks job submission through the process-wide backend pool and
+its reconfiguration while protocol and QRNG instances hold on to it.
+
+PURPOSE:
+- Run jobs through submit() and run() on the shared backend
+- Apply the Aer parallelism options to the backend
+- Reconfigure the pool in place without breaking live instances
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from quantum_backend import QuantumBackendPool, get_backend_pool, configure_backend_pool, QISKIT_AVAILABLE
+from quantum_protocol import SuperdenseCodingProtocol, QuantumRandomGenerator
+
+if QISKIT_AVAILABLE:
+    from qiskit import QuantumCircuit
+
+def _bell_circuit():
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+def test_job_submission():
+    print("🧪 Submitting jobs to the backend pool")
+    print("=" * 50)
+    if not QISKIT_AVAILABLE:
+        print("   ⚠️ Qiskit not available - skipped")
+        return
+
+    pool = QuantumBackendPool(max_workers=2, max_parallel_threads=1)
+    futures = [pool.submit(_bell_circuit(), shots=256) for _ in range(4)]
+    for future in futures:
+        counts = future.result().get_counts()
+        assert sum(counts.values()) == 256 and set(counts) <= {'00', '11'}
+    assert sum(pool.run(_bell_circuit(), shots=100, memory=True).get_counts().values()) == 100
+    pool.shutdown()
+    print("   ✅ 5 jobs executed")
+
+def test_aer_options():
+    print("\n🧪 Applying Aer options")
+    if not QISKIT_AVAILABLE:
+        print("   ⚠️ Qiskit not available - skipped")
+        return
+
+    pool = QuantumBackendPool(max_workers=4, max_parallel_threads=3, max_parallel_shots=2)
+    options = pool.backend.options
+    assert options.max_parallel_threads == 3 and options.max_parallel_shots == 2
+    assert options.max_parallel_experiments == 1
+
+    # Reconfiguring updates the existing backend object
+    backend = pool.backend
+    pool.configure(max_workers=1, max_parallel_threads=2)
+    assert pool.backend is backend and backend.options.max_parallel_threads == 2
+    assert pool.max_workers == 1
+    pool.shutdown()
+    print("   ✅ Options applied at creation and on reconfiguration")
+
+def test_reconfigure_with_live_instances():
+    print("\n🧪 Reconfiguring while instances hold the pool")
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=False)
+    qrng = QuantumRandomGenerator()
+    shared_pool = get_backend_pool()
+    try:
+        assert configure_backend_pool(max_workers=1, max_parallel_threads=1) is shared_pool
+        assert protocol.backend_pool is shared_pool and qrng.backend_pool is shared_pool
+        if QISKIT_AVAILABLE:
+            # Would raise "cannot schedule new futures after shutdown" on a replaced pool
+            assert len(qrng.harvest_quantum_bits(16, 64)) == 128
+            assert sum(protocol.backend_pool.run(_bell_circuit(), shots=64).get_counts().values()) == 64
+            # The protocol must run on the simulator, not the classical fallback
+            def _no_fallback(*args):
+                raise AssertionError("protocol fell back to classical simulation")
+            protocol._simulate_protocol_results = _no_fallback
+            result = protocol.run_protocol(1, 0)
+            assert result['decoded_bits'] == [1, 0] and sum(result['measurement_counts'].values()) == 1024
+    finally:
+        configure_backend_pool()
+    print("   ✅ Live instances keep submitting after reconfiguration")
+
+if __name__ == "__main__":
+    test_job_submission()
+    test_aer_options()
+    test_reconfigure_with_live_instances()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Randomness Tests Test - Vectorized QRNG Quality Battery
+
+This test checks the SP 800-22 style tests against the worked examples of
+the NIST specification and runs the battery on QRNG output.
+
+PURPOSE:
+- Reproduce the published p-values of the NIST examples
+- Pass random data and fail obviously patterned data
+- Health-check a megabit of QRNG output
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from randomness_tests import (monobit_test, runs_test, block_frequency_test, serial_test,
+                              approximate_entropy_test, run_randomness_tests, symbol_entropy,
+                              shannon_entropy, min_entropy)
+from quantum_protocol import QuantumRandomGenerator
+
+def test_nist_examples():
+    print("🧪 Checking NIST SP 800-22 worked examples")
+    print("=" * 50)
+
+    assert np.isclose(monobit_test([1, 0, 1, 1, 0, 1, 0, 1, 0, 1]), 0.527089, atol=1e-6)
+    assert np.isclose(runs_test([1, 0, 0, 1, 1, 0, 1, 0, 1, 1]), 0.147232, atol=1e-6)
+    assert np.isclose(block_frequency_test([0, 1, 1, 0, 0, 1, 1, 0, 1, 0], block_size=3),
+                      0.801252, atol=1e-6)
+    p_value_1, p_value_2 = serial_test([0, 0, 1, 1, 0, 1, 1, 1, 0, 1], m=3)
+    assert np.isclose(p_value_1, 0.808792, atol=1e-6) and np.isclose(p_value_2, 0.670320, atol=1e-6)
+    assert np.isclose(approximate_entropy_test([0, 1, 0, 0, 1, 1, 0, 1, 0, 1], m=3), 0.261961, atol=1e-6)
+
+    assert symbol_entropy([0, 1, 0, 1]) == 1.0 and symbol_entropy([]) == 0.0
+    print("   ✅ p-values match the specification")
+
+def test_battery_on_buffers():
+    print("\n🧪 Running the battery on packed buffers")
+
+    random_data = os.urandom(1 << 17)      # 1 Mbit
+    start_time = time.time()
+    report = run_randomness_tests(random_data)
+    elapsed = time.time() - start_time
+
+    assert report['num_bits'] == 1 << 20
+    assert report['shannon_entropy'] > 7.99 and report['min_entropy'] > 7.5
+    patterned = run_randomness_tests(b'\x0f\xf0' * 4096)
+    assert not patterned['passed'] and not patterned['tests']['serial']['passed']
+    assert shannon_entropy(b'\x00' * 100) == 0.0 and min_entropy(b'\x00\xff') == 1.0
+
+    print(f"   ✅ 1 Mbit checked in {elapsed * 1000:.1f} ms; patterned data rejected")
+
+def test_qrng_health_check():
+    print("\n🧪 Health-checking QRNG output")
+
+    report = QuantumRandomGenerator().assess_randomness(1 << 15)
+    failed = [name for name, test in report['tests'].items() if not test['passed']]
+    # Each test has a 1% false-alarm rate on perfect randomness
+    assert len(failed) <= 1
+
+    # Short sequences default to a shorter pattern length; an explicit m is kept
+    short = os.urandom(64)
+    assert approximate_entropy_test(short) == approximate_entropy_test(short, m=3)
+    assert approximate_entropy_test(b'\x0f\xf0' * 4096) < 0.01
+
+    print(f"   ✅ {report['num_bits']} QRNG bits, Shannon {report['shannon_entropy']:.3f} bits/byte")
+
+if __name__ == "__main__":
+    test_nist_examples()
+    test_battery_on_buffers()
+    test_qrng_health_check()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Running Statistics Test - Constant-Time Entropy Summaries
+
+This test checks the Welford accumulators against NumPy and the bounded
+reservoir behind the protocol's entropy statistics.
+
+PURPOSE:
+- Match NumPy mean, variance, min and max over a long stream
+- Keep the record sample bounded however long the history grows
+- Report protocol entropy statistics from the running accumulators
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from running_stats import RunningStats, MetricHistory
+from quantum_protocol import SuperdenseCodingProtocol
+
+def test_running_stats():
+    print("🧪 Comparing running statistics with NumPy")
+    print("=" * 50)
+
+    values = np.random.default_rng(7).normal(7.9, 0.05, 100000)
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+
+    assert stats.count == len(values)
+    assert np.isclose(stats.mean, values.mean()) and np.isclose(stats.variance, values.var(ddof=1))
+    assert stats.min == values.min() and stats.max == values.max()
+    assert RunningStats().variance == 0.0 and RunningStats().min is None
+    print(f"   ✅ mean {stats.mean:.4f}, std {stats.std:.4f} over {stats.count} values")
+
+def test_bounded_reservoir():
+    print("\n🧪 Bounding the record sample")
+
+    history = MetricHistory(('value',), reservoir_size=100, rng=random.Random(1))
+    assert not history
+    for index in range(10000):
+        history.append({'value': index})
+
+    assert history and history.total_records == 10000 and len(history) == 100
+    sampled = [record['value'] for record in history]
+    # A uniform sample of 0..9999 reaches well past the first records
+    assert len(set(sampled)) == 100 and max(sampled) > 5000
+    assert history.stats['value'].mean == 4999.5
+
+    unsampled = MetricHistory(('value',), reservoir_size=0)
+    unsampled.append({'value': 1.0})
+    assert len(unsampled) == 0 and unsampled.stats['value'].count == 1
+    history.clear()
+    assert not history and len(history) == 0
+    print("   ✅ 10000 records summarized, 100 kept")
+
+def test_protocol_entropy_stats():
+    print("\n🧪 Protocol entropy statistics")
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=True)
+    assert protocol.get_quantum_entropy_stats() is None
+    for bit0, bit1 in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        protocol.run_protocol_with_quantum_crypto(bit0, bit1)
+
+    stats = protocol.get_quantum_entropy_stats()
+    key_entropies = [entry['key_entropy'] for entry in protocol.entropy_analysis]
+    assert stats['total_sessions'] == 4
+    assert np.isclose(stats['avg_key_entropy'], np.mean(key_entropies))
+    assert stats['min_key_entropy'] == min(key_entropies) and stats['max_key_entropy'] == max(key_entropies)
+    print(f"   ✅ {stats['total_sessions']} sessions, quality {stats['quantum_quality']}")
+
+if __name__ == "__main__":
+    test_running_stats()
+    test_bounded_reservoir()
+    test_protocol_entropy_stats()
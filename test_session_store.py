@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Session Store Test - Bounded Session Key Storage
+
+This test checks TTL expiry, LRU eviction, per-user lookup and key reuse
+of the session key store used by the protocol and crypto engine.
+
+PURPOSE:
+- Expire keys after their time-to-live
+- Evict least recently used sessions under entry and memory caps
+- Reuse a live session key instead of generating a new one
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from session_store import SessionKeyStore
+from quantum_protocol import SuperdenseCodingProtocol
+
+def test_ttl_and_lru_eviction():
+    print("🧪 Testing session key expiry and eviction")
+    print("=" * 50)
+
+    now = [0.0]
+    store = SessionKeyStore(max_entries=3, ttl=10.0, clock=lambda: now[0])
+    for index in range(3):
+        store.put(f"session-{index}", bytes([index]) * 16, user_id="alice" if index < 2 else "bob")
+
+    # Touch session-0 so session-1 becomes least recently used
+    assert store.get_key("session-0") == bytes(16)
+    store.put("session-3", b'\x03' * 16, user_id="bob")
+    assert "session-1" not in store and "session-0" in store
+    assert store.stats['evictions'] == 1
+    assert [entry['session_id'] for entry in store.sessions_for_user("alice")] == ["session-0"]
+    assert len(store.sessions_for_user("bob")) == 2
+
+    # Every key expires after the TTL
+    now[0] = 10.0
+    assert store.get_key("session-0") is None
+    assert store.purge_expired() == 2
+    assert len(store) == 0 and store.memory_bytes == 0
+
+    # Memory cap evicts even below the entry cap
+    small = SessionKeyStore(max_entries=100, max_bytes=3 * (SessionKeyStore.ENTRY_OVERHEAD + 64))
+    for index in range(10):
+        small.put(index, os.urandom(32))
+    assert len(small) < 10 and small.memory_bytes <= small.max_bytes
+
+    print(f"   ✅ TTL, LRU and memory cap enforced; stats {store.stats}")
+
+def test_session_key_reuse():
+    print("\n🧪 Testing session key reuse")
+
+    protocol = SuperdenseCodingProtocol(enable_quantum_crypto=True)
+    first = protocol.generate_quantum_session_key("session-a", user_id="alice")
+    assert protocol.generate_quantum_session_key("session-a") == first
+    assert protocol.generate_quantum_session_key("session-b", user_id="alice") != first
+    assert len(protocol.quantum_session_keys.sessions_for_user("alice")) == 2
+
+    print("   ✅ Live session keys are reused")
+
+if __name__ == "__main__":
+    test_ttl_and_lru_eviction()
+    test_session_key_reuse()
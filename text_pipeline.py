@@ -0,0 +1,213 @@
+"""
+Text Pipeline Module - Full-Text Transmission over Superdense Coding
+
+utils.text_to_bits reduces a whole text to a single 2-bit message for the
+dashboard. This module instead transmits the complete text: UTF-8 bytes are
+split into 2-bit symbols (four per byte), sent through the protocol in
+batches, and the decoded symbols are reassembled into text.
+
+Key Features:
+- Vectorized NumPy packing and unpacking of 2-bit symbols
+- Streaming transmission of text chunks in fixed-size symbol batches
+- Incremental UTF-8 reassembly across batch boundaries
+- Symbol error rate, bit error rate and end-to-end throughput in bits/s
+
+SYMBOL LAYOUT:
+- Each byte holds four symbols, most significant pair first:
+  bits 7-6, 5-4, 3-2, 1-0
+- A symbol value s is the message (bit0, bit1) with s = 2*bit0 + bit1
+"""
+
+import codecs               # Incremental UTF-8 decoding across batches
+import time                 # End-to-end timing
+import numpy as np          # Vectorized symbol packing
+
+from bit_buffer import as_byte_array   # Zero-copy byte views
+from quantum_protocol import SuperdenseCodingProtocol
+
+# Bit offsets of the four 2-bit symbols inside a byte, most significant first
+SYMBOL_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+def unpack_symbols(packed):
+    """
+    Split packed bytes into 2-bit symbols
+
+    Args:
+        packed: bytes-like object or uint8 array (four symbols per byte)
+
+    Returns:
+        np.ndarray: uint8 array of symbols in 0..3, four per input byte
+    """
+    packed = as_byte_array(packed)
+    return ((packed[:, None] >> SYMBOL_SHIFTS) & 3).astype(np.uint8).reshape(-1)
+
+
+def pack_symbols(symbols):
+    """
+    Pack 2-bit symbols back into bytes
+
+    Args:
+        symbols: Array of symbols in 0..3 (length a multiple of 4)
+
+    Returns:
+        np.ndarray: uint8 array with four symbols per byte
+    """
+    symbols = np.asarray(symbols, dtype=np.uint8).reshape(-1, 4)
+    return np.bitwise_or.reduce(symbols << SYMBOL_SHIFTS, axis=1).astype(np.uint8)
+
+
+def text_to_symbols(text):
+    """
+    Encode text as 2-bit symbols
+
+    Args:
+        text (str): Arbitrary Unicode text
+
+    Returns:
+        np.ndarray: uint8 symbol array (four symbols per UTF-8 byte)
+    """
+    return unpack_symbols(text.encode('utf-8'))
+
+
+def symbols_to_text(symbols, errors='replace'):
+    """
+    Decode 2-bit symbols back into text
+
+    Args:
+        symbols: Symbol array (length a multiple of 4)
+        errors: UTF-8 error handling for corrupted bytes
+
+    Returns:
+        str: Decoded text
+    """
+    return pack_symbols(symbols).tobytes().decode('utf-8', errors=errors)
+
+
+def symbols_to_pairs(symbols):
+    """Convert symbols to an (N, 2) array of (bit0, bit1) protocol messages"""
+    symbols = np.asarray(symbols, dtype=np.uint8)
+    return np.stack([symbols >> 1, symbols & 1], axis=1).astype(np.int8)
+
+
+def pairs_to_symbols(pairs):
+    """Convert an (N, 2) array of (bit0, bit1) messages to symbols"""
+    pairs = np.asarray(pairs, dtype=np.uint8).reshape(-1, 2)
+    return (2 * pairs[:, 0] + pairs[:, 1]).astype(np.uint8)
+
+
+class TextTransmissionPipeline:
+    """
+    Streaming full-text transmission through the superdense coding protocol
+
+    Text is converted to symbols chunk by chunk and sent in batches of
+    batch_size symbols with SuperdenseCodingProtocol.run_protocol_batch.
+    Batch sizes are multiples of four symbols so every batch carries whole
+    bytes, and decoded bytes are fed to an incremental UTF-8 decoder.
+
+    Attributes:
+        protocol: Protocol used for transmission
+        batch_size: Symbols per protocol batch
+        noise_level: Channel noise level
+        shots: Measurements per symbol
+        engine: Protocol execution engine
+    """
+
+    def __init__(self, protocol=None, batch_size=4096, noise_level=0.0, shots=1024, engine='aer'):
+        """
+        Initialize the pipeline
+
+        Args:
+            protocol: Optional protocol instance (crypto disabled by default)
+            batch_size: Symbols per protocol batch (rounded down to a multiple of 4)
+            noise_level: Channel noise level (0.0 to 1.0)
+            shots: Measurements per symbol
+            engine: Protocol execution engine, one of PROTOCOL_ENGINES
+        """
+        self.protocol = protocol or SuperdenseCodingProtocol(enable_quantum_crypto=False)
+        self.batch_size = max(4, batch_size - batch_size % 4)
+        self.noise_level = noise_level
+        self.shots = shots
+        self.engine = engine
+
+    def transmit_stream(self, text_chunks):
+        """
+        Transmit an iterable of text chunks, yielding results per batch
+
+        Args:
+            text_chunks: Iterable of strings
+
+        Yields:
+            dict: 'decoded_text' fragment, 'num_symbols', 'symbol_errors' and
+            'bit_errors' for each transmitted batch
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = np.zeros(0, dtype=np.uint8)
+
+        for chunk in text_chunks:
+            pending = np.concatenate([pending, text_to_symbols(chunk)])
+            while len(pending) >= self.batch_size:
+                batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+                yield self._transmit_batch(batch, decoder, final=False)
+
+        if len(pending) > 0:
+            yield self._transmit_batch(pending, decoder, final=True)
+
+    def transmit(self, text, chunk_size=65536):
+        """
+        Transmit a complete text and reassemble the decoded message
+
+        Args:
+            text (str): Text to transmit
+            chunk_size: Characters read per streaming chunk
+
+        Returns:
+            dict: Decoded text, symbol/bit error rates and throughput
+        """
+        start_time = time.time()
+        chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+
+        decoded_fragments = []
+        num_symbols = 0
+        symbol_errors = 0
+        bit_errors = 0
+        num_batches = 0
+
+        for batch_result in self.transmit_stream(chunks):
+            decoded_fragments.append(batch_result['decoded_text'])
+            num_symbols += batch_result['num_symbols']
+            symbol_errors += batch_result['symbol_errors']
+            bit_errors += batch_result['bit_errors']
+            num_batches += 1
+
+        execution_time = time.time() - start_time
+        num_bits = 2 * num_symbols
+
+        return {
+            'original_text': text,
+            'decoded_text': ''.join(decoded_fragments),
+            'num_symbols': num_symbols,
+            'num_bits': num_bits,
+            'num_batches': num_batches,
+            'symbol_errors': symbol_errors,
+            'symbol_error_rate': symbol_errors / num_symbols if num_symbols else 0.0,
+            'bit_error_rate': bit_errors / num_bits if num_bits else 0.0,
+            'execution_time': execution_time,
+            'throughput_bps': num_bits / execution_time if execution_time > 0 else 0.0,
+            'noise_level': self.noise_level,
+            'engine': self.engine
+        }
+
+    def _transmit_batch(self, symbols, decoder, final):
+        """Send one batch of symbols and decode the received bytes"""
+        result = self.protocol.run_protocol_batch(symbols_to_pairs(symbols), self.noise_level,
+                                                  self.shots, engine=self.engine)
+        received = pairs_to_symbols(result['decoded_bits'])
+        flipped_bits = symbols ^ received
+
+        return {
+            'decoded_text': decoder.decode(pack_symbols(received).tobytes(), final=final),
+            'num_symbols': len(symbols),
+            'symbol_errors': int(np.count_nonzero(flipped_bits)),
+            'bit_errors': int(np.count_nonzero(flipped_bits & 1) + np.count_nonzero(flipped_bits & 2))
+        }